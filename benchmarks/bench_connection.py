@@ -0,0 +1,105 @@
+"""
+Benchmark da conexão HTTP com o servidor Appium (RemoteConnection).
+
+Compara, contra o servidor Appium simulado, a conexão sem keep-alive, a conexão
+padrão do Appium-Python-Client e a TunedAppiumConnection (com e sem gzip):
+- sequencial: buscas de elemento uma após a outra (como em um teste);
+- concorrente: várias threads usando a mesma sessão (teste + heartbeat/pré-aquecimento);
+- page source: dumps grandes da hierarquia.
+
+Uso:
+    python -m benchmarks.bench_connection [--commands 300] [--threads 3]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from appium import webdriver
+from appium.options.android import UiAutomator2Options
+from appium.webdriver.appium_connection import AppiumConnection
+from appium.webdriver.client_config import AppiumClientConfig
+
+from benchmarks.stub_appium_server import StubAppiumServer
+from utils.appium_connection import TunedAppiumConnection
+from utils.heartbeat import percentile
+
+# Hierarquia grande (~400 registros), semelhante à lista de registros após a carga de dados
+LARGE_PAGE_SOURCE = (
+    "<?xml version='1.0' encoding='UTF-8' standalone='yes' ?><hierarchy rotation=\"0\">"
+    + "".join(
+        f'<android.widget.TextView index="{index}" text="Registro {index:04d}" '
+        f'resource-id="com.blogspot.e_kanivets.moneytracker:id/tvTitle" class="android.widget.TextView" '
+        f'package="com.blogspot.e_kanivets.moneytracker" bounds="[0,{index}][1080,{index + 120}]"/>'
+        for index in range(400)
+    )
+    + "</hierarchy>"
+)
+
+CONNECTIONS = {
+    "sem keep-alive": lambda url: AppiumConnection(
+        client_config=AppiumClientConfig(remote_server_addr=url, keep_alive=False)),
+    "padrão": lambda url: url,
+    "ajustada": lambda url: TunedAppiumConnection(url),
+    "ajustada + gzip": lambda url: TunedAppiumConnection(url, compress=True),
+}
+
+
+def timed(action, count):
+    """Executa a ação `count` vezes e retorna as latências (segundos)."""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run_scenarios(server, connection_factory, commands, threads):
+    """
+    :return: Dicionário cenário -> (latências, duração total, conexões TCP abertas)
+    """
+    options = UiAutomator2Options().load_capabilities({"platformName": "Android"})
+    driver = webdriver.Remote(connection_factory(server.url), options=options)
+    results = {}
+    try:
+        def find():
+            driver.find_element("id", "com.blogspot.e_kanivets.moneytracker:id/btnAddAccount")
+
+        scenarios = {
+            "sequencial": lambda: timed(find, commands),
+            "concorrente": lambda: [sample for samples in ThreadPoolExecutor(threads).map(
+                lambda _: timed(find, commands // threads), range(threads)) for sample in samples],
+            "page source": lambda: timed(lambda: driver.page_source, max(1, commands // 10)),
+        }
+        for name, scenario in scenarios.items():
+            server._httpd.page_source = LARGE_PAGE_SOURCE if name == "page source" else ""
+            connections = server.connections
+            start = time.perf_counter()
+            samples = scenario()
+            results[name] = (samples, time.perf_counter() - start, server.connections - connections)
+    finally:
+        driver.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", type=int, default=300, help="Comandos por cenário")
+    parser.add_argument("--threads", type=int, default=3, help="Threads do cenário concorrente")
+    parser.add_argument("--latency", type=float, default=0.001,
+                        help="Latência simulada do servidor por comando (segundos)")
+    args = parser.parse_args()
+
+    print(f"{'conexão':<16} {'cenário':<12} {'p50':>8} {'p95':>8} {'cmd/s':>8} {'conexões':>9}")
+    with StubAppiumServer(strategy_latency={"id": args.latency}, command_latency=args.latency,
+                          compress=True) as server:
+        for label, factory in CONNECTIONS.items():
+            for scenario, (samples, total, connections) in run_scenarios(
+                    server, factory, args.commands, args.threads).items():
+                print(f"{label:<16} {scenario:<12} {percentile(samples, 0.5) * 1000:>6.2f}ms "
+                      f"{percentile(samples, 0.95) * 1000:>6.2f}ms {len(samples) / total:>8.0f} "
+                      f"{connections:>9}")
+
+
+if __name__ == "__main__":
+    main()
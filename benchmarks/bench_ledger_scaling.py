@@ -0,0 +1,269 @@
+"""
+Benchmark de escala do aplicativo com o tamanho do extrato (quantidade de registros).
+
+Para cada tamanho (padrão 0, 100, 1000 e 10000 registros) o banco do app é populado com a
+LedgerFactory (data/data.py) e são medidos, a partir de uma nova abertura do app:
+- save: de AddIncomeExpensePage.save() até o novo registro aparecer na lista, com o filtro
+  'All time' já aplicado (os registros da carga ficam fora do período padrão);
+- all_time: de HomePage.select_all_time_filter() até a lista com o novo registro estabilizar.
+
+Os tamanhos são populados em ordem crescente, de forma incremental; os registros criados pelo
+próprio benchmark (repeats por tamanho) ficam no extrato. O resultado é gravado em JSON com as
+amostras, a mediana por tamanho e a curva de crescimento ajustada (ver fit_growth).
+Requer dispositivo com o servidor Appium e APK depurável (escrita no banco via run-as).
+
+Uso:
+    python -m benchmarks.bench_ledger_scaling --udid emulator-5554 [--sizes 0,100,1000,10000]
+        [--repeats 3] [--output reports/ledger_scaling.json]
+"""
+import argparse
+import json
+import math
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import TimeoutException
+
+from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.home_page import HomePage
+from utils.page_snapshot import PageSnapshot
+
+PACKAGE = "com.blogspot.e_kanivets.moneytracker"
+SIZES = (0, 100, 1000, 10000)
+METRICS = ("save", "all_time")
+
+# Curvas candidatas: t(n) = intercept + slope * f(n)
+GROWTH_MODELS = {
+    "constant": lambda n: 0.0,
+    "log": lambda n: math.log(n + 1),
+    "linear": lambda n: float(n),
+    "nlogn": lambda n: n * math.log(n + 1),
+    "quadratic": lambda n: float(n) ** 2,
+}
+
+
+def fit_growth(points):
+    """
+    Ajusta, por mínimos quadrados, cada curva de GROWTH_MODELS aos pontos e escolhe
+    a de menor erro (em caso de empate, a mais simples).
+
+    :param points: Dicionário tamanho -> segundos
+    :return: Dicionário com model, intercept, slope, r2 e o r2 de cada candidata
+    """
+    sizes = sorted(points)
+    ys = [points[size] for size in sizes]
+    mean_y = sum(ys) / len(ys)
+    total = sum((y - mean_y) ** 2 for y in ys)
+
+    fits = {}
+    for name, transform in GROWTH_MODELS.items():
+        xs = [transform(size) for size in sizes]
+        mean_x = sum(xs) / len(xs)
+        spread = sum((x - mean_x) ** 2 for x in xs)
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread if spread else 0.0
+        intercept = mean_y - slope * mean_x
+        error = sum((y - intercept - slope * x) ** 2 for x, y in zip(xs, ys))
+        fits[name] = (error, intercept, slope, 1.0 - error / total if total else 1.0)
+
+    best = min(fits, key=lambda name: (round(fits[name][0], 12), list(GROWTH_MODELS).index(name)))
+    error, intercept, slope, r2 = fits[best]
+    return {
+        "model": best,
+        "intercept": intercept,
+        "slope": slope,
+        "r2": r2,
+        "candidates": {name: fit[3] for name, fit in fits.items()},
+    }
+
+
+class LedgerScalingBenchmark:
+    """
+    Mede a latência de inclusão e de exibição de registros para cada tamanho de extrato.
+    O driver, a função de carga e o relógio são injetáveis, de modo que o roteiro
+    pode ser verificado com um driver falso.
+    """
+
+    _title_xpath = "//*[@resource-id='com.blogspot.e_kanivets.moneytracker:id/tvTitle' and @text='{}']"
+
+    def __init__(self, driver, seed, account, sizes=SIZES, repeats=3, timeout=60.0, poll_interval=0.05,
+                 clock=time.perf_counter, sleep=time.sleep):
+        """
+        :param seed: Função que recebe o tamanho e popula o extrato até ele (chamada em ordem crescente)
+        :param account: Conta vinculada aos registros criados pelo benchmark
+        :param timeout: Espera máxima pela exibição do registro (segundos)
+        :param poll_interval: Intervalo entre capturas da hierarquia (segundos)
+        """
+        self.driver = driver
+        self.seed = seed
+        self.account = account
+        self.sizes = sorted(sizes)
+        self.repeats = repeats
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._sleep = sleep
+        self.home = HomePage(driver)
+        self.form = AddIncomeExpensePage(driver)
+
+    def run(self):
+        """
+        Executa todas as medições.
+
+        :return: Relatório serializável em JSON (ver report)
+        """
+        samples = {metric: {size: [] for size in self.sizes} for metric in METRICS}
+        for size in self.sizes:
+            self.seed(size)
+            for repeat in range(self.repeats):
+                save, all_time = self.measure(f"Bench {size} {repeat}")
+                samples["save"][size].append(save)
+                samples["all_time"][size].append(all_time)
+                print(f"{size:>6} registros  save {save * 1000:8.1f}ms  all_time {all_time * 1000:8.1f}ms")
+        return self.report(samples)
+
+    def measure(self, title):
+        """
+        Inclui um registro e mede os dois tempos até ele ficar visível.
+
+        :return: Tupla (save, all_time) em segundos
+        """
+        self._relaunch()
+        # Os registros da carga são antigos e ficam fora do período padrão da lista; sem
+        # 'All time', o save seria medido sobre um extrato vazio para qualquer tamanho
+        self._time_to_visible(self.home.select_all_time_filter, None, stable=True)
+        self.form.click_add_income()
+        self.form.fill_record(price="1", title=title, category="Benchmark", account_name=self.account)
+        save = self._time_to_visible(self.form.save, title)
+
+        self._relaunch()
+        all_time = self._time_to_visible(self.home.select_all_time_filter, title, stable=True)
+        return save, all_time
+
+    def _relaunch(self):
+        self.driver.terminate_app(PACKAGE)
+        self.driver.activate_app(PACKAGE)
+        self.home.element_cache.clear()
+        self.home.invalidate_snapshot()
+
+    def _time_to_visible(self, action, title, stable=False):
+        """
+        Executa a ação e captura a hierarquia até o registro aparecer.
+
+        :param title: Título do registro aguardado (None: apenas a estabilidade da tela)
+        :param stable: Exige também que a tela pare de mudar; o tempo medido é o da
+                       primeira captura já igual à tela final
+        :return: Segundos entre o início da ação e a exibição do registro
+        """
+        xpath = self._title_xpath.format(title)
+        start = self._clock()
+        action()
+        previous, changed_at = None, None
+        while True:
+            source = self.driver.page_source
+            now = self._clock()
+            visible = title is None or PageSnapshot(source).is_present(AppiumBy.XPATH, xpath)
+            if not stable and visible:
+                return now - start
+            if source == previous and visible:
+                return changed_at - start
+            if source != previous:
+                previous, changed_at = source, now
+            if now - start > self.timeout:
+                raise TimeoutException(f"Registro '{title}' não apareceu em {self.timeout}s.")
+            self._sleep(self.poll_interval)
+
+    def report(self, samples):
+        """
+        :param samples: Dicionário métrica -> tamanho -> lista de segundos
+        :return: Dicionário com amostras, medianas e curva ajustada por métrica
+        """
+        metrics = {}
+        for metric, by_size in samples.items():
+            medians = {size: statistics.median(values) for size, values in by_size.items() if values}
+            metrics[metric] = {
+                "samples": {str(size): values for size, values in by_size.items()},
+                "median": {str(size): value for size, value in medians.items()},
+                "fit": fit_growth(medians) if len(medians) > 1 else None,
+            }
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "sizes": self.sizes,
+            "repeats": self.repeats,
+            "metrics": metrics,
+        }
+
+
+def write_report(report, path):
+    """Grava o relatório JSON, criando o diretório se necessário."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def incremental_seeder(seeder, driver, ledger):
+    """
+    Função de carga para o benchmark: cria a conta da LedgerFactory na primeira chamada
+    e, a cada tamanho, acrescenta apenas os registros que faltam.
+    """
+    account = next(ledger.accounts())
+    records = ledger.records()
+    seeded = None
+
+    def seed(size):
+        nonlocal seeded
+        with seeder.seeding(driver) as db:
+            if seeded is None:
+                db.add_account(*account)
+                seeded = 0
+            for record in islice(records, size - seeded):
+                db.add_record(**record._asdict())
+        seeded = max(seeded, size)
+
+    return account.title, seed
+
+
+def main():
+    from conftest import reset_app_data, start_driver
+    from data.data import LedgerFactory
+    from utils.db_seeder import DatabaseSeeder
+    from utils.devices import Device
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--udid", default="emulator-5554", help="Dispositivo alvo")
+    parser.add_argument("--appium-port", type=int, default=4723, help="Porta do servidor Appium")
+    parser.add_argument("--system-port", type=int, default=8200, help="systemPort do UiAutomator2")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Tamanhos do extrato")
+    parser.add_argument("--repeats", type=int, default=3, help="Medições por tamanho")
+    parser.add_argument("--seed", type=int, default=0, help="Semente da LedgerFactory")
+    parser.add_argument("--output", default="reports/ledger_scaling.json", help="Relatório JSON")
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(",") if size.strip())
+    device = Device(args.udid, args.appium_port, args.system_port)
+    reset_app_data(device)
+    driver = start_driver(device)
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            ledger = LedgerFactory(seed=args.seed, accounts=1, records=max(sizes), boundary_ratio=0)
+            account, seed = incremental_seeder(DatabaseSeeder(device, PACKAGE, workdir), driver, ledger)
+            report = LedgerScalingBenchmark(driver, seed, account, sizes, args.repeats).run()
+    finally:
+        driver.quit()
+
+    path = write_report(report, args.output)
+    for metric, data in report["metrics"].items():
+        fit = data["fit"]
+        if fit:
+            print(f"{metric}: {fit['model']} (t = {fit['intercept']:.3f}s + {fit['slope']:.3g}·f(n), "
+                  f"r² = {fit['r2']:.3f})")
+    print(f"Relatório gravado em {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark do compilador de localizadores (XPath -> UiSelector/ID).
+
+Executa as buscas dos Page Objects contra o servidor Appium simulado,
+comparando o XPath original com o localizador compilado.
+
+Uso:
+    python -m benchmarks.bench_locator_compiler [--rounds 20]
+"""
+import argparse
+import time
+
+from appium import webdriver
+from appium.options.android import UiAutomator2Options
+from appium.webdriver.common.appiumby import AppiumBy
+
+from benchmarks.stub_appium_server import StubAppiumServer
+from pages.accounts_page import AccountsPage
+from pages.add_account_page import AddAccountPage
+from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.home_page import HomePage
+from pages.records_page import RecordsPage
+from utils.locator_compiler import compile_locator
+
+PAGE_CLASSES = (AccountsPage, AddAccountPage, AddIncomeExpensePage, HomePage, RecordsPage)
+
+# Localizadores dinâmicos montados pelos Page Objects em tempo de execução
+DYNAMIC_LOCATORS = (
+    (AppiumBy.XPATH, "//android.widget.TextView[@text='Salário']"),
+    (AppiumBy.XPATH, RecordsPage._record_price_xpath.format("1000")),
+    (AppiumBy.XPATH, "//android.widget.TextView[@resource-id="
+                     "'com.blogspot.e_kanivets.moneytracker:id/textinput_error' and contains(@text, 'Field')]"),
+)
+
+
+def collect_locators():
+    """Reúne os localizadores declarados nos Page Objects e os dinâmicos mais usados."""
+    locators = []
+    for page_class in PAGE_CLASSES:
+        for value in vars(page_class).values():
+            if isinstance(value, tuple) and len(value) == 2 and value not in locators:
+                locators.append(value)
+    locators.extend(DYNAMIC_LOCATORS)
+    return locators
+
+
+def time_lookups(driver, by, locator, rounds):
+    """Tempo médio (ms) de find_element para o localizador informado."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        driver.find_element(by, locator)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def time_compilation(locators, rounds=10000):
+    """Custo médio (µs) de compile_locator com o cache aquecido."""
+    for by, locator in locators:
+        compile_locator(by, locator)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for by, locator in locators:
+            compile_locator(by, locator)
+    return (time.perf_counter() - start) / (rounds * len(locators)) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20, help="Buscas por localizador em cada modo")
+    args = parser.parse_args()
+
+    locators = collect_locators()
+    with StubAppiumServer() as server:
+        options = UiAutomator2Options().load_capabilities({"platformName": "Android"})
+        driver = webdriver.Remote(server.url, options=options)
+        try:
+            print(f"{'original':>9} {'compilado':>10}  estratégia           localizador")
+            total_raw = total_compiled = 0.0
+            for by, locator in locators:
+                compiled_by, compiled_locator = compile_locator(by, locator)
+                raw = time_lookups(driver, by, locator, args.rounds)
+                compiled = time_lookups(driver, compiled_by, compiled_locator, args.rounds)
+                total_raw += raw
+                total_compiled += compiled
+                print(f"{raw:>7.2f}ms {compiled:>8.2f}ms  {compiled_by:<20} {locator}")
+            print(f"{total_raw:>7.2f}ms {total_compiled:>8.2f}ms  TOTAL ({len(locators)} localizadores)")
+        finally:
+            driver.quit()
+
+    print(f"Custo do compile_locator com cache: {time_compilation(locators):.2f}µs por chamada")
+    print(compile_locator.cache_info())
+
+
+if __name__ == "__main__":
+    main()
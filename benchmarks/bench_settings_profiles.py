@@ -0,0 +1,68 @@
+"""
+Benchmark dos perfis de settings do UiAutomator2 declarados pelos Page Objects.
+
+Executa as buscas de cada página contra o servidor Appium simulado, primeiro com os
+settings padrão e depois com o perfil da página, e mede a latência das buscas.
+O efeito dos settings segue o modelo simplificado do servidor simulado
+(ver benchmarks.stub_appium_server); no dispositivo, rode os testes e compare
+o trace de comandos (reports/command_traces).
+
+Uso:
+    python -m benchmarks.bench_settings_profiles [--rounds 20] [--idle-latency 0.3]
+"""
+import argparse
+
+from appium import webdriver
+from appium.options.android import UiAutomator2Options
+
+from benchmarks.bench_connection import timed
+from benchmarks.stub_appium_server import StubAppiumServer
+from pages.accounts_page import AccountsPage
+from pages.base_page import BasePage
+from pages.records_page import RecordsPage
+from utils.heartbeat import percentile
+from utils.locator_compiler import compile_locator
+
+PROFILED_PAGES = (AccountsPage, RecordsPage)
+
+
+def page_locators(page_class):
+    """Localizadores declarados na própria página, já compilados."""
+    return [compile_locator(*value) for value in vars(page_class).values()
+            if isinstance(value, tuple) and len(value) == 2]
+
+
+def measure(driver, page, locators, rounds):
+    """Aplica o perfil da página e retorna as latências das buscas (segundos)."""
+    page.apply_settings_profile()
+    samples = []
+    for by, locator in locators:
+        samples.extend(timed(lambda: driver.find_elements(by, locator), rounds))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20, help="Buscas por localizador em cada perfil")
+    parser.add_argument("--idle-latency", type=float, default=0.3,
+                        help="Tempo simulado até o app ficar ocioso a cada busca (segundos)")
+    args = parser.parse_args()
+
+    print(f"{'página':<14} {'perfil':<8} {'p50':>9} {'p95':>9}  settings")
+    with StubAppiumServer(idle_latency=args.idle_latency) as server:
+        options = UiAutomator2Options().load_capabilities({"platformName": "Android"})
+        driver = webdriver.Remote(server.url, options=options)
+        try:
+            for page_class in PROFILED_PAGES:
+                locators = page_locators(page_class)
+                for label, page in (("padrão", BasePage(driver)), ("página", page_class(driver))):
+                    samples = measure(driver, page, locators, args.rounds)
+                    print(f"{page_class.__name__:<14} {label:<8} {percentile(samples, 0.5) * 1000:>7.1f}ms "
+                          f"{percentile(samples, 0.95) * 1000:>7.1f}ms  {page.settings_profile or '-'}")
+            print(f"settings enviados ao servidor: {server.commands['POST /session/:id/appium/settings']}")
+        finally:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
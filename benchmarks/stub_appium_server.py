@@ -0,0 +1,183 @@
+"""
+Servidor Appium simulado para benchmarks locais.
+
+Implementa o subconjunto do protocolo W3C WebDriver usado pelos benchmarks
+(criação de sessão, busca de elementos, page source e comandos genéricos),
+com latência configurável por estratégia de localização e compressão gzip opcional.
+
+Os settings do UiAutomator2 (driver.update_settings) afetam a latência das buscas
+segundo um modelo simplificado:
+- waitForIdleTimeout: cada busca espera min(waitForIdleTimeout, idle_latency) pela ociosidade do app;
+- ignoreUnimportantViews: a varredura da hierarquia custa `unimportant_views_factor` do tempo;
+- snapshotMaxDepth: a varredura é proporcional à profundidade percorrida (até hierarchy_depth).
+"""
+import gzip
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+SESSION_ID = "stub-session"
+
+# Latência simulada (segundos) da busca de elementos por estratégia no UiAutomator2
+DEFAULT_STRATEGY_LATENCY = {
+    "xpath": 0.030,
+    "-android uiautomator": 0.008,
+    "id": 0.004,
+    "accessibility id": 0.004,
+    "class name": 0.006,
+}
+
+# Padrões do UiAutomator2
+DEFAULT_SETTINGS = {"waitForIdleTimeout": 10000, "ignoreUnimportantViews": False, "snapshotMaxDepth": 70}
+
+DEFAULT_PAGE_SOURCE = (
+    "<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>"
+    "<hierarchy rotation=\"0\"><android.widget.FrameLayout/></hierarchy>"
+)
+
+
+def _lookup_latency(server, base):
+    settings = server.settings
+    idle = min(settings["waitForIdleTimeout"] / 1000, server.idle_latency)
+    scale = server.unimportant_views_factor if settings["ignoreUnimportantViews"] else 1.0
+    depth = min(settings["snapshotMaxDepth"], server.hierarchy_depth) / server.hierarchy_depth
+    return idle + base * scale * depth
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self, value, status=200):
+        body = json.dumps({"value": value}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if self.server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _handle(self, method):
+        server = self.server
+        payload = self._read_json() if method == "POST" else {}
+        path = self.path.rstrip("/")
+        command = re.sub(r"/session/[^/]+", "/session/:id", path)
+        command = re.sub(r"/element/[^/]+", "/element/:id", command)
+        with server.lock:
+            server.commands[f"{method} {command}"] += 1
+
+        if path == "/status":
+            return self._reply({"ready": True, "message": "stub"})
+        if method == "POST" and path == "/session":
+            time.sleep(server.session_latency)
+            return self._reply({"sessionId": SESSION_ID, "capabilities": {"platformName": "Android"}})
+        if method == "DELETE" and command == "/session/:id":
+            return self._reply(None)
+        if command == "/session/:id/appium/settings":
+            if method == "POST":
+                server.settings.update(payload.get("settings", {}))
+                return self._reply(None)
+            return self._reply(server.settings)
+        if command in ("/session/:id/element", "/session/:id/elements"):
+            strategy = payload.get("using", "")
+            time.sleep(_lookup_latency(server, server.strategy_latency.get(strategy, server.command_latency)))
+            with server.lock:
+                server.element_counter += 1
+                element = {ELEMENT_KEY: f"el-{server.element_counter}"}
+            return self._reply(element if command.endswith("/element") else [element])
+        if command == "/session/:id/source":
+            time.sleep(_lookup_latency(server, server.command_latency))
+            return self._reply(server.page_source)
+
+        time.sleep(server.command_latency)
+        return self._reply(None)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class StubAppiumServer:
+    """
+    Servidor HTTP local que simula o Appium/UiAutomator2.
+
+    Exemplo:
+        with StubAppiumServer() as server:
+            driver = webdriver.Remote(server.url, options=...)
+    """
+
+    def __init__(self, strategy_latency=None, command_latency=0.002, session_latency=0.0,
+                 page_source=DEFAULT_PAGE_SOURCE, compress=False, idle_latency=0.0,
+                 unimportant_views_factor=0.6, hierarchy_depth=70):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.strategy_latency = dict(strategy_latency or DEFAULT_STRATEGY_LATENCY)
+        self._httpd.command_latency = command_latency
+        self._httpd.session_latency = session_latency
+        self._httpd.page_source = page_source
+        self._httpd.compress = compress
+        self._httpd.settings = dict(DEFAULT_SETTINGS)
+        self._httpd.idle_latency = idle_latency
+        self._httpd.unimportant_views_factor = unimportant_views_factor
+        self._httpd.hierarchy_depth = hierarchy_depth
+        self._httpd.commands = Counter()
+        self._httpd.element_counter = 0
+        self._httpd.connections = 0
+        self._httpd.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        """URL base do servidor simulado."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def commands(self):
+        """Contador de comandos recebidos, no formato 'MÉTODO /rota'."""
+        return self._httpd.commands
+
+    @property
+    def connections(self):
+        """Quantidade de conexões TCP aceitas (mede o reaproveitamento via keep-alive)."""
+        return self._httpd.connections
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
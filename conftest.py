@@ -1,35 +1,116 @@
+import os
 import pytest
-import subprocess
 import time
+from functools import partial
 from appium import webdriver
 from appium.options.android import UiAutomator2Options
 from selenium.common.exceptions import WebDriverException
+from data.data import AccountData
+from pages.screen_graph import edge_costs
+from utils.adb_executor import AdbError, adb_executor
+from utils.app_state import CHECKPOINTS, AppStateStore
+from utils.appium_connection import TunedAppiumConnection
+from utils.command_trace import command_trace
+from utils.db_seeder import DatabaseSeeder
+from utils.devices import DeviceAllocator
+from utils.heartbeat import session_heartbeat
+from utils.prewarm import SessionPrewarmer
+from utils.reporting import run_report
+from utils.session_manager import session_manager
+from utils.session_pool import SessionPool
+from utils.startup_profiles import startup_profiles
+from utils.wait_engine import wait_engine
 
 # Nome do pacote do aplicativo sob teste
 PACKAGE = "com.blogspot.e_kanivets.moneytracker"
 
+# Permissões concedidas após limpar os dados do aplicativo
+APP_PERMISSIONS = ("android.permission.READ_EXTERNAL_STORAGE", "android.permission.WRITE_EXTERNAL_STORAGE")
 
-def start_driver():
+# Chave do cache do pytest onde ficam as latências observadas por localizador
+LOCATOR_BUDGETS_CACHE_KEY = "moneytracker/locator_budgets"
+SCREEN_COSTS_CACHE_KEY = "moneytracker/screen_edge_costs"
+
+# Plugins do projeto carregados junto com este conftest
+pytest_plugins = ["utils.command_trace_plugin"]
+
+# Novas tentativas do BasePage.find entram no trace de comandos
+wait_engine.on_retry = command_trace.record_retry
+
+# Distribuidor de dispositivos entre workers (configurado em pytest_configure)
+_allocator = DeviceAllocator()
+_device = None
+
+# Compressão gzip das respostas do Appium (--http-compress)
+_http_compress = False
+
+# Indica se a execução criou alguma sessão Appium real; só então as latências são persistidas
+_device_session_started = False
+
+# Dispositivo reserva do worker para a sessão substituta do heartbeat (None: substituição desativada)
+_spare_device = None
+_spare_configured = False
+_spare_sessions = {}  # id da sessão substituta -> dispositivo reserva
+
+
+def current_device():
+    """
+    Retorna o dispositivo reservado para o worker atual.
+    A alocação é feita na primeira chamada, de acordo com o worker do pytest-xdist.
+    """
+    global _device
+    if _device is None:
+        _device = _allocator.allocate(_worker_id())
+    return _device
+
+
+def _worker_id():
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def _select_device(device):
+    """
+    Define o dispositivo do teste atual (com --prewarm o worker alterna entre dispositivos).
+    """
+    global _device
+    _device = device
+
+
+def start_driver(device=None):
     """
     Inicializa uma nova sessão Appium com as capacidades desejadas.
     Define parâmetros de estabilidade e timeout para evitar falhas no UiAutomator2.
+    A primeira sessão do dispositivo usa o perfil frio; as seguintes, o perfil quente
+    (sem verificar a instalação do servidor nem reconfigurar o dispositivo).
+
+    :param device: Dispositivo alvo; por padrão, o dispositivo reservado para o worker atual
     """
+    global _device_session_started
+    device = device or current_device()
     capabilities = {
         "platformName": "Android",
-        "appium:deviceName": "emulator-5554",
+        "appium:deviceName": device.udid,
+        "appium:udid": device.udid,
+        "appium:systemPort": device.system_port,  # Porta exclusiva do UiAutomator2 por worker
         "appium:automationName": "UiAutomator2",
         "appium:appPackage": PACKAGE,
         "appium:appActivity": "com.blogspot.e_kanivets.moneytracker.activity.record.MainActivity",
         "appium:noReset": True,  # Mantém o app instalado, apenas limpa dados
         "appium:newCommandTimeout": 120000,  # Timeout estendido para evitar desconexões
-        "appium:uiautomator2ServerInstallTimeout": 60000,  # Timeout para instalação do servidor UiAutomator2
         "appium:adbExecTimeout": 200000  # Timeout para comandos ADB
     }
 
-    return webdriver.Remote(
-        "http://127.0.0.1:4723",
-        options=UiAutomator2Options().load_capabilities(capabilities)
-    )
+    def create(profile_capabilities):
+        return webdriver.Remote(
+            TunedAppiumConnection(device.server_url, compress=_http_compress),
+            options=UiAutomator2Options().load_capabilities({**capabilities, **profile_capabilities})
+        )
+
+    start = time.perf_counter()
+    driver = startup_profiles.start(device, create)
+    command_trace.record_command("newSession", time.perf_counter() - start)
+    _device_session_started = True
+    return command_trace.instrument(driver)
 
 
 def is_uiautomator_running(driver):
@@ -44,19 +125,236 @@ def is_uiautomator_running(driver):
         return False
 
 
+def _force_stop_app():
+    """
+    Finaliza o aplicativo antes de recriar a sessão Appium.
+    """
+    command_trace.record_restart()
+    adb_executor.shell(current_device(), f"am force-stop {PACKAGE}", check=True)
+
+
 def restart_appium_session():
     """
     Reinicia a sessão Appium/Uiautomator2 em caso de falha ou crash do servidor.
     Garante a retomada dos testes sem necessidade de reiniciar manualmente o Appium Server.
+    A reinicialização é coordenada pelo SessionManager: todos os Page Objects passam
+    a usar a nova sessão pelo mesmo DriverProxy.
+    """
+    return session_manager.recover()
+
+
+# Sessão compartilhada do worker: recriada via start_driver quando o UiAutomator2 não responde
+session_manager.driver_factory = start_driver
+session_manager.is_alive_check = is_uiautomator_running
+session_manager.before_restart = _force_stop_app
+
+
+def _heartbeat_probe(driver):
+    """
+    Sonda do heartbeat: os comandos feitos em segundo plano ficam fora do trace dos testes.
+    """
+    with command_trace.untraced():
+        return is_uiautomator_running(driver)
+
+
+session_heartbeat.probe = _heartbeat_probe
+
+
+def _configure_spare_device(prewarm):
+    """
+    Configura, na primeira sessão do worker, a sessão substituta antecipada do heartbeat.
+    O dispositivo reserva é um udid além dos reservados para todos os workers (ver
+    DeviceAllocator.allocate_spare); sem ele, o heartbeat apenas marca a sessão como degradada.
+    """
+    global _spare_device, _spare_configured
+    if _spare_configured:
+        return
+    _spare_configured = True
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    _spare_device = _allocator.allocate_spare(_worker_id(), workers, 2 if prewarm else 1)
+    if _spare_device is None:
+        print("\nHeartbeat: nenhum dispositivo reserva; a sessão substituta antecipada está desativada.")
+        return
+    print(f"\nHeartbeat: sessão substituta antecipada em {_spare_device.udid}.")
+    session_heartbeat.spare_factory = _prepare_spare_session
+    session_manager.add_listener(partial(_adopt_spare_session, swap=not prewarm))
+
+
+def _prepare_spare_session():
+    """
+    Cria a sessão substituta no dispositivo reserva (chamada pela thread do heartbeat).
+
+    :return: Nova sessão ou None se o reserva é o dispositivo em uso
+    """
+    device = _spare_device
+    if device is None or device == current_device():
+        return None
+    driver = _prepare_session(device)
+    _spare_sessions.clear()  # há no máximo uma substituta pendente
+    _spare_sessions[id(driver)] = device
+    return driver
+
+
+def _adopt_spare_session(driver, swap):
+    """
+    Listener do SessionManager: quando a sessão substituta é usada, os próximos comandos adb
+    passam a ir para o dispositivo reserva. Sem --prewarm, o dispositivo que falhou vira o
+    novo reserva; com --prewarm ele continua no rodízio e o reserva volta a ficar livre
+    quando o próximo teste recebe a sessão pré-aquecida.
+    """
+    global _spare_device
+    device = _spare_sessions.pop(id(driver), None)
+    if device is None:
+        return
+    if swap:
+        _spare_device = current_device()
+    _select_device(device)
+
+
+def reset_app_data(device=None):
+    """
+    Limpa os dados do aplicativo (sem desinstalar) e concede as permissões necessárias.
+    Os comandos são enviados em um único `adb shell`; falha ao limpar os dados interrompe o teste.
+    """
+    device = device or current_device()
+    print(f"\nLimpando cache e dados do aplicativo em {device.udid} (sem desinstalar)...")
+    print("Concedendo permissões necessárias...")
+    clear, *grants = adb_executor.shell_batch(
+        device,
+        [f"pm clear {PACKAGE}", *(f"pm grant {PACKAGE} {permission}" for permission in APP_PERMISSIONS)],
+    )
+    if not clear.ok:
+        raise AdbError(clear)
+    for grant in grants:
+        if not grant.ok:
+            print(f"Aviso: '{grant.args[1]}' falhou: {grant.stdout.strip()}")
+
+
+def _prepare_session(device):
+    """
+    Preparo feito em segundo plano pelo --prewarm: limpa os dados do app e cria a sessão.
+    Os comandos ficam fora do trace do teste em execução.
+    """
+    with command_trace.untraced():
+        reset_app_data(device)
+        return start_driver(device)
+
+
+def pytest_addoption(parser):
+    """
+    Registra as opções de linha de comando do projeto.
+    """
+    parser.addoption(
+        "--session-reuse",
+        action="store_true",
+        default=False,
+        help="Reutiliza uma única sessão Appium por worker, reiniciando apenas o app entre os testes."
+    )
+    parser.addoption(
+        "--devices",
+        default="",
+        help="Lista de udids separados por vírgula, um por worker (padrão: dispositivos do `adb devices`)."
+    )
+    parser.addoption(
+        "--appium-port",
+        type=int,
+        default=4723,
+        help="Porta do servidor Appium do primeiro worker; os demais usam as portas seguintes."
+    )
+    parser.addoption(
+        "--system-port",
+        type=int,
+        default=8200,
+        help="systemPort do UiAutomator2 do primeiro worker; os demais usam as portas seguintes."
+    )
+    parser.addoption(
+        "--prewarm",
+        action="store_true",
+        default=False,
+        help="Prepara a sessão do próximo teste em outro dispositivo enquanto o teste atual roda "
+             "(requer dois dispositivos por worker)."
+    )
+    parser.addoption(
+        "--http-compress",
+        action="store_true",
+        default=False,
+        help="Solicita respostas compactadas (gzip) ao servidor Appium; útil apenas com servidor remoto."
+    )
+    parser.addoption(
+        "--heartbeat-interval",
+        type=float,
+        default=5.0,
+        help="Intervalo (segundos) do monitoramento da sessão em segundo plano; 0 volta à verificação antes de cada teste."
+    )
+
+
+def pytest_configure(config):
+    """
+    Configura o distribuidor de dispositivos a partir das opções de linha de comando.
+    """
+    global _allocator, _device, _http_compress
+    config.addinivalue_line(
+        "markers", "app_state(name): restaura um checkpoint do estado do app antes do teste"
+    )
+    udids = [udid.strip() for udid in config.getoption("--devices").split(",") if udid.strip()]
+    _allocator = DeviceAllocator(
+        udids,
+        base_appium_port=config.getoption("--appium-port"),
+        base_system_port=config.getoption("--system-port"),
+    )
+    _device = None
+    session_heartbeat.interval = config.getoption("--heartbeat-interval")
+    _http_compress = config.getoption("--http-compress")
+
+    if getattr(config, "cache", None) is not None:
+        wait_engine.budgets.load(config.cache.get(LOCATOR_BUDGETS_CACHE_KEY, {}))
+        edge_costs.load(config.cache.get(SCREEN_COSTS_CACHE_KEY, {}))
+
+
+def pytest_unconfigure(config):
+    """
+    Persiste as latências observadas por localizador e os custos de navegação entre telas
+    para as próximas execuções e encerra o monitoramento da sessão.
+    Execuções sem sessão Appium (ex.: apenas tests/unit, com drivers falsos) não
+    alteram o histórico.
+    """
+    session_heartbeat.stop()
+    if _device_session_started and getattr(config, "cache", None) is not None:
+        config.cache.set(LOCATOR_BUDGETS_CACHE_KEY, wait_engine.budgets.dump())
+        config.cache.set(SCREEN_COSTS_CACHE_KEY, edge_costs.dump())
+
+
+@pytest.fixture(scope="session")
+def session_pool():
+    """
+    Sessão Appium compartilhada pelo worker quando --session-reuse está ativo.
+    A sessão é encerrada apenas ao final da execução.
+    """
+    pool = SessionPool(start_driver, reset_app_data, is_uiautomator_running, PACKAGE)
+    session_manager.add_listener(pool.adopt)
+    yield pool
+    session_manager.remove_listener(pool.adopt)
+    run_report.incr("sessões criadas", pool.sessions_created)
+    run_report.incr("sessões reutilizadas", pool.sessions_reused)
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def session_prewarmer():
+    """
+    Rodízio de dispositivos do worker quando --prewarm está ativo.
+    Sem dispositivos suficientes, o pré-aquecimento é desativado e o setup volta ao fluxo serial.
     """
-    print("Reiniciando sessão Appium/Uiautomator2...")
     try:
-        subprocess.run(f"adb shell am force-stop {PACKAGE}", shell=True)
-    except Exception:
-        pass
+        devices = _allocator.allocate_group(_worker_id(), 2)
+    except RuntimeError as error:
+        print(f"\nPré-aquecimento desativado: {error}")
+        yield None
+        return
 
-    # Recria a sessão Appium
-    return start_driver()
+    prewarmer = SessionPrewarmer(devices, _prepare_session)
+    yield prewarmer
+    prewarmer.close()
 
 
 @pytest.fixture(scope="function")
@@ -65,19 +363,58 @@ def setup(request):
     Fixture de inicialização utilizada em todos os testes.
     - Limpa os dados do aplicativo antes de cada execução.
     - Concede permissões necessárias.
-    - Inicia uma nova sessão Appium.
+    - Inicia uma nova sessão Appium (ou reutiliza a do worker com --session-reuse,
+      ou recebe a sessão preparada em segundo plano com --prewarm).
     - Finaliza o aplicativo ao término do teste.
     """
-    print("\nLimpando cache e dados do aplicativo (sem desinstalar)...")
-    subprocess.run(f"adb shell pm clear {PACKAGE}", shell=True)
+    yield from _app_session(request)
 
-    print("Concedendo permissões necessárias...")
-    subprocess.run(f"adb shell pm grant {PACKAGE} android.permission.READ_EXTERNAL_STORAGE", shell=True)
-    subprocess.run(f"adb shell pm grant {PACKAGE} android.permission.WRITE_EXTERNAL_STORAGE", shell=True)
 
-    print("Iniciando sessão Appium...")
-    driver = start_driver()
+@pytest.fixture(scope="class")
+def class_setup(request):
+    """
+    Como setup, porém com um único preparo do app e uma única sessão para todos os testes
+    da classe. Usado por casos que compartilham a mesma tela aberta (ex.: tabelas de validação
+    de formulário), em vez de limpar os dados e navegar novamente a cada caso.
+    """
+    yield from _app_session(request)
+
+
+def _app_session(request):
+    """
+    Prepara o app e a sessão Appium do teste (ou da classe) e os encerra ao final.
+    """
+    if request.config.getoption("--session-reuse"):
+        pool = request.getfixturevalue("session_pool")
+        print("\nReutilizando sessão Appium do worker...")
+        request.cls.driver = session_manager.attach(pool.acquire())
+        session_heartbeat.start()
+
+        yield  # Execução do teste ocorre aqui
+
+        print("Encerrando aplicativo após o teste...")
+        pool.release()
+        return
+
+    prewarmer = request.getfixturevalue("session_prewarmer") if request.config.getoption("--prewarm") else None
+    if session_heartbeat.interval > 0:
+        _configure_spare_device(prewarmer is not None)
+    if prewarmer is not None:
+        print("\nUtilizando sessão Appium pré-aquecida...")
+        device, new_driver = prewarmer.take()
+        _select_device(device)
+    else:
+        reset_app_data()
+        print("Iniciando sessão Appium...")
+        new_driver = start_driver()
+
+    driver = session_manager.attach(new_driver)
+    run_report.incr("sessões criadas")
     request.cls.driver = driver
+    session_heartbeat.start()
+    if prewarmer is not None:
+        # O próximo dispositivo do rodízio é preparado enquanto este teste é executado
+        prewarmer.schedule()
 
     yield  # Execução do teste ocorre aqui
 
@@ -86,6 +423,113 @@ def setup(request):
         driver.terminate_app(PACKAGE)
     except Exception:
         pass
+    if prewarmer is not None:
+        # A próxima sessão neste dispositivo será criada pelo pré-aquecimento
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+@pytest.fixture(scope="class")
+def seeder(tmp_path_factory):
+    """
+    Acesso direto ao banco do aplicativo no dispositivo do worker.
+    Com escopo de classe, também pode ser usado por fixtures de classe (ex.: income_form).
+    """
+    return DatabaseSeeder(current_device(), PACKAGE, tmp_path_factory.mktemp("seeder"))
+
+
+@pytest.fixture
+def account(setup, request, seeder):
+    """
+    Cria contas diretamente no banco do aplicativo, sem navegar pela interface.
+
+    Exemplo:
+        def test_x(self, account):
+            account()                          # AccountData.VALID_ACCOUNT_NAME com saldo padrão
+            account("Poupança", "1500")
+    """
+    def create(title=AccountData.VALID_ACCOUNT_NAME, initial_sum=AccountData.VALID_ACCOUNT_VALUE):
+        seeder.device = current_device()  # com --prewarm o dispositivo muda a cada teste
+        with seeder.seeding(request.cls.driver) as db:
+            return db.add_account(title, initial_sum)
+
+    return create
+
+
+@pytest.fixture
+def records(setup, request, seeder):
+    """
+    Cria registros de receita/despesa diretamente no banco do aplicativo.
+    Cada item é um dicionário com title, price, category e, opcionalmente,
+    account (padrão: AccountData.VALID_ACCOUNT_NAME), kind ("income"/"expense") e timestamp.
+
+    Exemplo:
+        def test_x(self, account, records):
+            account()
+            records([{"title": "Salário", "price": "1000", "category": "Trabalho"}])
+    """
+    def create(items):
+        seeder.device = current_device()  # com --prewarm o dispositivo muda a cada teste
+        with seeder.seeding(request.cls.driver) as db:
+            return [
+                db.add_record(**{"account": AccountData.VALID_ACCOUNT_NAME, **item})
+                for item in items
+            ]
+
+    return create
+
+
+@pytest.fixture(scope="session")
+def app_state_store(tmp_path_factory):
+    """
+    Checkpoints do diretório de dados do app, capturados uma vez por execução.
+    """
+    return AppStateStore(current_device(), PACKAGE, tmp_path_factory.mktemp("app_states"))
+
+
+@pytest.fixture(autouse=True)
+def app_state(request):
+    """
+    Restaura o estado declarado com @pytest.mark.app_state("<nome>") antes do teste.
+    Na primeira vez, o estado é criado pelo caminho tradicional (limpar dados + recriar)
+    e capturado; nas seguintes, é apenas restaurado. Os dois tempos entram no relatório.
+    """
+    marker = request.node.get_closest_marker("app_state")
+    if marker is None:
+        return
+
+    name = marker.args[0]
+    if name not in CHECKPOINTS:
+        pytest.fail(f"Checkpoint desconhecido: '{name}'. Disponíveis: {', '.join(CHECKPOINTS)}")
+
+    request.getfixturevalue("setup")
+    driver = request.cls.driver
+    store = request.getfixturevalue("app_state_store")
+    store.device = current_device()  # com --prewarm o dispositivo muda a cada teste
+
+    if store.has(name):
+        print(f"Restaurando checkpoint '{name}'...")
+        driver.terminate_app(PACKAGE)
+        run_report.add_timing("estado do app: restaurar checkpoint", store.restore(name))
+        driver.activate_app(PACKAGE)
+        return
+
+    print(f"Criando checkpoint '{name}'...")
+    start = time.perf_counter()
+    driver.terminate_app(PACKAGE)
+    reset_app_data()
+    driver.activate_app(PACKAGE)
+    seeder = request.getfixturevalue("seeder")
+    seeder.device = store.device
+    with seeder.seeding(driver) as db:
+        CHECKPOINTS[name](db)
+    run_report.add_timing("estado do app: limpar e recriar", time.perf_counter() - start)
+
+    driver.terminate_app(PACKAGE)
+    store.capture(name)
+    driver.activate_app(PACKAGE)
 
 
 def pytest_runtest_setup(item):
@@ -93,10 +537,44 @@ def pytest_runtest_setup(item):
     Hook do pytest executado antes de cada caso de teste.
     Este método detecta se o UiAutomator2 crashou e, se necessário, recria a sessão Appium automaticamente.
     Evita falhas em cadeia nos testes subsequentes.
+    Com o heartbeat ativo, apenas consulta o último estado observado em segundo plano,
+    sem uma chamada síncrona ao servidor; se a sessão foi marcada como degradada, a
+    recuperação (force-stop e nova sessão) é feita aqui, entre testes, e só depois de
+    recover() confirmar que o UiAutomator2 não responde.
+    Com --session-reuse a verificação fica a cargo do SessionPool.
     """
+    if item.config.getoption("--session-reuse"):
+        return
+
     driver = getattr(item.cls, "driver", None)
+    if not driver:
+        return
 
-    if driver and not is_uiautomator_running(driver):
+    healthy = session_heartbeat.healthy if session_heartbeat.running else session_manager.is_alive()
+    if not healthy:
         print("UiAutomator2 não está respondendo. Criando nova sessão Appium...")
-        new_driver = restart_appium_session()
-        item.cls.driver = new_driver
+        item.cls.driver = restart_appium_session()
+
+
+def pytest_runtest_logreport(report):
+    """
+    Registra a duração de cada etapa (setup, call, teardown) dos testes.
+    """
+    run_report.add_test_phase(report.nodeid, report.when, report.duration)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Exibe o relatório de tempos por teste e a saúde da sessão ao final da execução.
+    """
+    lines = run_report.summary_lines()
+    if lines:
+        terminalreporter.section("Tempos por teste")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    health = session_heartbeat.summary_lines()
+    if health:
+        terminalreporter.section("Saúde da sessão")
+        for line in health:
+            terminalreporter.write_line(line)
@@ -1,3 +1,7 @@
+import random
+from collections import namedtuple
+from decimal import Decimal
+
 class AccountData:
     """
     Dados de teste relacionados à criação de contas.
@@ -85,3 +89,140 @@ class RecordData:
 
     VALID_RECORD_NAME = "Conta Teste"
     VALID_RECORD_VALUE = "000"
+
+
+# Conta gerada pela LedgerFactory (campos compatíveis com LedgerDatabase.add_account)
+GeneratedAccount = namedtuple("GeneratedAccount", "title initial_sum")
+
+# Registro gerado pela LedgerFactory (campos compatíveis com LedgerDatabase.add_record)
+GeneratedRecord = namedtuple("GeneratedRecord", "title price category account kind timestamp")
+
+
+class AccountTotals(namedtuple("AccountTotals", "initial_sum income expense records")):
+    """Totais esperados de uma conta após todos os registros gerados."""
+
+    @property
+    def balance(self):
+        return self.initial_sum + self.income - self.expense
+
+
+class LedgerFactory:
+    """
+    Gerador determinístico de contas e registros em grande volume.
+    A mesma semente produz sempre os mesmos dados, entregues sob demanda (geradores),
+    de modo que dezenas de milhares de registros não precisam ficar em memória.
+    Uma parte dos dados fica exatamente nos limites aceitos pelo app
+    (títulos com 20 caracteres e valores com 13 dígitos, ver AccountData).
+
+    Exemplo:
+        ledger = LedgerFactory(seed=7, accounts=5, records=10000)
+        for account in ledger.accounts():
+            db.add_account(*account)
+        for record in ledger.records():
+            db.add_record(**record._asdict())
+        ledger.expected_totals()["ContaAaaa"].balance
+        records_page.totals_diff(summary_from_totals(ledger.expected_totals()), streamed=True)
+    """
+
+    MAX_TITLE_LENGTH = 20
+    MAX_VALUE = "9" * 13
+
+    # Palavras e categorias apenas com letras (categorias com números são inválidas)
+    TITLES = ("Salario", "Mercado", "Aluguel", "Padaria", "Farmacia", "Transporte", "Freelance", "Lazer")
+    CATEGORIES = ("Trabalho", "Alimentacao", "Moradia", "Saude", "Transporte", "Compras", "Lazer")
+
+    # 01/01/2024 00:00 UTC em milissegundos; os registros avançam a partir daqui (nunca no futuro).
+    # Por serem antigos, ficam fora do período padrão da lista: use HomePage.select_all_time_filter()
+    START_TIMESTAMP = 1704067200000
+    TIMESTAMP_STEP = 15 * 60 * 1000
+
+    def __init__(self, seed=0, accounts=10, records=1000, boundary_ratio=0.05):
+        """
+        :param seed: Semente dos dados gerados
+        :param accounts: Quantidade de contas
+        :param records: Quantidade de registros (receitas e despesas)
+        :param boundary_ratio: Fração de contas e registros gerados nos limites de tamanho
+        """
+        if accounts < 1:
+            raise ValueError("A LedgerFactory precisa de ao menos uma conta.")
+        self.seed = seed
+        self.account_count = accounts
+        self.record_count = records
+        self.boundary_ratio = boundary_ratio
+        # Totais por conta da última passada completa por records()
+        self._totals = None
+
+    def _random(self, stream):
+        return random.Random(f"{self.seed}:{stream}")
+
+    @staticmethod
+    def _code(index, width=4):
+        """Identificador só com letras e largura fixa (garante títulos distintos)."""
+        letters = []
+        for _ in range(width):
+            index, digit = divmod(index, 26)
+            letters.append(chr(ord("a") + digit))
+        return "".join(reversed(letters))
+
+    def account_titles(self):
+        """Nomes das contas, na ordem de accounts()."""
+        return [account.title for account in self.accounts()]
+
+    def accounts(self):
+        """
+        :return: Gerador de GeneratedAccount
+        """
+        rng = self._random("accounts")
+        for index in range(self.account_count):
+            code = self._code(index)
+            if rng.random() < self.boundary_ratio:
+                title = f"Conta{code}".ljust(self.MAX_TITLE_LENGTH, "x")
+                initial_sum = self.MAX_VALUE
+            else:
+                title = f"Conta{code.capitalize()}"
+                initial_sum = str(rng.randint(0, 100000))
+            yield GeneratedAccount(title, initial_sum)
+
+    def records(self):
+        """
+        :return: Gerador de GeneratedRecord, em ordem cronológica.
+            Os totais por conta são acumulados enquanto o gerador é consumido
+            e ficam disponíveis em expected_totals() ao final da passada.
+        """
+        totals = {account.title: [Decimal(account.initial_sum), Decimal(0), Decimal(0), 0]
+                  for account in self.accounts()}
+        titles = list(totals)
+        rng = self._random("records")
+        for index in range(self.record_count):
+            word = rng.choice(self.TITLES)
+            if rng.random() < self.boundary_ratio:
+                title = f"{word} {index}".ljust(self.MAX_TITLE_LENGTH, "x")
+                price = self.MAX_VALUE
+            else:
+                title = f"{word} {index}"
+                price = str(Decimal(rng.randint(1, 500000)) / 100)
+            record = GeneratedRecord(
+                title=title,
+                price=price,
+                category=rng.choice(self.CATEGORIES),
+                account=rng.choice(titles),
+                kind=rng.choice(("income", "expense")),
+                timestamp=self.START_TIMESTAMP + index * self.TIMESTAMP_STEP,
+            )
+            entry = totals[record.account]
+            entry[1 if record.kind == "income" else 2] += Decimal(record.price)
+            entry[3] += 1
+            yield record
+        self._totals = totals
+
+    def expected_totals(self):
+        """
+        Totais esperados por conta, acumulados durante a última passada completa por records().
+        Só percorre os registros novamente se nenhuma passada foi concluída.
+
+        :return: Dicionário nome da conta -> AccountTotals
+        """
+        if self._totals is None:
+            for _ in self.records():
+                pass
+        return {title: AccountTotals(*entry) for title, entry in self._totals.items()}
@@ -7,6 +7,9 @@ class AccountsPage(BasePage):
     Contém métodos para navegação, criação e validação de contas.
     """
 
+    # Settings do UiAutomator2: lista simples, sem espera por ociosidade e apenas views relevantes
+    settings_profile = {"waitForIdleTimeout": 100, "ignoreUnimportantViews": True}
+
     # Localizador do menu "Accounts" no menu lateral
     _accounts_menu = (AppiumBy.XPATH, "//android.widget.CheckedTextView[@text='Accounts']")
 
@@ -64,4 +67,4 @@ class AccountsPage(BasePage):
             int: Número de contas encontradas com o nome informado.
         """
         xpath = f"//android.widget.TextView[@text='{name}']"
-        return len(self.driver.find_elements(AppiumBy.XPATH, xpath))
+        return self.count_elements(AppiumBy.XPATH, xpath)
@@ -12,10 +12,20 @@ class AddAccountPage(BasePage):
         "//android.widget.TextView[@resource-id='com.blogspot.e_kanivets.moneytracker:id/textinput_error']"
     )
 
+    # Campo de cada valor das tabelas de validação
+    _validation_fields = {"title": _title_input, "initial_sum": _initial_sum_input}
+
     # ✅ Preenche os campos e clica em salvar
     def add_account(self, title, initial_sum):
-        self.send_keys(*self._title_input, text=title)
-        self.send_keys(*self._initial_sum_input, text=initial_sum)
+        self.fill_account(title, initial_sum)
+        self.save()
+
+    # ✅ Preenche os campos do formulário sem salvar
+    def fill_account(self, title, initial_sum):
+        self.fill_form({self._title_input: title, self._initial_sum_input: initial_sum})
+
+    # ✅ Clica em salvar
+    def save(self):
         self.click(*self._save_button)
 
     # ✅ Retorna o texto da mensagem de erro, caso exista
@@ -25,6 +35,14 @@ class AddAccountPage(BasePage):
         except:
             return None
 
+    # ✅ Textos de erro exibidos no formulário, lidos de um único page_source e sem espera;
+    #    com `fields` ("title", "initial_sum"), apenas os erros desses campos
+    def error_text(self, fields=None):
+        if fields is not None:
+            return self.field_error_text("com.blogspot.e_kanivets.moneytracker:id/textinput_error",
+                                         [self._validation_fields[field] for field in fields])
+        return " | ".join(text.strip() for text in self.get_texts(*self._error_message))
+
     # ✅ Verifica se a mensagem de erro contém o texto esperado
     def is_error_message_displayed(self, expected_text="Field"):
         error = self.get_error_message()
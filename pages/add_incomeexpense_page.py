@@ -1,5 +1,6 @@
 from appium.webdriver.common.appiumby import AppiumBy
 from pages.base_page import BasePage
+from pages.records_page import RecordsPage
 
 class AddIncomeExpensePage(BasePage):
     """
@@ -21,6 +22,12 @@ class AddIncomeExpensePage(BasePage):
     # Seleção de conta vinculada ao registro
     _spinner_account = (AppiumBy.ID, "com.blogspot.e_kanivets.moneytracker:id/spinnerAccount")
 
+    # Mensagens de validação dos campos do formulário
+    _error_message = (AppiumBy.ID, "com.blogspot.e_kanivets.moneytracker:id/textinput_error")
+
+    # Campo de cada valor das tabelas de validação
+    _validation_fields = {"price": _input_price, "title": _input_title, "category": _input_category}
+
     # Botão padrão para concluir (salvar ou editar)
     _btn_done = (AppiumBy.ID, "com.blogspot.e_kanivets.moneytracker:id/fabDone")
 
@@ -53,15 +60,30 @@ class AddIncomeExpensePage(BasePage):
         """Insere a categoria no campo 'Category' do formulário."""
         self.send_keys(*self._input_category, text=category)
 
+    def fill_record(self, price=None, title=None, category=None, account_name=None):
+        """
+        Preenche o formulário de Income/Expense em uma única passada (ver BasePage.fill_form).
+        Campos informados como None não são alterados.
+
+        :param account_name: Conta vinculada; se informada, é selecionada após o preenchimento.
+        """
+        self.fill_form({
+            self._input_price: price,
+            self._input_title: title,
+            self._input_category: category,
+        })
+        if account_name is not None:
+            self.select_account(account_name)
+
     def select_account(self, account_name):
         """
         Seleciona a conta à qual a receita/despesa será vinculada.
 
         :param account_name: Nome da conta cadastrada anteriormente.
         """
-        self.click(*self._spinner_account)
+        self.click(*self._spinner_account, navigates=False)
         xpath = f"//android.widget.TextView[@text='{account_name}']"
-        self.click(AppiumBy.XPATH, xpath)
+        self.click(AppiumBy.XPATH, xpath, navigates=False)
 
     def save(self):
         """Confirma e salva o registro de Income ou Expense."""
@@ -92,6 +114,18 @@ class AddIncomeExpensePage(BasePage):
                  f"and contains(@text, '{text}')]")
         return self.is_element_displayed(AppiumBy.XPATH, xpath)
 
+    def error_text(self, fields=None):
+        """
+        Textos de erro exibidos no formulário, lidos de um único page_source e sem espera.
+
+        :param fields: Opcional; nomes dos campos ("price", "title", "category") cujos erros são lidos
+        :return: Mensagens separadas por " | " ou string vazia se não houver erro
+        """
+        if fields is not None:
+            return self.field_error_text(self._error_message[1],
+                                         [self._validation_fields[field] for field in fields])
+        return " | ".join(text.strip() for text in self.get_texts(*self._error_message))
+
     # Alias para compatibilidade com testes que utilizam outro nome
     def is_error_displayed(self, text="Field"):
         xpath = f"//android.widget.TextView[contains(@text, '{text}')]"
@@ -105,9 +139,7 @@ class AddIncomeExpensePage(BasePage):
 
     def update_price_value(self, new_price):
         """Atualiza o valor do campo 'Price' em um registro já aberto."""
-        element = self.find(*self._price_edit_field)
-        element.clear()
-        element.send_keys(new_price)
+        self.send_keys(*self._price_edit_field, text=new_price)
 
     def save_edited_record(self):
         """Confirma a edição do registro utilizando o botão de salvar."""
@@ -134,9 +166,8 @@ class AddIncomeExpensePage(BasePage):
     # ---------------------- SUPORTE GERAL ----------------------
 
     def count_records_by_title(self, title):
-        """Conta quantos registros possuem o mesmo título."""
-        xpath = f"//android.widget.TextView[@text='{title}']"
-        return len(self.driver.find_elements(AppiumBy.XPATH, xpath))
+        """Conta quantos registros possuem o mesmo título (lista completa, ver RecordsPage.iter_records)."""
+        return RecordsPage(self.driver).count_records_by_title(title)
 
     def open_income_details(self, title):
         """Abre os detalhes de um registro específico pelo título."""
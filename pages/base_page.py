@@ -1,7 +1,41 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-import time
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import (InvalidArgumentException, StaleElementReferenceException, TimeoutException,
+                                        UnknownMethodException, WebDriverException)
+from contextlib import contextmanager
+import hashlib
+import re
+from utils.element_cache import ElementCache
+from utils.locator_compiler import compile_locator, java_string
+from utils.reporting import run_report
+from utils.session_manager import session_manager
+from utils.wait_engine import wait_engine
+import weakref
+
+# Snapshots da hierarquia ativos por sessão, compartilhados entre os Page Objects do mesmo driver.
+# O valor None indica modo snapshot ativo, porém aguardando nova captura.
+_active_snapshots = weakref.WeakKeyDictionary()
+
+# Cache de elementos da tela atual por sessão, compartilhado entre os Page Objects do mesmo driver
+_element_caches = weakref.WeakKeyDictionary()
+
+# Valores padrão do UiAutomator2 para os settings usados nos perfis das páginas
+DEFAULT_SETTINGS = {"waitForIdleTimeout": 10000, "ignoreUnimportantViews": False, "snapshotMaxDepth": 70}
+
+# Settings já enviados por sessão, para que apenas mudanças sejam transmitidas
+_applied_settings = weakref.WeakKeyDictionary()
+
+
+def _forget_session_state(driver):
+    """
+    Descarta elementos e snapshots associados ao DriverProxy quando a sessão por trás dele muda.
+    """
+    _element_caches.pop(session_manager.proxy, None)
+    _applied_settings.pop(session_manager.proxy, None)
+    if session_manager.proxy in _active_snapshots:
+        _active_snapshots[session_manager.proxy] = None
+
+
+session_manager.add_listener(_forget_session_state)
 
 class BasePage:
     """
@@ -10,45 +44,111 @@ class BasePage:
     e tratamento de falhas comuns no UiAutomator2.
     """
 
+    # Ordem dos campos de cada formulário na hierarquia, indexada pelo conjunto de ids
+    _form_layouts = {}
+
+    # Desativado na primeira falha, caso o servidor não suporte 'mobile: replaceElementValue'
+    _replace_value_supported = True
+
+    # Settings do UiAutomator2 usados nas consultas desta página (ver apply_settings_profile)
+    settings_profile = {}
+
     def __init__(self, driver):
         """
-        Inicializa a classe com a instância do driver e define
-        uma espera explícita padrão de 15 segundos.
+        Inicializa a classe com a instância do driver e o motor de espera compartilhado
+        (timeout total padrão de 15 segundos, com polling em backoff).
         """
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, 15)
+        self.waits = wait_engine
 
     # ---------------------- MÉTODOS GENÉRICOS DE INTERAÇÃO ----------------------
 
-    def find(self, by, locator):
+    def find(self, by, locator, timeout=None):
         """
         Localiza um elemento na tela utilizando espera explícita.
-        Em caso de Timeout, realiza uma segunda tentativa.
+        A espera usa primeiro o orçamento aprendido para o localizador e, em caso de Timeout,
+        é estendida até o timeout total.
         Em caso de falha no UiAutomator2, reinicia a sessão automaticamente.
+        XPaths simples são convertidas para UiSelector/ID antes da busca.
 
         :param by: Estratégia de localização (ex.: AppiumBy.ID, AppiumBy.XPATH)
         :param locator: Caminho/localizador do elemento
+        :param timeout: Espera máxima opcional (segundos), sem extensão
         :return: WebElement localizado
         """
+        by, locator = compile_locator(by, locator)
+        element = self.element_cache.get((by, locator))
+        if element is not None:
+            return element
+
+        self.apply_settings_profile()
         try:
-            return self.wait.until(EC.presence_of_element_located((by, locator)))
+            element = self.waits.find(self.driver, by, locator, timeout)
         except TimeoutException:
-            # Realiza nova tentativa após breve espera
-            time.sleep(1)
-            return self.wait.until(EC.presence_of_element_located((by, locator)))
+            raise
         except WebDriverException:
             # Tratamento de travamento do UiAutomator2
             print("UiAutomator2 não respondeu. Reiniciando sessão...")
             from conftest import restart_appium_session
             self.driver = restart_appium_session()
-            self.wait = WebDriverWait(self.driver, 15)
-            return self.wait.until(EC.presence_of_element_located((by, locator)))
+            element = self.waits.find(self.driver, by, locator, timeout)
 
-    def click(self, by, locator):
+        self.element_cache.put((by, locator), element)
+        return element
+
+    def apply_settings_profile(self):
+        """
+        Aplica o perfil de settings da página antes de consultar a hierarquia.
+        Settings alterados por outra página e não declarados aqui voltam ao padrão.
+        Somente os valores diferentes dos já enviados nesta sessão são transmitidos.
+        """
+        applied = _applied_settings.setdefault(self.driver, {})
+        desired = {name: DEFAULT_SETTINGS[name] for name in applied if name in DEFAULT_SETTINGS}
+        desired.update(self.settings_profile)
+        changes = {name: value for name, value in desired.items()
+                   if applied.get(name, DEFAULT_SETTINGS.get(name)) != value}
+        if not changes:
+            return
+        self.driver.update_settings(changes)
+        applied.update(changes)
+        run_report.incr("settings do UiAutomator2 enviados")
+
+    @property
+    def element_cache(self):
+        """
+        Cache de elementos da tela atual, compartilhado entre os Page Objects do mesmo driver.
+        """
+        if self.driver not in _element_caches:
+            _element_caches[self.driver] = ElementCache()
+        return _element_caches[self.driver]
+
+    def _interact(self, by, locator, action, timeout=None):
+        """
+        Executa uma ação sobre o elemento (possivelmente vindo do cache).
+        Se o elemento estiver obsoleto, ele é descartado do cache, localizado novamente
+        e a ação é repetida uma única vez.
+
+        :param action: Função que recebe o WebElement
+        :return: Valor retornado pela ação
+        """
+        try:
+            return action(self.find(by, locator, timeout))
+        except StaleElementReferenceException:
+            self.element_cache.discard_stale(compile_locator(by, locator))
+            return action(self.find(by, locator, timeout))
+
+    def click(self, by, locator, navigates=True):
         """
         Realiza clique em um elemento localizado na interface.
+
+        :param navigates: Indica se o clique pode mudar de tela; nesse caso o cache
+                          de elementos é descartado. Use False para cliques que mantêm
+                          a tela atual (ex.: abrir um spinner).
         """
-        self.find(by, locator).click()
+        self._interact(by, locator, lambda element: element.click())
+        if navigates:
+            self.element_cache.clear()
+        self.invalidate_snapshot()
 
     def send_keys(self, by, locator, text):
         """
@@ -56,21 +156,140 @@ class BasePage:
 
         :param text: Valor a ser digitado no elemento
         """
-        element = self.find(by, locator)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+
+        self._interact(by, locator, type_text)
+        self.invalidate_snapshot()
+
+    def back(self):
+        """
+        Volta para a tela anterior (botão 'voltar' do Android), descartando o cache de elementos.
+        """
+        self.driver.back()
+        self.element_cache.clear()
+        self.invalidate_snapshot()
+
+    def fill_form(self, fields):
+        """
+        Preenche vários campos de um formulário com o menor número de comandos possível.
+        Campos localizados por ID são resolvidos em uma única busca (UiSelector com
+        resourceIdMatches) e cada valor é definido com um único comando
+        'mobile: replaceElementValue', em vez de find + clear + send_keys por campo.
+
+        :param fields: Dicionário {localizador: valor}; valores None são ignorados
+        :return: Quantidade de comandos economizados em relação a send_keys campo a campo
+        """
+        fields = {locator: value for locator, value in fields.items() if value is not None}
+        elements, commands = self._resolve_form_elements(list(fields))
+        for locator, value in fields.items():
+            element = elements[locator]
+            try:
+                commands += self._set_value(element, str(value))
+            except StaleElementReferenceException:
+                self.element_cache.discard_stale(compile_locator(*locator))
+                element = self.find(*locator)
+                commands += 1 + self._set_value(element, str(value))
+            self.element_cache.put(compile_locator(*locator), element)
+        self.invalidate_snapshot()
+
+        saved = 3 * len(fields) - commands
+        run_report.incr("comandos economizados (fill_form)", saved)
+        return saved
+
+    def _resolve_form_elements(self, locators):
+        """
+        Localiza os campos do formulário.
+
+        :return: Tupla (dicionário {localizador: WebElement}, comandos utilizados)
+        """
+        ids = [locator for by, locator in locators]
+        if len(locators) < 2 or any(by != AppiumBy.ID for by, _ in locators) or len(set(ids)) != len(ids):
+            return {locator: self.find(*locator) for locator in locators}, len(locators)
+
+        commands = 0
+        key = frozenset(ids)
+        if key not in self._form_layouts:
+            commands += 1
+            order = [node.get("resource-id") for node in self.snapshot().root.iter()
+                     if node.get("resource-id") in key]
+            if sorted(order) != sorted(ids):
+                return {locator: self.find(*locator) for locator in locators}, commands + len(locators)
+            BasePage._form_layouts[key] = order
+
+        self.apply_settings_profile()
+        pattern = "^(" + "|".join(re.escape(resource_id) for resource_id in self._form_layouts[key]) + ")$"
+        selector = f"new UiSelector().resourceIdMatches({java_string(pattern)})"
+
+        def all_fields_present():
+            found = self.driver.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, selector)
+            return found if len(found) == len(ids) else None
+
+        elements = self.waits.until(all_fields_present, message=f"Campos do formulário não encontrados: {ids}")
+        commands += 1
+        return {(AppiumBy.ID, resource_id): element
+                for resource_id, element in zip(self._form_layouts[key], elements)}, commands
+
+    def _set_value(self, element, value):
+        """
+        Define o valor de um campo substituindo o conteúdo atual.
+
+        :return: Quantidade de comandos utilizados
+        """
+        if value == "":
+            element.clear()
+            return 1
+
+        commands = 0
+        if BasePage._replace_value_supported:
+            try:
+                self.driver.execute_script("mobile: replaceElementValue", {"elementId": element.id, "text": value})
+                return 1
+            except (UnknownMethodException, InvalidArgumentException):
+                # Servidor sem o comando: as próximas chamadas já usam clear + send_keys.
+                # Demais erros (ex.: elemento obsoleto) sobem para quem chamou e não desativam o atalho
+                BasePage._replace_value_supported = False
+                commands += 1
+
         element.clear()
-        element.send_keys(text)
+        element.send_keys(value)
+        return commands + 2
 
     def is_element_displayed(self, by, locator):
         """
         Verifica se determinado elemento está visível na tela.
+        Asserção positiva: a busca espera primeiro pelo orçamento aprendido do localizador e,
+        se necessário, é estendida até o timeout total (ex.: lista ainda atualizando após salvar).
+        Para asserções negativas, use is_element_absent.
 
         :return: True caso visível, False caso contrário
         """
         try:
-            return self.find(by, locator).is_displayed()
+            return self._interact(by, locator, lambda element: element.is_displayed())
         except Exception:
             return False
 
+    def is_element_absent(self, by, locator):
+        """
+        Verifica, sem espera, se nenhum elemento corresponde ao localizador.
+        Indicado para asserções negativas, que retornam em milissegundos
+        em vez de aguardar o timeout completo.
+
+        :return: True caso o elemento não exista na tela
+        """
+        self.apply_settings_profile()
+        return self.waits.is_absent(self.driver, *compile_locator(by, locator))
+
+    def wait_until_absent(self, by, locator, timeout=None):
+        """
+        Aguarda o elemento deixar a tela (ex.: diálogo fechado, registro excluído).
+
+        :return: True se o elemento desapareceu dentro do prazo, False caso contrário
+        """
+        self.apply_settings_profile()
+        return self.waits.wait_until_absent(self.driver, *compile_locator(by, locator), timeout=timeout)
+
     def get_text(self, by, locator):
         """
         Retorna o texto de um elemento visível na tela,
@@ -78,4 +297,144 @@ class BasePage:
 
         :return: String com o texto capturado
         """
-        return self.find(by, locator).text.strip()
+        return self._interact(by, locator, lambda element: element.text.strip())
+
+    # ---------------------- ESPERA POR ESTABILIDADE DA TELA ----------------------
+
+    def screen_fingerprint(self):
+        """
+        Impressão digital barata da tela atual (hash do page_source).
+
+        :return: String hexadecimal que muda sempre que a hierarquia muda
+        """
+        self.apply_settings_profile()
+        return hashlib.sha1(self.driver.page_source.encode("utf-8")).hexdigest()
+
+    def wait_until_stable(self, timeout=5, samples=2):
+        """
+        Aguarda a tela parar de mudar (transições, animações, atualização de listas).
+        Retorna assim que `samples` capturas consecutivas forem idênticas,
+        substituindo pausas fixas como time.sleep(0.5).
+
+        :param timeout: Espera máxima (segundos)
+        :param samples: Quantidade de capturas consecutivas iguais exigida
+        :return: True se a tela estabilizou, False se o tempo se esgotou
+        """
+        history = []
+
+        def settled():
+            history.append(self.screen_fingerprint())
+            return len(history) >= samples and len(set(history[-samples:])) == 1
+
+        try:
+            return self.waits.until(settled, timeout)
+        except TimeoutException:
+            return False
+        finally:
+            self.invalidate_snapshot()
+
+    def wait_for_list_change(self, by, locator, previous_count, timeout=5):
+        """
+        Aguarda a quantidade de itens de uma lista mudar em relação à contagem anterior
+        (ex.: após salvar ou excluir um registro).
+
+        :param previous_count: Quantidade de itens antes da ação
+        :return: Nova quantidade de itens ou None se a lista não mudou dentro do prazo
+        """
+        self.apply_settings_profile()
+
+        def changed():
+            count = len(self.driver.find_elements(*compile_locator(by, locator)))
+            # Tupla para que uma lista vazia (contagem 0) também conte como mudança
+            return (count,) if count != previous_count else None
+
+        try:
+            return self.waits.until(changed, timeout)[0]
+        except TimeoutException:
+            return None
+
+    # ---------------------- SNAPSHOT DA HIERARQUIA ----------------------
+
+    @contextmanager
+    def snapshot_mode(self):
+        """
+        Ativa o modo snapshot: o `page_source` é obtido uma única vez e reutilizado
+        por todas as consultas até a próxima ação de interface (click/send_keys).
+
+        Exemplo:
+            with records.snapshot_mode():
+                records.is_element_present(...)
+                records.count_elements(...)
+        """
+        nested = self.driver in _active_snapshots
+        if not nested:
+            _active_snapshots[self.driver] = None
+        try:
+            yield self
+        finally:
+            if not nested:
+                _active_snapshots.pop(self.driver, None)
+
+    def snapshot(self):
+        """
+        Retorna o snapshot da tela atual.
+        Fora do modo snapshot, cada chamada realiza uma nova captura.
+
+        :return: PageSnapshot com a hierarquia da tela
+        """
+        from utils.page_snapshot import PageSnapshot
+
+        self.apply_settings_profile()
+        if self.driver not in _active_snapshots:
+            return PageSnapshot(self.driver.page_source)
+        if _active_snapshots[self.driver] is None:
+            _active_snapshots[self.driver] = PageSnapshot(self.driver.page_source)
+        return _active_snapshots[self.driver]
+
+    def invalidate_snapshot(self):
+        """
+        Descarta o snapshot ativo, forçando nova captura na próxima consulta.
+        Deve ser chamado após qualquer ação que altere a tela.
+        """
+        if self.driver in _active_snapshots:
+            _active_snapshots[self.driver] = None
+
+    def is_element_present(self, by, locator):
+        """
+        Verifica, sem espera, se o elemento existe na hierarquia da tela.
+
+        :return: True caso exista, False caso contrário
+        """
+        return self.snapshot().is_present(by, locator)
+
+    def count_elements(self, by, locator):
+        """
+        Conta, sem espera, quantos elementos correspondem ao localizador.
+
+        :return: Quantidade de elementos encontrados
+        """
+        return self.snapshot().count(by, locator)
+
+    def get_texts(self, by, locator):
+        """
+        Retorna os textos de todos os elementos que correspondem ao localizador.
+
+        :return: Lista de strings
+        """
+        return self.snapshot().texts(by, locator)
+
+    def field_error_text(self, error_id, field_locators):
+        """
+        Textos de erro exibidos junto aos campos informados, lidos de um único page_source e sem espera.
+        O erro de cada campo é procurado no maior contêiner que não tem outro campo de texto
+        (o TextInputLayout do campo): mensagens de outros campos são ignoradas.
+
+        :param error_id: resource-id das mensagens de erro (ex.: textinput_error)
+        :param field_locators: Localizadores por ID dos campos
+        :return: Mensagens separadas por " | " ou string vazia se não houver erro
+        """
+        xpath = " | ".join(
+            f"//*[@resource-id='{locator}']/ancestor::*[count(.//android.widget.EditText) = 1][last()]"
+            f"//*[@resource-id='{error_id}']"
+            for _, locator in field_locators)
+        return " | ".join(text.strip() for text in self.get_texts(AppiumBy.XPATH, xpath))
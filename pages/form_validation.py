@@ -0,0 +1,197 @@
+from collections import namedtuple
+
+from selenium.common.exceptions import TimeoutException
+
+from pages.accounts_page import AccountsPage
+from pages.add_account_page import AddAccountPage
+from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.home_page import HomePage
+from pages.screen_graph import ScreenGraph
+from utils.reporting import run_report
+from utils.wait_engine import wait_engine
+
+# Caso da tabela de validação: valores que substituem os padrões do formulário e o resultado esperado.
+#   outcome="error":    o formulário continua aberto e exibe um erro contendo `error`
+#   outcome="blocked":  o registro não é salvo (com ou sem mensagem de erro)
+#   outcome="no_error": nenhuma mensagem de erro (contendo `error`, se informado) é exibida
+ValidationCase = namedtuple("ValidationCase", "case_id values outcome error", defaults=(None,))
+
+# Resultado de um caso: mensagem de erro exibida, se o formulário foi fechado (salvo)
+# e se o registro salvo aparece no destino
+CaseResult = namedtuple("CaseResult", "error saved persisted")
+
+OUTCOMES = ("error", "blocked", "no_error")
+
+
+class FormValidationEngine:
+    """
+    Executa uma tabela de casos de validação sobre um formulário aberto uma única vez.
+    Cada caso preenche os campos (valores padrão válidos + valores do caso), salva e aguarda
+    o resultado: o formulário fechar (registro salvo) ou um erro aparecer nos campos do próprio
+    caso. Se nada disso acontecer em `outcome_timeout`, o registro foi bloqueado sem mensagem.
+
+    O formulário só é reaberto quando um caso o fecha (registro salvo), falha no meio ou
+    altera um campo que ainda exibe o erro de um caso anterior: assim, o erro lido é sempre
+    o produzido pelo caso atual.
+    As ações sobre o formulário são injetáveis; ver account_form_engine e income_form_engine.
+    """
+
+    def __init__(self, open_form, close_form, fill, save, read_error, is_open, persisted=None, defaults=None,
+                 waits=wait_engine, outcome_timeout=3):
+        """
+        :param open_form: Abre o formulário a partir de qualquer tela
+        :param close_form: Fecha o formulário sem salvar
+        :param fill: Recebe o dicionário campo -> valor e preenche o formulário
+        :param save: Aciona o salvamento
+        :param read_error: Recebe os nomes dos campos e retorna o texto de erro exibido neles
+                           (string vazia se não houver)
+        :param is_open: Indica se o formulário continua na tela
+        :param persisted: Opcional; recebe os valores e indica se o registro salvo aparece no destino
+        :param defaults: Valores válidos usados nos campos não informados pelo caso
+        :param waits: WaitEngine usado para aguardar o resultado do salvamento
+        :param outcome_timeout: Espera máxima pelo resultado do salvamento (segundos)
+        """
+        self.open_form = open_form
+        self.close_form = close_form
+        self.fill = fill
+        self.save = save
+        self.read_error = read_error
+        self.is_open = is_open
+        self.persisted = persisted
+        self.defaults = dict(defaults or {})
+        self.waits = waits
+        self.outcome_timeout = outcome_timeout
+        self.results = {}
+        self.openings = 0
+        self._form_open = False
+        # Campos que podem exibir o erro de um caso anterior (desde a última abertura)
+        self._error_fields = set()
+
+    def run(self, case):
+        """
+        Executa o caso sobre o formulário (aberto apenas se necessário).
+
+        :return: CaseResult
+        """
+        if case.outcome not in OUTCOMES or (case.outcome == "error" and not case.error):
+            raise ValueError(f"Resultado esperado inválido em {case.case_id}: {case.outcome} {case.error!r}")
+        fields = sorted(case.values)
+        if self._form_open and self._error_fields.intersection(fields):
+            # O erro do caso anterior continua no campo e seria confundido com o deste caso
+            self.close_form()
+            self._form_open = False
+            run_report.incr("formulários reabertos (erro anterior no campo)")
+        if self._form_open:
+            run_report.incr("aberturas de formulário evitadas")
+        else:
+            self.open_form()
+            self.openings += 1
+            self._form_open = True
+            self._error_fields = set()
+
+        values = {**self.defaults, **case.values}
+        try:
+            self.fill(values)
+            self.save()
+            saved, error = self._outcome(fields)
+            persisted = saved and (self.persisted is None or self.persisted(values))
+        except Exception:
+            self._form_open = False
+            raise
+
+        self._form_open = not saved
+        if error:
+            self._error_fields.update(fields)
+        result = CaseResult(error, saved, persisted)
+        self.results[case.case_id] = result
+        return result
+
+    def _outcome(self, fields):
+        """
+        Aguarda o resultado do salvamento.
+
+        :param fields: Campos do caso; erros de outros campos não contam como resultado
+        :return: Tupla (saved, error)
+        """
+        def settled():
+            if not self.is_open():
+                return True, ""
+            error = self.read_error(fields)
+            return (False, error) if error else None
+
+        try:
+            return self.waits.until(settled, self.outcome_timeout)
+        except TimeoutException:
+            return False, ""  # formulário aberto e sem erro nos campos do caso: bloqueado sem mensagem
+
+    def check(self, case):
+        """
+        Executa o caso e compara com o resultado esperado.
+
+        :return: Mensagem de falha ou string vazia se o caso passou
+        """
+        result = self.run(case)
+        if case.outcome == "error":
+            if result.saved or case.error.lower() not in result.error.lower():
+                return (f"{case.case_id}: esperado erro contendo '{case.error}', obtido "
+                        f"{'registro salvo' if result.saved else repr(result.error or 'nenhum erro')}.")
+        elif case.outcome == "blocked":
+            if result.persisted:
+                return f"{case.case_id}: o formulário aceitou {case.values} e o registro foi salvo."
+        elif result.error and (case.error is None or case.error.lower() in result.error.lower()):
+            return f"{case.case_id}: erro inesperado '{result.error}' para {case.values}."
+        return ""
+
+
+def _is_screen(graph, screen):
+    try:
+        return graph.current_screen() == screen
+    except RuntimeError:
+        return False
+
+
+def account_form_engine(driver, defaults):
+    """
+    Motor de validação do formulário de nova conta (AddAccountPage).
+
+    :param defaults: Valores válidos dos campos "title" e "initial_sum"
+    """
+    page = AddAccountPage(driver)
+    graph = ScreenGraph(driver)
+    return FormValidationEngine(
+        open_form=lambda: graph.goto(AddAccountPage),
+        close_form=lambda: graph.goto(AccountsPage),
+        fill=lambda values: page.fill_account(values["title"], values["initial_sum"]),
+        save=page.save,
+        read_error=page.error_text,
+        is_open=lambda: _is_screen(graph, "add_account"),
+        persisted=lambda values: AccountsPage(driver).is_account_visible(values["title"]),
+        defaults=defaults,
+    )
+
+
+def income_form_engine(driver, account_name, defaults):
+    """
+    Motor de validação do formulário de Income (AddIncomeExpensePage).
+    A conta é selecionada uma única vez, ao abrir o formulário.
+
+    :param account_name: Conta existente vinculada aos registros
+    :param defaults: Valores válidos dos campos "price", "title" e "category"
+    """
+    page = AddIncomeExpensePage(driver)
+    graph = ScreenGraph(driver)
+
+    def open_form():
+        graph.goto(AddIncomeExpensePage)
+        page.select_account(account_name)
+
+    return FormValidationEngine(
+        open_form=open_form,
+        close_form=lambda: graph.goto(HomePage),
+        fill=lambda values: page.fill_record(price=values["price"], title=values["title"],
+                                             category=values["category"]),
+        save=page.save,
+        read_error=page.error_text,
+        is_open=lambda: _is_screen(graph, "add_record"),
+        defaults=defaults,
+    )
@@ -0,0 +1,100 @@
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from pages.accounts_page import AccountsPage
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from utils.command_trace import command_trace
+from utils.reporting import run_report
+
+PACKAGE = "com.blogspot.e_kanivets.moneytracker"
+
+
+class Navigator(BasePage):
+    """
+    Navegação direta entre as telas do aplicativo.
+    Abre a activity de destino com um intent ('mobile: startActivity'), sem passar
+    pelo menu lateral; se o intent for recusado (ex.: activity não exportada),
+    utiliza o menu lateral e deixa de tentar o intent para aquele destino.
+    Um intent aceito cuja activity não chega ao primeiro plano no prazo gera
+    TimeoutException, sem fallback: a tela atual não é necessariamente a que tem o menu.
+    O tempo de cada navegação entra no relatório, por teste.
+    """
+
+    # Activities do MoneyTracker (AndroidManifest do aplicativo)
+    _activities = {
+        "records": ".activity.record.MainActivity",
+        "accounts": ".activity.account.AccountsActivity",
+    }
+
+    # Destinos cujo intent foi recusado nesta execução
+    _intent_unavailable = set()
+
+    # Espera máxima (segundos) pela activity aberta por um intent aceito
+    activity_timeout = 5
+
+    # ---------------------- DESTINOS ----------------------
+
+    def to_records(self):
+        """
+        Abre a tela de registros (Records).
+        """
+        self._navigate("records", HomePage(self.driver).open_records)
+
+    def to_accounts(self):
+        """
+        Abre a lista de contas (Accounts).
+        """
+        def by_menu():
+            HomePage(self.driver).open_menu()
+            AccountsPage(self.driver).open_accounts()
+
+        self._navigate("accounts", by_menu)
+
+    def to_add_account(self):
+        """
+        Abre o formulário de nova conta a partir da lista de contas.
+        O formulário não é aberto diretamente por intent para que, ao salvar,
+        o app volte à lista de contas, como na navegação pelo menu.
+        """
+        self.to_accounts()
+        AccountsPage(self.driver).click_add_account()
+
+    # ---------------------- NAVEGAÇÃO ----------------------
+
+    def _navigate(self, destination, by_menu):
+        start = time.perf_counter()
+        if self._start_activity(destination):
+            method = "intent"
+        else:
+            by_menu()
+            method = "menu"
+        self.element_cache.clear()
+        self.invalidate_snapshot()
+
+        seconds = time.perf_counter() - start
+        run_report.add_timing(f"navegação: {destination} ({method})", seconds)
+        run_report.add_test_metric(command_trace.current_test, "navegação", seconds)
+
+    def _start_activity(self, destination):
+        """
+        Tenta abrir a activity do destino por intent e aguarda que ela chegue ao primeiro plano.
+
+        :return: True se a activity de destino está em primeiro plano; False se o intent foi recusado
+        :raises TimeoutException: se o intent foi aceito, mas a activity não apareceu no prazo
+        """
+        if destination in self._intent_unavailable:
+            return False
+        activity = self._activities[destination]
+        try:
+            self.driver.execute_script("mobile: startActivity", {"intent": f"{PACKAGE}/{activity}", "wait": True})
+        except WebDriverException:
+            run_report.incr("intents recusados (menu lateral)")
+            Navigator._intent_unavailable.add(destination)
+            return False
+
+        name = activity.rsplit(".", 1)[-1]
+        self.waits.until(lambda: (self.driver.current_activity or "").endswith(name), self.activity_timeout,
+                         f"Activity '{name}' não chegou ao primeiro plano após o intent.")
+        return True
@@ -1,5 +1,15 @@
+import re
+from collections import namedtuple
+
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import TimeoutException
+
 from pages.base_page import BasePage
+from utils.ledger_verifier import reconcile, summary_from_records, summary_from_snapshot
+from utils.reporting import run_report
+
+# Registro exibido na lista de Records (textos como aparecem na tela; date é None se a linha não exibir data)
+Record = namedtuple("Record", "title category price date")
 
 class RecordsPage(BasePage):
     """
@@ -7,6 +17,11 @@ class RecordsPage(BasePage):
     Contém os elementos, ações e validações relacionadas a registros de receitas e despesas.
     """
 
+    # Settings do UiAutomator2: a lista de registros é uma hierarquia profunda, então as consultas
+    # não esperam ociosidade e limitam a profundidade do dump. ignoreUnimportantViews fica desligado:
+    # ele pode omitir os LinearLayouts de cada linha, pelos quais _parse_rows agrupa os campos
+    settings_profile = {"waitForIdleTimeout": 100, "snapshotMaxDepth": 40}
+
     # ---------------------- ELEMENTOS DA TELA ----------------------
 
     # Acesso ao menu "Records" no menu lateral
@@ -17,6 +32,17 @@ class RecordsPage(BasePage):
     _record_price_xpath = ("//android.widget.TextView[@resource-id="
                            "'com.blogspot.e_kanivets.moneytracker:id/tvPrice' and contains(@text,'{}')]")
 
+    # Volta a lista ao início com um único comando (sem efeito se ela já está no topo)
+    _rewind_selector = "new UiScrollable(new UiSelector().scrollable(true)).flingToBeginning(50)"
+
+    # Campos de cada linha da lista de registros
+    _row_ids = {
+        "title": "com.blogspot.e_kanivets.moneytracker:id/tvTitle",
+        "category": "com.blogspot.e_kanivets.moneytracker:id/tvCategory",
+        "price": "com.blogspot.e_kanivets.moneytracker:id/tvPrice",
+        "date": "com.blogspot.e_kanivets.moneytracker:id/tvDate",
+    }
+
     # Elementos ao abrir os detalhes de um registro
     _edit_button = (AppiumBy.ID, "com.blogspot.e_kanivets.moneytracker:id/ivEdit")
     _edit_price_field = (AppiumBy.ID, "com.blogspot.e_kanivets.moneytracker:id/etPrice")
@@ -52,9 +78,7 @@ class RecordsPage(BasePage):
 
         :param new_price: novo valor a ser inserido
         """
-        field = self.find(*self._edit_price_field)
-        field.clear()
-        field.send_keys(new_price)
+        self.send_keys(*self._edit_price_field, text=new_price)
 
     def save_edit(self):
         """
@@ -74,14 +98,18 @@ class RecordsPage(BasePage):
 
     def delete_first_record(self):
         """
-        Abre o primeiro registro da lista e realiza a exclusão.
+        Abre o primeiro registro visível da lista e realiza a exclusão.
+        Aguarda a lista exibir a primeira linha (ver _iter_rows); a linha é localizada
+        no mesmo dump usado para ler a lista e aberta por toque nas suas coordenadas,
+        sem uma nova busca por XPath.
         """
-        first_record = (
-            AppiumBy.XPATH,
-            "//android.widget.LinearLayout[@resource-id='com.blogspot.e_kanivets.moneytracker:id/container']"
-            "/android.widget.LinearLayout[1]"
-        )
-        self.click(*first_record)
+        first = next(self._iter_rows(), None)
+        if first is None:
+            raise AssertionError("Nenhum registro na lista para excluir.")
+        left, top, right, bottom = first[1]
+        self.driver.execute_script("mobile: clickGesture", {"x": (left + right) // 2, "y": (top + bottom) // 2})
+        self.element_cache.clear()
+        self.invalidate_snapshot()
 
         delete_button = (
             AppiumBy.XPATH,
@@ -89,21 +117,204 @@ class RecordsPage(BasePage):
         )
         self.click(*delete_button)
 
+    # ---------------------- LEITURA DA LISTA ----------------------
+
+    def iter_records(self, max_scrolls=None):
+        """
+        Percorre a lista de registros do início ao fim, rolando-a conforme os registros
+        são consumidos. A lista é levada ao topo antes da primeira leitura, de modo que
+        chamadas seguidas leem a lista completa. Cada tela da lista custa um único dump
+        da hierarquia; as linhas já lidas são descartadas pela posição (bounds) e não pelo
+        conteúdo, então registros idênticos são todos contados. A rolagem para assim que
+        quem consome o gerador deixa de pedir registros.
+
+            for record in records.iter_records():
+                if record.title == "Salário":
+                    break
+
+        :param max_scrolls: Limite opcional de rolagens
+        :return: Gerador de Record(title, category, price, date)
+        """
+        for record, _ in self._iter_rows(max_scrolls):
+            yield record
+
+    def _iter_rows(self, max_scrolls=None):
+        """
+        Cada rolagem arrasta a lista até a última linha lida (âncora) ficar na segunda
+        posição da tela. Na tela seguinte, a âncora é localizada pelo deslocamento: a linha
+        com o mesmo conteúdo cuja posição, somada à distância percorrida, faz as linhas acima
+        dela coincidirem com as da tela anterior; só as linhas abaixo dela são novas.
+        A leitura termina quando uma rolagem não move mais a lista.
+
+        O primeiro dump aguarda (timeout do motor de espera) a lista exibir ao menos uma linha,
+        já que ela pode ainda não ter sido renderizada (ex.: logo após salvar um registro);
+        uma lista que continua vazia após o prazo não produz linhas.
+        """
+        self.driver.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, self._rewind_selector)
+        try:
+            snapshot, rows = self.waits.until(self._first_screen, message="A lista de registros não exibiu linhas.")
+        except TimeoutException:
+            return
+        previous, shift, scrolls = None, 0, 0
+        while True:
+            if previous is not None:
+                self.invalidate_snapshot()
+                snapshot = self.snapshot()
+                rows = self._parse_rows(snapshot)
+            if previous is not None and rows == previous:
+                return  # a rolagem não moveu a lista
+            yield from rows if previous is None else rows[self._after_anchor(previous, rows, shift):]
+            previous = rows
+
+            scrollable = self._scrollable_bounds(snapshot)
+            if scrollable is None or not rows or (max_scrolls is not None and scrolls >= max_scrolls):
+                return
+            left, top, right, _ = scrollable
+            _, (_, anchor_top, _, anchor_bottom) = rows[-1]
+            height = anchor_bottom - anchor_top
+            start_y = anchor_top + height // 2
+            if self._is_periodic(rows):
+                # As duas últimas linhas se repetem na tela (ex.: registros idênticos): com um passo
+                # menor que uma linha, a posição da âncora na tela seguinte não é ambígua
+                end_y = start_y - height // 3
+            else:
+                # Leva a âncora ao centro da segunda posição da lista
+                end_y = min(top + height + height // 2, start_y - height // 3)
+            shift = start_y - end_y
+            self.driver.execute_script("mobile: dragGesture", {
+                "startX": (left + right) // 2, "startY": start_y, "endX": (left + right) // 2, "endY": end_y,
+            })
+            scrolls += 1
+            self.element_cache.clear()
+
+    def _first_screen(self):
+        """
+        :return: Tupla (snapshot, linhas) da tela atual ou None se nenhuma linha é exibida
+        """
+        self.invalidate_snapshot()
+        snapshot = self.snapshot()
+        rows = self._parse_rows(snapshot)
+        return (snapshot, rows) if rows else None
+
+    @staticmethod
+    def _is_periodic(rows):
+        """Indica se o par formado pelas duas últimas linhas aparece antes na mesma tela."""
+        contents = [record for record, _ in rows]
+        tail = contents[-2:]
+        return any(contents[index:index + len(tail)] == tail for index in range(len(contents) - len(tail)))
+
+    @staticmethod
+    def _after_anchor(previous, rows, shift):
+        """
+        Índice da primeira linha nova da tela atual.
+
+        :param previous: Linhas da tela anterior; a última é a âncora
+        :param shift: Distância (px) arrastada desde a tela anterior
+        """
+        anchor, (_, old_top, _, old_bottom) = previous[-1]
+        # Folga do gesto (touch slop) tolerada ao comparar posições
+        tolerance = max(1, (old_bottom - old_top) // 4)
+
+        def aligned(index):
+            # Com o deslocamento implicado pela âncora candidata, cada linha acima dela
+            # precisa estar na tela anterior, com o mesmo conteúdo, na posição correspondente
+            moved = old_top - rows[index][1][1]
+            return all(any(record == other and abs(bounds[1] + moved - other_bounds[1]) <= tolerance
+                           for other, other_bounds in previous)
+                       for record, bounds in rows[:index])
+
+        # A lista anda no máximo a distância arrastada (menos no fim da lista) e nunca para trás
+        expected = old_top - shift
+        candidates = sorted((abs(bounds[1] - expected), index) for index, (record, bounds) in enumerate(rows)
+                            if record == anchor and expected - tolerance <= bounds[1] <= old_top + tolerance)
+        for _, index in candidates:
+            if aligned(index):
+                return index + 1
+
+        # Âncora perdida: a lista andou mais que o arraste (ex.: fling). Descarta as linhas do início
+        # da tela que repetem o fim da anterior; aqui registros idênticos nessa junção são contados uma vez
+        run_report.incr("registros: âncora perdida na rolagem")
+        shown = [record for record, _ in rows]
+        seen = [record for record, _ in previous]
+        for size in range(min(len(seen), len(shown)), 0, -1):
+            if seen[-size:] == shown[:size]:
+                return size
+        return 0
+
+    def _parse_rows(self, snapshot):
+        """
+        Linhas completas (com título e valor) da tela atual, na ordem da lista.
+
+        :return: Lista de (Record, bounds da linha)
+        """
+        rows = []
+        for title_node in snapshot.find_all(AppiumBy.ID, self._row_ids["title"]):
+            row = title_node.getparent()
+            while row is not None and self._field(row, "price") is None:
+                row = row.getparent()
+            if row is None or sum(1 for _ in self._nodes(row, "title")) > 1:
+                # Linha cortada na borda da tela: o valor encontrado pertence a outra linha
+                continue
+            record = Record(
+                title=title_node.get("text", ""),
+                category=self._field(row, "category"),
+                price=self._field(row, "price"),
+                date=self._field(row, "date"),
+            )
+            rows.append((record, _bounds(row)))
+        return rows
+
+    def _nodes(self, row, name):
+        return (node for node in row.iter() if node.get("resource-id") == self._row_ids[name])
+
+    def _field(self, row, name):
+        node = next(self._nodes(row, name), None)
+        return None if node is None else node.get("text", "")
+
+    @staticmethod
+    def _scrollable_bounds(snapshot):
+        for node in snapshot.root.iter():
+            if node.get("scrollable") == "true" and node.get("bounds"):
+                return _bounds(node)
+        return None
+
     # ---------------------- VALIDAÇÕES ----------------------
 
     def is_record_visible(self, title, price=None):
         """
-        Verifica se um registro está visível na lista.
+        Verifica se um registro está na lista, lida desde o início e rolada apenas até encontrá-lo.
 
         :param title: título do registro
-        :param price: valor opcional para validação adicional
+        :param price: valor opcional para validação adicional (contido no texto do valor)
         :return: True se encontrado, False caso contrário
         """
-        title_ok = self.is_element_present(AppiumBy.XPATH, self._record_title_xpath.format(title))
-        if price:
-            price_ok = self.is_element_present(AppiumBy.XPATH, self._record_price_xpath.format(price))
-            return title_ok and price_ok
-        return title_ok
+        return any(record.title == title and (not price or price in record.price)
+                   for record in self.iter_records())
+
+    def count_records_by_title(self, title):
+        """
+        Conta quantos registros da lista completa possuem o título informado.
+        """
+        return sum(1 for record in self.iter_records() if record.title == title)
+
+    def totals_diff(self, expected, streamed=False):
+        """
+        Confere os totais do extrato exibido contra os esperados em uma única passada.
+
+            diff = records.totals_diff(expected_summary(criados))
+            assert not diff, diff
+
+        :param expected: LedgerSummary esperado (ver expected_summary e summary_from_totals em utils.ledger_verifier)
+        :param streamed: False lê apenas a tela atual (um único page_source);
+                         True percorre a lista completa com iter_records()
+        :return: Mensagem em formato de diff ou string vazia se os totais conferem
+        """
+        if streamed:
+            actual = summary_from_records(self.iter_records())
+        else:
+            with self.snapshot_mode():
+                actual = summary_from_snapshot(self.snapshot())
+        return reconcile(actual, expected)
 
     def is_record_updated(self, new_price):
         """
@@ -141,3 +352,9 @@ class RecordsPage(BasePage):
             return self.is_element_displayed(AppiumBy.XPATH, xpath)
         except Exception:
             return False
+
+
+def _bounds(node):
+    """Coordenadas (left, top, right, bottom) do atributo 'bounds' de um nó ("[l,t][r,b]")."""
+    values = [int(value) for value in re.findall(r"-?\d+", node.get("bounds") or "")]
+    return tuple(values) if len(values) == 4 else (0, 0, 0, 0)
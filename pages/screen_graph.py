@@ -0,0 +1,242 @@
+import heapq
+import time
+from collections import defaultdict, deque, namedtuple
+
+from selenium.common.exceptions import TimeoutException
+
+from pages.accounts_page import AccountsPage
+from pages.add_account_page import AddAccountPage
+from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.home_page import HomePage
+from pages.navigator import Navigator
+from pages.records_page import RecordsPage
+from utils.command_trace import command_trace
+from utils.reporting import run_report
+
+# Transição entre duas telas; method indica como ela é feita (intent, menu, back ou click)
+Edge = namedtuple("Edge", "origin destination method")
+
+# Transições conhecidas do aplicativo.
+# Intents só levam a telas que ainda não estão na pilha: abrir por intent uma activity que já
+# está abaixo da atual cria outra instância dela, e os back() seguintes voltariam à tela errada.
+EDGES = (
+    Edge("home", "accounts", "intent"),
+    Edge("home", "accounts", "menu"),
+    Edge("home", "add_record", "click"),
+    Edge("accounts", "home", "back"),
+    Edge("accounts", "add_account", "click"),
+    Edge("add_account", "accounts", "back"),
+    Edge("add_record", "home", "back"),
+)
+
+
+def edge_key(edge):
+    """Chave única de uma transição para fins de custo."""
+    return f"{edge.origin}->{edge.destination} ({edge.method})"
+
+
+class EdgeCosts:
+    """
+    Custo de cada transição entre telas, aprendido com os tempos medidos em execuções
+    anteriores. O custo é a mediana das amostras; transições sem histórico usam uma
+    estimativa inicial pelo tipo da transição.
+    """
+
+    DEFAULTS = {"intent": 1.5, "menu": 2.5, "back": 0.8, "click": 1.2}
+
+    def __init__(self, history=20):
+        """
+        :param history: Quantidade de amostras mantidas por transição
+        """
+        self.history = history
+        self._samples = defaultdict(lambda: deque(maxlen=self.history))
+
+    def cost(self, edge):
+        """
+        :return: Custo estimado da transição (segundos)
+        """
+        samples = sorted(self._samples.get(edge_key(edge), ()))
+        if not samples:
+            return self.DEFAULTS[edge.method]
+        return samples[len(samples) // 2]
+
+    def record(self, edge, seconds):
+        """Registra o tempo que a transição levou."""
+        self._samples[edge_key(edge)].append(seconds)
+
+    def load(self, data):
+        """Carrega amostras persistidas (dicionário transição -> lista de segundos)."""
+        for key, samples in (data or {}).items():
+            self._samples[key].extend(samples)
+
+    def dump(self):
+        """Exporta as amostras em formato serializável em JSON."""
+        return {key: list(samples) for key, samples in self._samples.items()}
+
+
+class ScreenGraph(Navigator):
+    """
+    Modelo das telas do aplicativo como um grafo, com o custo de cada transição
+    medido nas execuções. goto() identifica a tela atual com uma única consulta
+    (current_activity) e percorre o caminho de menor custo até a tela desejada.
+    A tela é conferida após cada transição (o intent já confirma a activity aberta);
+    se uma transição não levar à tela esperada (ex.: intent recusado, back perdido),
+    o caminho é recalculado a partir da tela em que o app realmente está.
+
+    Home e Records são a mesma activity (MainActivity) e, portanto, o mesmo nó do grafo.
+    O formulário de registro é aberto pelo botão de Income; para Expense, use
+    goto(HomePage) seguido de click_add_expense().
+    """
+
+    # Nó do grafo de cada Page Object
+    _screens = {
+        HomePage: "home",
+        RecordsPage: "home",
+        AccountsPage: "accounts",
+        AddAccountPage: "add_account",
+        AddIncomeExpensePage: "add_record",
+    }
+
+    # Activity de cada nó (AndroidManifest do aplicativo)
+    _screen_activities = {
+        "home": "MainActivity",
+        "accounts": "AccountsActivity",
+        "add_account": "AddAccountActivity",
+        "add_record": "AddRecordActivity",
+    }
+
+    # Destino do Navigator usado pelas transições por intent
+    _intent_destinations = {"accounts": "accounts"}
+
+    def __init__(self, driver, costs=None, clock=time.perf_counter, max_replans=2):
+        """
+        :param costs: EdgeCosts compartilhado; por padrão, o da execução (edge_costs)
+        :param max_replans: Quantas vezes o caminho pode ser recalculado após uma transição falhar
+        """
+        super().__init__(driver)
+        self.costs = costs or edge_costs
+        self._clock = clock
+        self.max_replans = max_replans
+
+    # ---------------------- API ----------------------
+
+    def goto(self, page_class):
+        """
+        Leva o aplicativo até a tela do Page Object informado.
+
+        :param page_class: Classe do Page Object de destino (ex.: AccountsPage)
+        :return: Instância do Page Object de destino
+        """
+        target = self._screens[page_class]
+        start = self._clock()
+        current = self.current_screen()
+
+        for _ in range(self.max_replans + 1):
+            for edge in self.plan(current, target):
+                current = self._take(edge)
+                if current != edge.destination:
+                    break
+            if current == target:
+                break
+        else:
+            raise RuntimeError(f"Não foi possível chegar à tela '{target}' (tela atual: '{current}').")
+
+        self.element_cache.clear()
+        self.invalidate_snapshot()
+        seconds = self._clock() - start
+        run_report.add_timing(f"navegação: goto {target}", seconds)
+        run_report.add_test_metric(command_trace.current_test, "navegação", seconds)
+        return page_class(self.driver)
+
+    def current_screen(self):
+        """
+        Identifica a tela atual pela activity em primeiro plano (um único comando).
+
+        :return: Nome do nó da tela atual
+        """
+        activity = self.driver.current_activity or ""
+        for screen, name in self._screen_activities.items():
+            if activity.endswith(name):
+                return screen
+        raise RuntimeError(f"Tela atual não reconhecida: '{activity}'.")
+
+    def plan(self, origin, target):
+        """
+        Caminho de menor custo entre duas telas (Dijkstra sobre as transições disponíveis).
+
+        :return: Lista de transições (vazia se origem e destino coincidem)
+        """
+        queue = [(0.0, 0, origin, [])]
+        visited = set()
+        counter = 1
+        while queue:
+            cost, _, screen, path = heapq.heappop(queue)
+            if screen == target:
+                return path
+            if screen in visited:
+                continue
+            visited.add(screen)
+            for edge in self._available_edges(screen):
+                if edge.destination not in visited:
+                    heapq.heappush(queue, (cost + self.costs.cost(edge), counter, edge.destination, path + [edge]))
+                    counter += 1
+        raise RuntimeError(f"Nenhum caminho entre as telas '{origin}' e '{target}'.")
+
+    # ---------------------- TRANSIÇÕES ----------------------
+
+    def _available_edges(self, screen):
+        for edge in EDGES:
+            if edge.origin != screen:
+                continue
+            if edge.method == "intent" and self._intent_destinations[edge.destination] in self._intent_unavailable:
+                continue
+            yield edge
+
+    def _take(self, edge):
+        """
+        Executa a transição, confere a tela alcançada e registra o tempo das transições bem-sucedidas.
+
+        :return: Nome do nó da tela em que o app ficou (edge.destination se a transição funcionou)
+        """
+        start = self._clock()
+        if edge.method == "intent":
+            try:
+                arrived = self._start_activity(self._intent_destinations[edge.destination])
+            except TimeoutException:
+                arrived = False
+        else:
+            if edge.method == "menu":
+                HomePage(self.driver).open_menu()
+                AccountsPage(self.driver).open_accounts()
+            elif edge.method == "back":
+                self.back()
+            elif edge.destination == "add_account":
+                AccountsPage(self.driver).click_add_account()
+            else:
+                AddIncomeExpensePage(self.driver).click_add_income()
+            arrived = self._wait_for_screen(edge.destination)
+        self.element_cache.clear()
+        self.invalidate_snapshot()
+
+        if not arrived:
+            run_report.incr("navegação: transições replanejadas")
+            return self.current_screen()
+        seconds = self._clock() - start
+        self.costs.record(edge, seconds)
+        run_report.add_timing(f"navegação: {edge_key(edge)}", seconds)
+        return edge.destination
+
+    def _wait_for_screen(self, screen):
+        """
+        Aguarda a activity da tela chegar ao primeiro plano.
+
+        :return: False se ela não apareceu no prazo (activity_timeout)
+        """
+        try:
+            return self.waits.until(lambda: self.current_screen() == screen, self.activity_timeout)
+        except (TimeoutException, RuntimeError):
+            return False
+
+
+# Custos de transição compartilhados pela execução (persistidos em config.cache)
+edge_costs = EdgeCosts()
@@ -1,8 +1,37 @@
 import pytest
 from data.data import AccountData
-from pages.home_page import HomePage
 from pages.accounts_page import AccountsPage
 from pages.add_account_page import AddAccountPage
+from pages.form_validation import ValidationCase, account_form_engine
+from pages.navigator import Navigator
+
+# Casos de validação do formulário de conta (valores diferentes dos padrões válidos -> resultado esperado)
+ACCOUNT_VALIDATION_CASES = [
+    # TC02 - Campo 'Name' vazio: mensagem de campo obrigatório
+    ValidationCase("TC02", {"title": AccountData.EMPTY_ACCOUNT_NAME}, "error", "Field can't be empty"),
+    # TC03 - Campo 'Initial Sum' vazio: mensagem de campo obrigatório
+    ValidationCase("TC03", {"initial_sum": AccountData.EMPTY_ACCOUNT_VALUE}, "error", "Field can't be empty"),
+    # TC04 - Nome contendo números: conta não pode ser criada
+    ValidationCase("TC04", {"title": AccountData.NAME_ONLY_LETTERS_ALLOWED}, "blocked"),
+    # TC05 - Nome com mais de 20 caracteres: conta não pode ser criada
+    ValidationCase("TC05", {"title": AccountData.VALUE_EXCEEDS_20CHARACTERS}, "blocked"),
+    # TC06 - Letras no campo 'Initial Sum': conta não pode ser criada
+    ValidationCase("TC06", {"initial_sum": AccountData.INVALID_ACCOUNT_VALUE}, "blocked"),
+    # TC07 - Valor com mais de 13 dígitos: conta não pode ser criada
+    ValidationCase("TC07", {"initial_sum": AccountData.VALUE_EXCEEDS_13CHARACTERS}, "blocked"),
+]
+
+
+@pytest.fixture(scope="class")
+def account_form(class_setup, request):
+    """
+    Formulário de nova conta aberto uma única vez para todos os casos da tabela.
+    """
+    return account_form_engine(request.cls.driver, {
+        "title": AccountData.VALID_ACCOUNT_NAME,
+        "initial_sum": AccountData.VALID_ACCOUNT_VALUE,
+    })
+
 
 @pytest.mark.usefixtures("setup")
 class TestAddAccount:
@@ -16,167 +45,27 @@ class TestAddAccount:
         Cenário: Cadastro de conta com dados válidos.
         Resultado esperado: Conta deve ser exibida na lista após a criação.
         """
-        home = HomePage(self.driver)
         accounts = AccountsPage(self.driver)
         add_page = AddAccountPage(self.driver)
+        navigator = Navigator(self.driver)
 
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
+        navigator.to_add_account()
         add_page.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
 
         assert accounts.is_account_visible(AccountData.VALID_ACCOUNT_NAME), \
             "Conta válida não foi criada corretamente."
 
-    def test_tc02_add_account_empty_title(self):
-        """
-        Cenário: Tentativa de cadastrar conta com campo 'Name' vazio.
-        Resultado esperado: Aplicação deve exibir mensagem de erro.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_page = AddAccountPage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_page.add_account(AccountData.EMPTY_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-
-        assert add_page.is_error_message_displayed("Field can't be empty"), \
-            "Aplicação não exibiu mensagem de erro ao salvar conta sem título."
-
-    def test_tc03_add_account_empty_value(self):
-        """
-        Cenário: Tentativa de cadastrar conta com campo 'Initial Sum' vazio.
-        Resultado esperado: Aplicação deve exibir mensagem de erro.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_page = AddAccountPage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_page.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.EMPTY_ACCOUNT_VALUE)
-
-        assert add_page.is_error_message_displayed("Field can't be empty"), \
-            "Aplicação não exibiu erro ao tentar salvar conta com valor vazio."
-
-    def test_tc04_add_account_title_with_numbers(self):
-        """
-        Cenário: Tentativa de cadastrar conta com nome contendo números.
-        Resultado esperado: Aplicação deve exibir erro ou impedir a criação.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_page = AddAccountPage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-
-        invalid_title = AccountData.NAME_ONLY_LETTERS_ALLOWED
-
-        add_page.add_account(invalid_title, AccountData.VALID_ACCOUNT_VALUE)
-
-        # Verificação se o erro foi exibido ou registro foi bloqueado
-        if add_page.is_error_message_displayed("letters") or \
-           add_page.is_error_message_displayed("invalid") or \
-           add_page.is_error_message_displayed("only") or \
-           add_page.is_error_message_displayed("Field"):
-            return
-
-        if not accounts.is_account_visible(invalid_title):
-            return
-
-        pytest.fail("Aplicação permitiu criação de conta com números no nome, violando as regras de validação.")
-
-    def test_tc05_add_account_title_exceeds_20_chars(self):
-        """
-        Cenário: Tentativa de cadastrar conta com nome superior a 20 caracteres.
-        Resultado esperado: Sistema deve exibir erro ou impedir o registro.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_page = AddAccountPage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-
-        long_title = AccountData.VALUE_EXCEEDS_20CHARACTERS
-
-        add_page.add_account(long_title, AccountData.VALID_ACCOUNT_VALUE)
-
-        # Caso o sistema exiba mensagem de erro
-        if add_page.is_error_message_displayed("Field") or \
-           add_page.is_error_message_displayed("long") or \
-           add_page.is_error_message_displayed("20"):
-            return
-
-        # Caso o sistema apenas não salve a conta
-        if not accounts.is_account_visible(long_title):
-            return
-
-        pytest.fail("Aplicação permitiu salvar conta com título superior a 20 caracteres.")
-
-    def test_tc06_add_account_initial_sum_with_letters(self):
-        """
-        Cenário: Inserção de letras no campo 'Initial Sum'.
-        Resultado esperado: Sistema deve impedir o cadastro ou exibir erro.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_page = AddAccountPage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_page.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.INVALID_ACCOUNT_VALUE)
-
-        assert add_page.is_error_message_displayed("Field") or \
-               not accounts.is_account_visible(AccountData.VALID_ACCOUNT_NAME), \
-               "Aplicação aceitou letras no campo 'Initial Sum'."
-
-    def test_tc07_add_account_value_exceeds_13_digits(self):
-        """
-        Cenário: Inserção de valor superior a 13 dígitos no campo 'Initial Sum'.
-        Resultado esperado: Aplicação deve exibir erro ou impedir a criação.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_page = AddAccountPage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-
-        try:
-            add_page.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALUE_EXCEEDS_13CHARACTERS)
-        except Exception:
-            pytest.fail("Aplicação apresentou erro inesperado ao inserir valor com mais de 13 dígitos.")
-
-        if add_page.is_error_message_displayed("You can't be so rich or so poor"):
-            return
-
-        if not accounts.is_account_visible(AccountData.VALID_ACCOUNT_NAME):
-            return
-
-        pytest.fail("Aplicação permitiu salvar conta com valor superior a 13 dígitos.")
-
     def test_tc08_add_duplicate_account(self):
         """
         Cenário: Tentativa de cadastrar uma conta com nome já existente.
         Resultado esperado: Aplicação deve emitir alerta de duplicidade ou impedir o registro.
         """
-        home = HomePage(self.driver)
         accounts = AccountsPage(self.driver)
         add_page = AddAccountPage(self.driver)
+        navigator = Navigator(self.driver)
 
         # Primeira criação da conta
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
+        navigator.to_add_account()
         add_page.add_account(AccountData.DUPLICATE_ACCOUNT_NAME_VALUE, AccountData.VALID_ACCOUNT_VALUE)
 
         assert accounts.is_account_visible(AccountData.DUPLICATE_ACCOUNT_NAME_VALUE), \
@@ -194,3 +83,17 @@ class TestAddAccount:
             return
 
         pytest.fail(f"Aplicação permitiu criação de contas duplicadas. Quantidade encontrada: {duplicate_count}.")
+
+
+@pytest.mark.usefixtures("class_setup")
+class TestAddAccountValidation:
+    """
+    Validações do formulário de conta (TC02 a TC07) executadas sobre um único formulário aberto:
+    o app é preparado e o formulário é aberto uma vez; cada caso apenas preenche, salva e lê o erro.
+    Cada caso é reportado como um resultado próprio do pytest.
+    """
+
+    @pytest.mark.parametrize("case", ACCOUNT_VALIDATION_CASES, ids=lambda case: case.case_id)
+    def test_account_form_validation(self, account_form, case):
+        failure = account_form.check(case)
+        assert not failure, failure
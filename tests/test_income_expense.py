@@ -1,12 +1,37 @@
 import pytest
-import time
 from data.data import AccountData, IncomeExpenseData
 from pages.home_page import HomePage
-from pages.accounts_page import AccountsPage
-from pages.add_account_page import AddAccountPage
 from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.form_validation import ValidationCase, income_form_engine
 from appium.webdriver.common.appiumby import AppiumBy
 
+# Casos de validação do formulário de Income (valores diferentes dos padrões válidos -> resultado esperado)
+INCOME_VALIDATION_CASES = [
+    # TC11 - Sem preço: cadastro bloqueado com mensagem de campo obrigatório
+    ValidationCase("TC11", {"price": IncomeExpenseData.EMPTY_PRICE}, "error", "Field"),
+    # TC12 - Sem título: o app salva o registro sem exibir erro
+    ValidationCase("TC12", {"title": ""}, "no_error", "Field"),
+    # TC13 - Sem categoria: cadastro bloqueado com mensagem de campo obrigatório
+    ValidationCase("TC13", {"category": ""}, "error", "Field"),
+]
+
+
+@pytest.fixture(scope="class")
+def income_form(class_setup, request, seeder):
+    """
+    Formulário de Income aberto uma única vez para todos os casos da tabela.
+    A conta vinculada é gravada no banco do app uma vez, antes do primeiro caso.
+    """
+    driver = request.cls.driver
+    with seeder.seeding(driver) as db:
+        db.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
+    return income_form_engine(driver, AccountData.VALID_ACCOUNT_NAME, {
+        "price": IncomeExpenseData.VALID_INCOME_PRICE,
+        "title": IncomeExpenseData.VALID_INCOME_TITLE,
+        "category": IncomeExpenseData.VALID_INCOME_CATEGORY,
+    })
+
+
 @pytest.mark.usefixtures("setup")
 class TestIncomeExpense:
     """
@@ -14,175 +39,70 @@ class TestIncomeExpense:
     e despesas (Expense) no aplicativo MoneyTracker.
     """
 
-    def test_tc09_add_valid_income(self):
+    def test_tc09_add_valid_income(self, account):
         """
         TC09 - Verifica se é possível adicionar um Income válido com todos os campos obrigatórios preenchidos.
         """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
 
-        # Criação de conta para vincular o Income
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-
-        assert accounts.is_account_visible(AccountData.VALID_ACCOUNT_NAME), \
-            "Erro: Conta válida não foi criada para cadastro de Income."
-
-        self.driver.back()
+        # Conta para vincular o Income, gravada direto no banco do app
+        account()
 
         # Abertura da tela de Income e preenchimento dos campos
         add_income.click_add_income()
-        add_income.fill_price(IncomeExpenseData.VALID_INCOME_PRICE)
-        add_income.fill_title(IncomeExpenseData.VALID_INCOME_TITLE)
-        add_income.fill_category(IncomeExpenseData.VALID_INCOME_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.VALID_INCOME_PRICE,
+            title=IncomeExpenseData.VALID_INCOME_TITLE,
+            category=IncomeExpenseData.VALID_INCOME_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         # Validação do registro
         assert add_income.is_income_visible(IncomeExpenseData.VALID_INCOME_TITLE), \
             "Erro: Income não foi exibido na lista de registros."
 
-    def test_tc10_add_valid_expense(self):
+    def test_tc10_add_valid_expense(self, account):
         """
         TC10 - Verifica se é possível adicionar um Expense válido com todos os campos obrigatórios preenchidos.
         """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
 
-        # Criação de conta
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-
-        assert accounts.is_account_visible(AccountData.VALID_ACCOUNT_NAME), \
-            "Conta não foi criada para adicionar Expense."
-
-        self.driver.back()
+        # Conta gravada direto no banco do app
+        account()
 
         # Abertura da tela de Expense e preenchimento
         add_income.click_add_expense()
-        time.sleep(0.5)
-        add_income.fill_price(IncomeExpenseData.VALID_EXPENSE_PRICE)
-        add_income.fill_title(IncomeExpenseData.VALID_EXPENSE_TITLE)
-        add_income.fill_category(IncomeExpenseData.VALID_EXPENSE_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.wait_until_stable()
+        add_income.fill_record(
+            price=IncomeExpenseData.VALID_EXPENSE_PRICE,
+            title=IncomeExpenseData.VALID_EXPENSE_TITLE,
+            category=IncomeExpenseData.VALID_EXPENSE_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         assert add_income.is_income_visible(IncomeExpenseData.VALID_EXPENSE_TITLE), \
             "Expense não apareceu na lista de registros."
 
-    def test_tc11_add_income_without_price(self):
-        """
-        TC11 - Valida que o aplicativo bloqueia o cadastro de Income sem o preenchimento do preço.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
-        add_income = AddIncomeExpensePage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-
-        self.driver.back()
-
-        add_income.click_add_income()
-        time.sleep(0.5)
-
-        add_income.fill_title(IncomeExpenseData.VALID_INCOME_TITLE)
-        add_income.fill_category(IncomeExpenseData.VALID_INCOME_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
-        add_income.save()
-
-        assert add_income.is_error_message_displayed("Field"), \
-            "Erro: App permitiu salvar Income sem preencher o campo Price."
-
-    def test_tc12_add_income_without_title(self):
-        """
-        TC12 - Verifica se o aplicativo permite indevidamente salvar um Income sem título.
-        Caso o teste falhe, indica possível falha de validação no aplicativo.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
-        add_income = AddIncomeExpensePage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-
-        self.driver.back()
-
-        add_income.click_add_income()
-        time.sleep(0.5)
-
-        add_income.fill_price(IncomeExpenseData.VALID_INCOME_PRICE)
-        add_income.fill_category(IncomeExpenseData.VALID_INCOME_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
-        add_income.save()
-
-        error_present = add_income.is_error_message_displayed("Field")
-
-        assert not error_present, \
-            "BUG: O aplicativo deveria impedir salvar Income sem título, mas salvou com sucesso."
-
-    def test_tc13_add_income_without_category(self):
-        """
-        TC13 - Garante que o sistema bloqueia o cadastro de um Income sem categoria definida.
-        """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
-        add_income = AddIncomeExpensePage(self.driver)
-
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-        self.driver.back()
-
-        add_income.click_add_income()
-        time.sleep(0.5)
-
-        add_income.fill_price(IncomeExpenseData.VALID_INCOME_PRICE)
-        add_income.fill_title(IncomeExpenseData.VALID_INCOME_TITLE)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
-        add_income.save()
-
-        assert add_income.is_error_message_displayed("Field"), \
-            "Erro: O aplicativo permitiu salvar Income sem categoria."
-
-    def test_tc14_add_income_with_different_date(self):
+    def test_tc14_add_income_with_different_date(self, account):
         """
         TC14 - Verifica se é possível adicionar um Income com data diferente da atual 
         e se ele aparece corretamente no filtro de período 'All time'.
         """
         home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
 
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-        self.driver.back()
+        account()
 
         add_income.click_add_income()
         add_income.change_date("02", "October", "2025")
-        add_income.fill_price(IncomeExpenseData.VALID_INCOME_PRICE)
-        add_income.fill_title("Salário Outubro")
-        add_income.fill_category(IncomeExpenseData.VALID_INCOME_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.VALID_INCOME_PRICE,
+            title="Salário Outubro",
+            category=IncomeExpenseData.VALID_INCOME_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         home.select_all_time_filter()
@@ -190,30 +110,25 @@ class TestIncomeExpense:
         assert add_income.is_income_visible("Salário Outubro"), \
             "Income com data futura não apareceu no filtro 'All time'."
 
-    def test_tc15_edit_existing_income(self):
+    def test_tc15_edit_existing_income(self, account):
         """
         TC15 - Verifica se um Income existente pode ser editado com sucesso, alterando 
         título e valor, e se os novos dados são refletidos na lista de registros.
         """
         home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
 
-        # Criação de conta
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-
-        self.driver.back()
+        # Conta gravada direto no banco do app
+        account()
 
         # Cadastro de Income inicial
         add_income.click_add_income()
-        add_income.fill_price(IncomeExpenseData.VALID_INCOME_PRICE)
-        add_income.fill_title("Salário Antigo")
-        add_income.fill_category(IncomeExpenseData.VALID_INCOME_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.VALID_INCOME_PRICE,
+            title="Salário Antigo",
+            category=IncomeExpenseData.VALID_INCOME_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         home.select_all_time_filter()
@@ -227,3 +142,16 @@ class TestIncomeExpense:
 
         assert add_income.is_income_visible("Salário Editado"), \
             "Income não foi editado corretamente."
+
+
+@pytest.mark.usefixtures("class_setup")
+class TestIncomeValidation:
+    """
+    Validações do formulário de Income (TC11 a TC13) executadas sobre um único formulário aberto.
+    Cada caso é reportado como um resultado próprio do pytest.
+    """
+
+    @pytest.mark.parametrize("case", INCOME_VALIDATION_CASES, ids=lambda case: case.case_id)
+    def test_income_form_validation(self, income_form, case):
+        failure = income_form.check(case)
+        assert not failure, failure
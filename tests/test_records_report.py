@@ -1,91 +1,81 @@
 import pytest
-import time
 from pages.add_incomeexpense_page import AddIncomeExpensePage
 from pages.home_page import HomePage
-from pages.accounts_page import AccountsPage
-from pages.add_account_page import AddAccountPage
 from pages.add_records_page import AddRecordPage
 from pages.records_page import RecordsPage
 
 from data.data import RecordData
 from data.data import AccountData
 from data.data import IncomeExpenseData
+from utils.ledger_verifier import expected_summary
 
 
 @pytest.mark.usefixtures("setup")
 class TestRecords:
 
+    @pytest.mark.app_state("one_account")
     def test_tc16_validate_records_display(self):
         """
         Verifica se os registros de Income e Expense aparecem corretamente na tela Records.
+        A conta válida vem do checkpoint 'one_account'.
         """
         home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
         records = RecordsPage(self.driver)
 
         # Aguardar carregamento inicial
-        time.sleep(0.5)
-
-        # Criação de conta válida
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-
-        assert accounts.is_account_visible(AccountData.VALID_ACCOUNT_NAME), \
-            "Falha ao criar conta. Teste não pode continuar."
-
-        # Retorna para tela anterior
-        time.sleep(0.5)
-        self.driver.back()
+        home.wait_until_stable()
 
         # Cadastro de Income
         add_income.click_add_income()
-        add_income.fill_price(IncomeExpenseData.VALID_INCOME_PRICE)
-        add_income.fill_title(IncomeExpenseData.VALID_INCOME_TITLE)
-        add_income.fill_category(IncomeExpenseData.VALID_INCOME_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.VALID_INCOME_PRICE,
+            title=IncomeExpenseData.VALID_INCOME_TITLE,
+            category=IncomeExpenseData.VALID_INCOME_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
-        time.sleep(0.5)
+        add_income.wait_until_stable()
 
         # Cadastro de Expense
         add_income.click_add_expense()
-        add_income.fill_price(IncomeExpenseData.VALID_EXPENSE_PRICE)
-        add_income.fill_title(IncomeExpenseData.VALID_EXPENSE_TITLE)
-        add_income.fill_category(IncomeExpenseData.VALID_EXPENSE_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.VALID_EXPENSE_PRICE,
+            title=IncomeExpenseData.VALID_EXPENSE_TITLE,
+            category=IncomeExpenseData.VALID_EXPENSE_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
-        time.sleep(0.5)
+        add_income.wait_until_stable()
 
         # Validação de registros
         assert records.is_text_displayed("Salário"), "Income 'Salário' não foi exibido na tela de registros."
         assert records.is_text_displayed("Compras"), "Expense 'Compras' não foi exibido na tela de registros."
 
+        # Validação dos totais exibidos (um único page_source)
+        diff = records.totals_diff(expected_summary([
+            {"title": IncomeExpenseData.VALID_INCOME_TITLE, "price": IncomeExpenseData.VALID_INCOME_PRICE},
+            {"title": IncomeExpenseData.VALID_EXPENSE_TITLE, "price": IncomeExpenseData.VALID_EXPENSE_PRICE,
+             "kind": "expense"},
+        ]))
+        assert not diff, diff
+
+    @pytest.mark.app_state("one_account")
     def test_tc17_edit_income_from_records(self):
         """
         Valida a edição de um registro do tipo Income na aba Records.
         """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
         records = RecordsPage(self.driver)
 
-        # Criação da conta
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-        self.driver.back()
-
         # Cadastro de Income inicial
         add_income.click_add_income()
-        add_income.fill_price(IncomeExpenseData.INCOME_EDIT_OLD_PRICE)
-        add_income.fill_title(IncomeExpenseData.INCOME_EDIT_OLD_TITLE)
-        add_income.fill_category(IncomeExpenseData.INCOME_EDIT_OLD_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.INCOME_EDIT_OLD_PRICE,
+            title=IncomeExpenseData.INCOME_EDIT_OLD_TITLE,
+            category=IncomeExpenseData.INCOME_EDIT_OLD_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         # Acessa o primeiro registro
@@ -99,29 +89,22 @@ class TestRecords:
         assert records.is_record_updated(IncomeExpenseData.INCOME_EDIT_NEW_PRICE), \
             "O valor do Income não foi atualizado corretamente para 1000."
 
+    @pytest.mark.app_state("one_account")
     def test_tc18_delete_expense_from_records(self):
         """
         Verifica se um registro do tipo Expense pode ser excluído com sucesso.
         """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
         records = RecordsPage(self.driver)
 
-        # Criação de conta
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-        self.driver.back()
-
         # Cadastro de despesa
         add_income.click_add_expense()
-        add_income.fill_price(IncomeExpenseData.VALID_EXPENSE_PRICE)
-        add_income.fill_title(IncomeExpenseData.VALID_EXPENSE_TITLE)
-        add_income.fill_category(IncomeExpenseData.VALID_EXPENSE_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.VALID_EXPENSE_PRICE,
+            title=IncomeExpenseData.VALID_EXPENSE_TITLE,
+            category=IncomeExpenseData.VALID_EXPENSE_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         # Exclusão do primeiro registro na tela de Records
@@ -148,28 +131,21 @@ class TestRecords:
         assert add_income.is_element_displayed(*add_income._btn_done), \
             "O aplicativo retornou para a lista ao invés de permanecer na tela de cadastro."
 
+    @pytest.mark.app_state("one_account")
     def test_tc20_prevent_duplicate_income(self):
         """
         Garante que o sistema impede o cadastro de um Income duplicado.
         """
-        home = HomePage(self.driver)
-        accounts = AccountsPage(self.driver)
-        add_account = AddAccountPage(self.driver)
         add_income = AddIncomeExpensePage(self.driver)
 
-        # Criação da conta
-        home.open_menu()
-        accounts.open_accounts()
-        accounts.click_add_account()
-        add_account.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
-        self.driver.back()
-
         # Cadastro de primeiro Income
         add_income.click_add_income()
-        add_income.fill_price(IncomeExpenseData.DUPLICATE_PRICE)
-        add_income.fill_title(IncomeExpenseData.DUPLICATE_TITLE)
-        add_income.fill_category(IncomeExpenseData.DUPLICATE_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.DUPLICATE_PRICE,
+            title=IncomeExpenseData.DUPLICATE_TITLE,
+            category=IncomeExpenseData.DUPLICATE_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         assert add_income.is_income_visible(IncomeExpenseData.DUPLICATE_TITLE), \
@@ -177,10 +153,12 @@ class TestRecords:
 
         # Tentar cadastrar novamente com os mesmos dados
         add_income.click_add_income()
-        add_income.fill_price(IncomeExpenseData.DUPLICATE_PRICE)
-        add_income.fill_title(IncomeExpenseData.DUPLICATE_TITLE)
-        add_income.fill_category(IncomeExpenseData.DUPLICATE_CATEGORY)
-        add_income.select_account(AccountData.VALID_ACCOUNT_NAME)
+        add_income.fill_record(
+            price=IncomeExpenseData.DUPLICATE_PRICE,
+            title=IncomeExpenseData.DUPLICATE_TITLE,
+            category=IncomeExpenseData.DUPLICATE_CATEGORY,
+            account_name=AccountData.VALID_ACCOUNT_NAME,
+        )
         add_income.save()
 
         # Validação de prevenção de duplicidade
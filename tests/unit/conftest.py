@@ -0,0 +1,32 @@
+import weakref
+from collections import Counter, defaultdict
+
+import pytest
+
+from pages.screen_graph import EdgeCosts
+from utils.reporting import run_report
+from utils.wait_engine import LatencyBudgets, wait_engine
+
+
+@pytest.fixture(autouse=True)
+def isolated_budgets(monkeypatch):
+    """
+    Os testes unitários usam drivers falsos: as latências medidas ficam em orçamentos
+    próprios de cada teste, fora do wait_engine compartilhado (persistido pelo conftest).
+    O mesmo vale para os custos de navegação do ScreenGraph (edge_costs).
+    """
+    monkeypatch.setattr(wait_engine, "budgets", LatencyBudgets(maximum=wait_engine.timeout))
+    monkeypatch.setattr("pages.screen_graph.edge_costs", EdgeCosts())
+
+
+@pytest.fixture(autouse=True)
+def isolated_report(monkeypatch):
+    """
+    Contadores e tempos registrados pelos drivers falsos (inclusive os do cache de elementos)
+    ficam restritos a cada teste, fora do run_report exibido no resumo do terminal.
+    """
+    monkeypatch.setattr(run_report, "test_timings", defaultdict(dict))
+    monkeypatch.setattr(run_report, "timings", defaultdict(list))
+    monkeypatch.setattr(run_report, "counters", Counter())
+    monkeypatch.setattr(run_report, "test_metrics", defaultdict(Counter))
+    monkeypatch.setattr("pages.base_page._element_caches", weakref.WeakKeyDictionary())
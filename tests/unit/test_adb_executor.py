@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from utils.adb_executor import AdbError, AdbExecutor, AdbResult, split_batch_output
+from utils.devices import Device
+
+DEVICE = Device("emulator-5554", 4723, 8200)
+
+# adb falso: registra cada chamada e executa o comando de "shell" no shell local
+FAKE_ADB = """#!/bin/sh
+echo "$@" >> "$(dirname "$0")/calls.log"
+[ "$1" = "-s" ] && shift 2
+if [ "$1" = "shell" ]; then
+    shift
+    exec sh -c "$*"
+fi
+echo "comando desconhecido: $1" >&2
+exit 1
+"""
+
+
+@pytest.fixture
+def fake_adb(tmp_path):
+    path = tmp_path / "adb"
+    path.write_text(FAKE_ADB)
+    path.chmod(0o755)
+    return path
+
+
+def calls(fake_adb):
+    log = fake_adb.parent / "calls.log"
+    return log.read_text().splitlines() if log.exists() else []
+
+
+class TestAdbExecutor:
+
+    def test_shell_returns_structured_result(self, fake_adb):
+        result = AdbExecutor(str(fake_adb)).shell(DEVICE, "echo Success")
+
+        assert result.ok
+        assert result.stdout.strip() == "Success"
+        assert result.args == ("-s", "emulator-5554", "shell", "echo Success")
+        assert calls(fake_adb) == ["-s emulator-5554 shell echo Success"]
+
+    def test_failure_is_reported_and_raised_on_check(self, fake_adb):
+        executor = AdbExecutor(str(fake_adb))
+
+        assert executor.run(DEVICE, "reboot").returncode == 1
+        with pytest.raises(AdbError, match="comando desconhecido"):
+            executor.run(DEVICE, "reboot", check=True)
+
+    def test_timeout_kills_the_command(self, fake_adb):
+        start = time.perf_counter()
+
+        result = AdbExecutor(str(fake_adb)).shell(DEVICE, "sleep 5", timeout=0.2)
+
+        assert result.timed_out
+        assert not result.ok
+        assert time.perf_counter() - start < 3
+
+    def test_batch_runs_in_one_process_with_exit_code_per_command(self, fake_adb):
+        results = AdbExecutor(str(fake_adb)).shell_batch(
+            DEVICE, ["echo limpo", "sh -c 'echo negado; exit 3'", "echo concedido"]
+        )
+
+        assert [result.returncode for result in results] == [0, 3, 0]
+        assert [result.stdout for result in results] == ["limpo", "negado", "concedido"]
+        assert results[1].args == ("shell", "sh -c 'echo negado; exit 3'")
+        assert len(calls(fake_adb)) == 1
+
+    def test_independent_commands_run_concurrently(self, fake_adb):
+        executor = AdbExecutor(str(fake_adb), max_concurrency=3)
+        start = time.perf_counter()
+
+        results = executor.run_many([(DEVICE, ("shell", f"sleep 0.4; echo {index}")) for index in range(3)])
+
+        assert [result.stdout.strip() for result in results] == ["0", "1", "2"]
+        assert time.perf_counter() - start < 1.0
+
+
+class TestSplitBatchOutput:
+
+    def test_commands_after_timeout_have_no_exit_code(self):
+        result = AdbResult(("shell", "..."), None, "Success\n__adb_batch_rc__0:0\n", timed_out=True)
+
+        first, second = split_batch_output(["pm clear pkg", "pm grant pkg x"], result)
+
+        assert first.ok and first.stdout == "Success"
+        assert second.returncode is None
+        assert second.timed_out
@@ -0,0 +1,101 @@
+import shutil
+import tarfile
+
+import pytest
+
+from utils.adb_executor import AdbResult
+from utils.app_state import CHECKPOINTS, EXCLUDED_DIRS, STATE_DIRS, AppStateStore
+from utils.devices import Device
+
+PACKAGE = "com.blogspot.e_kanivets.moneytracker"
+
+
+class FakeAdb:
+    """
+    AdbExecutor falso que simula o diretório de dados do app e o /data/local/tmp
+    com diretórios locais, executando tar via módulo tarfile.
+    """
+
+    def __init__(self, root):
+        self.app_dir = root / "app"
+        self.tmp_dir = root / "tmp"
+        self.app_dir.mkdir(parents=True)
+        self.tmp_dir.mkdir()
+
+    def _device_path(self, remote):
+        return self.tmp_dir / remote.rsplit("/", 1)[1]
+
+    def run(self, device, *args, timeout=None, check=False):
+        if args[0] == "push":
+            shutil.copy(args[1], self._device_path(args[2]))
+        elif args[0] == "pull":
+            shutil.copy(self._device_path(args[1]), args[2])
+        else:
+            raise AssertionError(f"Comando adb inesperado: {args}")
+        return AdbResult(args, 0)
+
+    def shell(self, device, command, timeout=None, check=False):
+        words = command.split()
+        if words[:3] == ["run-as", PACKAGE, "tar"]:
+            with tarfile.open(self._device_path(words[-1]), mode="w") as archive:
+                for path in self.app_dir.iterdir():
+                    if f"--exclude=./{path.name}" not in words:
+                        archive.add(path, arcname=f"./{path.name}")
+        elif words[:4] == ["run-as", PACKAGE, "sh", "-c"]:
+            script = command.split("'")[1]
+            for directory in STATE_DIRS:
+                assert directory in script.split("&&")[0]
+                shutil.rmtree(self.app_dir / directory, ignore_errors=True)
+            with tarfile.open(self._device_path(script.split()[-1])) as archive:
+                archive.extractall(self.app_dir)
+        elif words[:2] == ["rm", "-f"]:
+            self._device_path(words[2]).unlink(missing_ok=True)
+        else:
+            raise AssertionError(f"Comando adb inesperado: {command}")
+        return AdbResult(("shell", command), 0)
+
+    def write(self, relative, content):
+        path = self.app_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+@pytest.fixture
+def fake_adb(tmp_path):
+    return FakeAdb(tmp_path / "device")
+
+
+@pytest.fixture
+def store(fake_adb, tmp_path):
+    return AppStateStore(Device("emulator-5554", 4723, 8200), PACKAGE, tmp_path / "archives", executor=fake_adb)
+
+
+class TestAppStateStore:
+
+    def test_capture_and_restore_round_trip(self, store, fake_adb):
+        fake_adb.write("databases/database", "uma conta")
+        fake_adb.write("shared_prefs/prefs.xml", "<map/>")
+        fake_adb.write("cache/tmp.bin", "cache")
+
+        store.capture("one_account")
+        assert store.has("one_account")
+        with tarfile.open(store.archive_path("one_account")) as archive:
+            assert not {name.split("/")[1] for name in archive.getnames()} & set(EXCLUDED_DIRS)
+
+        fake_adb.write("databases/database", "alterado pelo teste")
+        fake_adb.write("files/extra.txt", "lixo")
+
+        elapsed = store.restore("one_account")
+
+        assert elapsed >= 0
+        assert (fake_adb.app_dir / "databases/database").read_text() == "uma conta"
+        assert (fake_adb.app_dir / "shared_prefs/prefs.xml").exists()
+        assert not (fake_adb.app_dir / "files/extra.txt").exists()
+        assert list(fake_adb.tmp_dir.iterdir()) == []
+
+    def test_restore_requires_capture(self, store):
+        with pytest.raises(KeyError):
+            store.restore("one_account")
+
+    def test_known_checkpoints(self):
+        assert {"empty", "one_account", "account_with_500_records"} <= set(CHECKPOINTS)
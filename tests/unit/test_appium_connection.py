@@ -0,0 +1,78 @@
+from appium import webdriver
+from appium.options.android import UiAutomator2Options
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.stub_appium_server import StubAppiumServer
+from utils.appium_connection import COMMAND_TIMEOUTS, DEFAULT_COMMAND_TIMEOUT, TunedAppiumConnection
+
+OPTIONS = {"platformName": "Android"}
+
+
+def remote(connection):
+    return webdriver.Remote(connection, options=UiAutomator2Options().load_capabilities(OPTIONS))
+
+
+class TestTunedAppiumConnection:
+
+    def test_pool_is_sized_and_persistent(self):
+        connection = TunedAppiumConnection("http://127.0.0.1:4723", pool_size=3)
+
+        assert connection._conn.connection_pool_kw["maxsize"] == 3
+        assert connection._client_config.keep_alive
+
+    def test_timeout_depends_on_command(self):
+        connection = TunedAppiumConnection("http://127.0.0.1:4723", command_timeouts={"findElement": 7})
+
+        assert connection.timeout_for("newSession").read_timeout == 300
+        assert connection.timeout_for("findElement").read_timeout == 7
+        assert connection.timeout_for("clickElement").read_timeout == DEFAULT_COMMAND_TIMEOUT
+
+    def test_commands_reuse_one_connection(self):
+        with StubAppiumServer() as server:
+            driver = remote(TunedAppiumConnection(server.url))
+            for _ in range(20):
+                driver.find_element("id", "botao")
+            driver.quit()
+
+            assert server.connections == 1
+
+    def test_request_uses_timeout_of_running_command(self):
+        with StubAppiumServer() as server:
+            connection = TunedAppiumConnection(server.url, command_timeouts={"getPageSource": 42})
+            driver = remote(connection)
+            seen = []
+            request = connection._conn.request
+
+            def spy(method, url, **kwargs):
+                response = request(method, url, **kwargs)
+                seen.append(connection.current_timeout().read_timeout)
+                return response
+
+            connection._conn.request = spy
+            _ = driver.page_source
+
+            assert seen == [42]
+            assert connection.current_timeout() is None
+
+    def test_mobile_commands_use_the_execute_script_timeout(self):
+        with StubAppiumServer() as server:
+            connection = TunedAppiumConnection(server.url)
+            driver = remote(connection)
+            seen = []
+            request = connection._conn.request
+
+            def spy(method, url, **kwargs):
+                seen.append(connection.current_timeout().read_timeout)
+                return request(method, url, **kwargs)
+
+            connection._conn.request = spy
+            driver.execute_script("mobile: startActivity", {"intent": "pacote/.Activity"})
+
+            assert seen == [COMMAND_TIMEOUTS[Command.W3C_EXECUTE_SCRIPT]]
+
+    def test_compressed_responses_are_decoded(self):
+        source = "<hierarchy>" + "<node text='x'/>" * 200 + "</hierarchy>"
+        with StubAppiumServer(page_source=source, compress=True) as server:
+            driver = remote(TunedAppiumConnection(server.url, compress=True))
+
+            assert driver.page_source == source
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from utils.command_trace import CommandTrace
+from utils.command_trace_plugin import trace_file_name, write_trace
+
+
+class FakeExecutor:
+    """command_executor falso: cada comando 'leva' o tempo configurado no relógio simulado."""
+
+    def __init__(self, clock, durations):
+        self.clock = clock
+        self.durations = durations
+
+    def execute(self, command, params=None):
+        self.clock.now += self.durations.get(command, 0.01)
+        if command == "fail":
+            raise RuntimeError("falha")
+        return {"value": None}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeDriver:
+    def __init__(self, executor):
+        self.command_executor = executor
+
+
+class TestCommandTrace:
+
+    def _instrumented(self, durations):
+        clock = FakeClock()
+        trace = CommandTrace(clock=clock)
+        driver = trace.instrument(FakeDriver(FakeExecutor(clock, durations)))
+        return trace, driver
+
+    def test_records_latency_and_locator_per_command(self):
+        trace, driver = self._instrumented({"findElement": 0.5, "clickElement": 0.1})
+        trace.start_test("tests/test_x.py::test_a")
+
+        driver.command_executor.execute("findElement", {"using": "id", "value": "pkg:id/etTitle"})
+        driver.command_executor.execute("clickElement", {"id": "el-1"})
+        result = trace.finish_test()
+
+        assert result["test"] == "tests/test_x.py::test_a"
+        assert result["commands"] == 2
+        assert result["command_seconds"] == pytest.approx(0.6)
+        assert result["events"][0]["locator"] == "id=pkg:id/etTitle"
+        assert "locator" not in result["events"][1]
+
+    def test_failed_commands_are_recorded(self):
+        trace, driver = self._instrumented({})
+
+        with pytest.raises(RuntimeError):
+            driver.command_executor.execute("fail", {})
+
+        assert trace.events[0]["ok"] is False
+
+    def test_instrumentation_is_not_duplicated(self):
+        trace, driver = self._instrumented({})
+        trace.instrument(driver)
+
+        driver.command_executor.execute("status", {})
+
+        assert len(trace.events) == 1
+
+    def test_untraced_commands_are_not_recorded(self):
+        trace, driver = self._instrumented({})
+
+        with trace.untraced():
+            driver.command_executor.execute("getCurrentActivity", {})
+        driver.command_executor.execute("status", {})
+
+        assert [event["command"] for event in trace.events] == ["status"]
+
+    def test_retries_restarts_and_summary(self):
+        trace, driver = self._instrumented({"findElement": 0.3, "getPageSource": 0.2})
+        driver.command_executor.execute("findElement", {"using": "xpath", "value": "//lento"})
+        driver.command_executor.execute("findElement", {"using": "id", "value": "rapido"})
+        driver.command_executor.execute("getPageSource", {})
+        trace.record_retry("xpath", "//lento")
+        trace.record_restart()
+
+        assert trace.slowest_commands(1)[0][0] == "findElement"
+        assert trace.slowest_commands(1)[0][1]["count"] == 2
+        lines = trace.summary_lines()
+        assert "novas tentativas (find): 1" in lines
+        assert "reinicializações de sessão: 1" in lines
+
+    def test_trace_is_written_as_json(self, tmp_path):
+        trace = {"test": "tests/test_x.py::TestA::test_b[1]", "events": [{"type": "restart"}]}
+
+        path = write_trace(tmp_path, trace)
+
+        assert path.name == trace_file_name(trace["test"])
+        assert "/" not in path.name and "::" not in path.name
+        assert json.loads(path.read_text(encoding="utf-8")) == trace
@@ -0,0 +1,168 @@
+import shutil
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+from utils.adb_executor import AdbError, AdbResult
+from utils.db_seeder import DatabaseSeeder, join_price, split_price
+from utils.devices import Device
+
+PACKAGE = "com.blogspot.e_kanivets.moneytracker"
+
+# Esquema equivalente ao criado pelo aplicativo na primeira execução
+APP_SCHEMA = """
+CREATE TABLE accounts (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, cur_sum INTEGER,
+                       currency TEXT, decimals INTEGER, goal REAL, archived INTEGER, color INTEGER);
+CREATE TABLE categories (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT);
+CREATE TABLE records (id INTEGER PRIMARY KEY AUTOINCREMENT, time INTEGER, type INTEGER, title TEXT,
+                      category_id INTEGER, price INTEGER, account_id INTEGER, currency TEXT,
+                      decimals INTEGER);
+"""
+
+
+class FakeAdb:
+    """
+    AdbExecutor falso: simula o armazenamento do app e o /data/local/tmp do dispositivo
+    em diretórios locais, respondendo aos comandos usados pelo DatabaseSeeder.
+    """
+
+    def __init__(self, root):
+        self.app_dir = root / "app"
+        self.tmp_dir = root / "tmp"
+        (self.app_dir / "databases").mkdir(parents=True)
+        self.tmp_dir.mkdir()
+        self.commands = []
+
+    def _device_path(self, remote):
+        return self.tmp_dir / remote.rsplit("/", 1)[1]
+
+    def _result(self, args, ok, check):
+        result = AdbResult(("-s", "emulator-5554", *args), 0 if ok else 1)
+        if check and not result.ok:
+            raise AdbError(result)
+        return result
+
+    def run(self, device, *args, timeout=None, check=False):
+        assert device.udid == "emulator-5554"
+        self.commands.append(args)
+        if args[0] == "push":
+            shutil.copy(args[1], self._device_path(args[2]))
+        elif args[0] == "pull":
+            shutil.copy(self._device_path(args[1]), args[2])
+        else:
+            raise AssertionError(f"Comando adb inesperado: {args}")
+        return self._result(args, True, check)
+
+    def shell(self, device, command, timeout=None, check=False):
+        self.commands.append(("shell", command))
+        words = command.split()
+        ok = True
+        if words[:3] == ["run-as", PACKAGE, "cat"]:
+            source = self.app_dir / words[3]
+            # O redirecionamento cria o arquivo mesmo quando o cat falha
+            self._device_path(words[5]).write_bytes(source.read_bytes() if source.exists() else b"")
+            ok = source.exists()
+        elif words[:4] == ["run-as", PACKAGE, "sh", "-c"]:
+            shutil.copy(self._device_path(words[5]), self.app_dir / "databases" / "database")
+        elif words[:2] == ["rm", "-f"]:
+            for remote in words[2:]:
+                self._device_path(remote).unlink(missing_ok=True)
+        else:
+            raise AssertionError(f"Comando adb inesperado: {command}")
+        return self._result(("shell", command), ok, check)
+
+    def shell_batch(self, device, commands, timeout=None):
+        return [self.shell(device, command) for command in commands]
+
+    def query(self, sql):
+        connection = sqlite3.connect(self.app_dir / "databases" / "database")
+        try:
+            return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+
+    def terminate_app(self, package):
+        self.calls.append("terminate_app")
+
+    def activate_app(self, package):
+        self.calls.append("activate_app")
+
+
+@pytest.fixture
+def fake_adb(tmp_path):
+    adb = FakeAdb(tmp_path / "device")
+    connection = sqlite3.connect(adb.app_dir / "databases" / "database")
+    connection.executescript(APP_SCHEMA)
+    connection.close()
+    return adb
+
+
+@pytest.fixture
+def seeder(fake_adb, tmp_path):
+    return DatabaseSeeder(Device("emulator-5554", 4723, 8200), PACKAGE, tmp_path / "local", executor=fake_adb)
+
+
+class TestDatabaseSeeder:
+
+    @pytest.mark.parametrize("value, expected", [
+        ("1000", (1000, 0)), ("10.5", (10, 50)), (-300, (-300, 0)), ("-10.5", (-10, -50)), ("-0.50", (0, -50)),
+    ])
+    def test_split_price(self, value, expected):
+        assert split_price(value) == expected
+        assert join_price(*expected) == Decimal(str(value))
+
+    def test_account_is_written_to_device_database(self, seeder, fake_adb):
+        with seeder.editing() as db:
+            db.add_account("ContaTeste01", "5000")
+
+        assert fake_adb.query("SELECT title, cur_sum, decimals FROM accounts") == [("ContaTeste01", 5000, 0)]
+        assert list(fake_adb.tmp_dir.iterdir()) == []
+
+    def test_records_update_balance_and_reuse_categories(self, seeder, fake_adb):
+        with seeder.editing() as db:
+            db.add_account("ContaTeste01", "5000")
+            db.add_record("Salário", "1000", "Trabalho", "ContaTeste01")
+            db.add_record("Padaria", "300.25", "Alimentação", "ContaTeste01", kind="expense")
+            db.add_record("Bônus", "50", "Trabalho", "ContaTeste01", timestamp=1700000000000)
+
+        assert fake_adb.query("SELECT cur_sum, decimals FROM accounts") == [(5749, 75)]
+        assert fake_adb.query("SELECT COUNT(*) FROM categories") == [(2,)]
+        assert fake_adb.query("SELECT title, type, price, decimals FROM records ORDER BY id") == [
+            ("Salário", 0, 1000, 0), ("Padaria", 1, 300, 25), ("Bônus", 0, 50, 0)
+        ]
+
+    def test_balance_between_minus_one_and_zero_keeps_its_sign(self, seeder, fake_adb):
+        with seeder.editing() as db:
+            db.add_account("ContaTeste01", "0")
+            db.add_record("Padaria", "0.50", "Alimentação", "ContaTeste01", kind="expense")
+            db.add_record("Café", "1", "Alimentação", "ContaTeste01", kind="expense")
+
+        assert fake_adb.query("SELECT cur_sum, decimals FROM accounts") == [(-1, -50)]
+
+    def test_missing_database_fails_and_cleans_device_tmp(self, seeder, fake_adb):
+        (fake_adb.app_dir / "databases" / "database").unlink()
+
+        with pytest.raises(AdbError):
+            seeder.pull()
+
+        assert list(fake_adb.tmp_dir.iterdir()) == []
+
+    def test_unknown_account_is_rejected(self, seeder):
+        with pytest.raises(ValueError):
+            with seeder.editing() as db:
+                db.add_record("Salário", "1000", "Trabalho", "Inexistente")
+
+    def test_seeding_restarts_app_around_write(self, seeder):
+        driver = FakeDriver()
+
+        with seeder.seeding(driver) as db:
+            assert driver.calls == ["terminate_app"]
+            db.add_account("ContaTeste01", "5000")
+
+        assert driver.calls == ["terminate_app", "activate_app"]
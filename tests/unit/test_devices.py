@@ -0,0 +1,68 @@
+import pytest
+
+from utils.devices import Device, DeviceAllocator, parse_adb_devices, worker_index
+
+ADB_DEVICES_OUTPUT = (
+    "List of devices attached\n"
+    "emulator-5554\tdevice\n"
+    "emulator-5556\tdevice\n"
+    "emulator-5558\toffline\n"
+)
+
+
+class TestDeviceAllocator:
+
+    def test_parse_adb_devices_ignores_offline(self):
+        assert parse_adb_devices(ADB_DEVICES_OUTPUT) == ["emulator-5554", "emulator-5556"]
+
+    @pytest.mark.parametrize("worker_id, expected", [("master", 0), ("gw0", 0), ("gw3", 3), (None, 0)])
+    def test_worker_index(self, worker_id, expected):
+        assert worker_index(worker_id) == expected
+
+    def test_each_worker_gets_its_own_device_and_ports(self):
+        allocator = DeviceAllocator(list_devices=lambda: ADB_DEVICES_OUTPUT)
+
+        first = allocator.allocate("gw0")
+        second = allocator.allocate("gw1")
+
+        assert first == Device("emulator-5554", 4723, 8200)
+        assert second == Device("emulator-5556", 4724, 8201)
+        assert second.server_url == "http://127.0.0.1:4724"
+        assert second.adb("shell pm clear pkg") == "adb -s emulator-5556 shell pm clear pkg"
+
+    def test_explicit_udids_skip_adb(self):
+        def fail():
+            raise AssertionError("adb não deveria ser consultado")
+
+        allocator = DeviceAllocator(["device-a"], base_appium_port=5000, list_devices=fail)
+
+        assert allocator.allocate("master") == Device("device-a", 5000, 8200)
+
+    def test_falls_back_to_default_emulator(self):
+        allocator = DeviceAllocator(list_devices=lambda: "")
+
+        assert allocator.allocate("master").udid == DeviceAllocator.DEFAULT_UDID
+
+    def test_more_workers_than_devices_fails(self):
+        allocator = DeviceAllocator(list_devices=lambda: ADB_DEVICES_OUTPUT)
+
+        with pytest.raises(RuntimeError):
+            allocator.allocate("gw2")
+
+    def test_group_allocation_gives_each_worker_consecutive_devices(self):
+        allocator = DeviceAllocator(["a", "b", "c", "d"])
+
+        assert allocator.allocate_group("gw1", 2) == [Device("c", 4725, 8202), Device("d", 4726, 8203)]
+
+    def test_group_allocation_without_enough_devices_fails(self):
+        allocator = DeviceAllocator(["a"])
+
+        with pytest.raises(RuntimeError):
+            allocator.allocate_group("master", 2)
+
+    def test_spare_device_is_beyond_every_worker_allocation(self):
+        allocator = DeviceAllocator(["a", "b", "c", "d", "e"])
+
+        assert allocator.allocate_spare("gw1", workers=2) == Device("d", 4726, 8203)
+        assert allocator.allocate_spare("master", workers=1, size=2) == Device("c", 4725, 8202)
+        assert allocator.allocate_spare("gw1", workers=2, size=2) is None
@@ -0,0 +1,120 @@
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import StaleElementReferenceException
+
+from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.base_page import BasePage
+from pages.records_page import RecordsPage
+from utils.element_cache import ElementCache
+
+
+class FakeElement:
+    def __init__(self, driver, locator, stale=False):
+        self.driver = driver
+        self.locator = locator
+        self.stale = stale
+
+    def _check(self):
+        if self.stale:
+            raise StaleElementReferenceException(self.locator)
+
+    def click(self):
+        self._check()
+        self.driver.clicks.append(self.locator)
+
+    def clear(self):
+        self._check()
+
+    def send_keys(self, text):
+        self._check()
+        self.driver.typed.append((self.locator, text))
+
+    def is_displayed(self):
+        self._check()
+        return True
+
+
+class FakeDriver:
+    def __init__(self):
+        self.find_calls = []
+        self.clicks = []
+        self.typed = []
+        self.back_calls = 0
+
+    def find_element(self, by, locator):
+        self.find_calls.append(locator)
+        return FakeElement(self, locator)
+
+    def back(self):
+        self.back_calls += 1
+
+    def update_settings(self, settings):
+        pass
+
+
+PRICE = "com.blogspot.e_kanivets.moneytracker:id/etPrice"
+
+
+class TestElementCache:
+
+    def test_repeated_interactions_reuse_the_element(self):
+        driver = FakeDriver()
+        records = RecordsPage(driver)
+        add_income = AddIncomeExpensePage(driver)
+
+        records.update_price("1000")
+        add_income.update_price_value("2000")
+
+        assert driver.find_calls == [PRICE]
+        assert driver.typed == [(PRICE, "1000"), (PRICE, "2000")]
+        assert records.element_cache.stats()["hits"] == 1
+
+    def test_navigation_clears_the_cache(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+
+        page.is_element_displayed(AppiumBy.ID, "a")
+        page.click(AppiumBy.ID, "a")
+        page.is_element_displayed(AppiumBy.ID, "a")
+        page.back()
+        page.is_element_displayed(AppiumBy.ID, "a")
+
+        assert driver.find_calls == ["a", "a", "a"]
+        assert driver.back_calls == 1
+
+    def test_non_navigating_click_keeps_the_cache(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+
+        page.click(AppiumBy.ID, "spinner", navigates=False)
+        page.click(AppiumBy.ID, "spinner", navigates=False)
+
+        assert driver.find_calls == ["spinner"]
+
+    def test_stale_element_is_found_again(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+        page.element_cache.put((AppiumBy.ID, "a"), FakeElement(driver, "a", stale=True))
+
+        page.click(AppiumBy.ID, "a")
+
+        assert driver.clicks == ["a"]
+        assert driver.find_calls == ["a"]
+
+    def test_caches_are_isolated_per_driver(self):
+        first, second = FakeDriver(), FakeDriver()
+
+        BasePage(first).find(AppiumBy.ID, "a")
+        BasePage(second).find(AppiumBy.ID, "a")
+
+        assert first.find_calls == ["a"] and second.find_calls == ["a"]
+
+    def test_counters(self):
+        cache = ElementCache()
+        cache.get("x")
+        cache.put("x", object())
+        cache.get("x")
+        cache.discard_stale("x")
+        cache.put("y", object())
+        cache.clear()
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "stale": 1, "invalidations": 1, "size": 0}
@@ -0,0 +1,144 @@
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import InvalidArgumentException, StaleElementReferenceException
+
+from pages.add_account_page import AddAccountPage
+from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.base_page import BasePage
+
+PKG_ID = "com.blogspot.e_kanivets.moneytracker:id"
+
+# Formulário de Income: na hierarquia o título vem antes do preço
+INCOME_FORM_SOURCE = f"""<hierarchy>
+  <android.widget.EditText resource-id="{PKG_ID}/etTitle" text=""/>
+  <android.widget.EditText resource-id="{PKG_ID}/etCategory" text=""/>
+  <android.widget.EditText resource-id="{PKG_ID}/etPrice" text=""/>
+</hierarchy>"""
+
+
+class FakeElement:
+    def __init__(self, driver, resource_id):
+        self.driver = driver
+        self.id = resource_id
+
+    def clear(self):
+        self.driver.commands.append(("clear", self.id))
+        self.driver.values[self.id] = ""
+
+    def send_keys(self, text):
+        self.driver.commands.append(("send_keys", self.id))
+        self.driver.values[self.id] = self.driver.values.get(self.id, "") + text
+
+
+class FakeDriver:
+    """Driver falso que registra cada comando enviado ao servidor."""
+
+    def __init__(self, page_source=INCOME_FORM_SOURCE, replace_supported=True, stale_replaces=0):
+        self._page_source = page_source
+        self.replace_supported = replace_supported
+        self.stale_replaces = stale_replaces
+        self.commands = []
+        self.values = {}
+
+    @property
+    def page_source(self):
+        self.commands.append(("page_source",))
+        return self._page_source
+
+    def find_element(self, by, locator):
+        self.commands.append(("find_element", locator))
+        return FakeElement(self, locator)
+
+    def find_elements(self, by, locator):
+        self.commands.append(("find_elements", locator))
+        order = [f"{PKG_ID}/etTitle", f"{PKG_ID}/etCategory", f"{PKG_ID}/etPrice"]
+        return [FakeElement(self, resource_id) for resource_id in order if resource_id.split("/")[1] in locator]
+
+    def execute_script(self, script, args):
+        self.commands.append((script, args["elementId"]))
+        if not self.replace_supported:
+            raise InvalidArgumentException("Unknown mobile command 'replaceElementValue'")
+        if self.stale_replaces:
+            self.stale_replaces -= 1
+            raise StaleElementReferenceException("The element is no longer attached to the DOM")
+        self.values[args["elementId"]] = args["text"]
+
+
+@pytest.fixture(autouse=True)
+def reset_form_state(monkeypatch):
+    monkeypatch.setattr(BasePage, "_form_layouts", {})
+    monkeypatch.setattr(BasePage, "_replace_value_supported", True)
+
+
+class TestFillForm:
+
+    def test_fields_are_resolved_in_one_lookup_and_set_in_one_command_each(self):
+        driver = FakeDriver()
+        page = AddIncomeExpensePage(driver)
+
+        saved = page.fill_form({page._input_price: "1000", page._input_title: "Salário",
+                                page._input_category: "Trabalho"})
+
+        assert driver.values == {f"{PKG_ID}/etPrice": "1000", f"{PKG_ID}/etTitle": "Salário",
+                                 f"{PKG_ID}/etCategory": "Trabalho"}
+        assert [command[0] for command in driver.commands].count("find_elements") == 1
+        assert len(driver.commands) == 5
+        assert saved == 9 - 5
+
+    def test_layout_order_is_cached_between_calls(self):
+        driver = FakeDriver()
+        page = AddIncomeExpensePage(driver)
+        fields = {page._input_price: "1", page._input_title: "A", page._input_category: "B"}
+        page.fill_form(fields)
+        driver.commands.clear()
+
+        saved = page.fill_form(fields)
+
+        assert ("page_source",) not in driver.commands
+        assert saved == 9 - 4
+
+    def test_none_values_are_skipped_and_empty_values_cleared(self):
+        driver = FakeDriver()
+        page = AddIncomeExpensePage(driver)
+
+        page.fill_form({page._input_price: "", page._input_title: "Salário", page._input_category: None})
+
+        assert driver.values == {f"{PKG_ID}/etPrice": "", f"{PKG_ID}/etTitle": "Salário"}
+        assert ("clear", f"{PKG_ID}/etPrice") in driver.commands
+
+    def test_falls_back_to_clear_and_send_keys_when_replace_is_unsupported(self):
+        driver = FakeDriver(replace_supported=False)
+        page = AddIncomeExpensePage(driver)
+
+        page.fill_form({page._input_price: "1000", page._input_title: "Salário"})
+        page.fill_form({page._input_price: "2000", page._input_title: "Bônus"})
+
+        assert driver.values == {f"{PKG_ID}/etPrice": "2000", f"{PKG_ID}/etTitle": "Bônus"}
+        assert [command[0] for command in driver.commands].count("mobile: replaceElementValue") == 1
+
+    def test_stale_element_is_retried_without_disabling_replace(self):
+        driver = FakeDriver(stale_replaces=1)
+        page = AddIncomeExpensePage(driver)
+
+        page.fill_form({page._input_price: "1000", page._input_title: "Salário"})
+
+        assert BasePage._replace_value_supported is True
+        assert driver.values == {f"{PKG_ID}/etPrice": "1000", f"{PKG_ID}/etTitle": "Salário"}
+        assert ("clear", f"{PKG_ID}/etTitle") not in driver.commands
+
+    def test_field_missing_from_layout_uses_individual_lookups(self):
+        driver = FakeDriver()
+        page = AddAccountPage(driver)
+
+        page.fill_form({page._title_input: "ContaTeste01", page._initial_sum_input: "5000"})
+
+        assert [command[0] for command in driver.commands].count("find_element") == 2
+        assert driver.values[f"{PKG_ID}/et_init_sum"] == "5000"
+
+    def test_non_id_locators_use_individual_lookups(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+
+        page.fill_form({(AppiumBy.XPATH, "//a"): "x", (AppiumBy.XPATH, "//b"): "y"})
+
+        assert [command[0] for command in driver.commands].count("find_element") == 2
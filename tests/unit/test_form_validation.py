@@ -0,0 +1,203 @@
+import pytest
+
+from pages.add_account_page import AddAccountPage
+from pages.form_validation import FormValidationEngine, ValidationCase
+from utils.wait_engine import WaitEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeForm:
+    """
+    Formulário falso: recusa títulos vazios (com erro no campo) e valores não numéricos
+    (sem mensagem); nos demais casos salva o registro e fecha a tela.
+    O resultado do salvamento só aparece após `delay` segundos, e os erros continuam
+    nos campos até o formulário ser reaberto, como no app.
+    """
+
+    def __init__(self, delay=0.0):
+        self.clock = FakeClock()
+        self.delay = delay
+        self.open = False
+        self.openings = 0
+        self.values = {}
+        self.errors = {}
+        self.pending = None
+        self.saved = []
+
+    def open_form(self):
+        self.open = True
+        self.openings += 1
+        self.errors = {}
+
+    def close_form(self):
+        self.open = False
+
+    def fill(self, values):
+        assert self.open, "formulário preenchido fora da tela"
+        self.values = dict(values)
+
+    def save(self):
+        self.pending = (self.clock.now + self.delay, dict(self.values))
+
+    def _settle(self):
+        if self.pending is None or self.clock.now < self.pending[0]:
+            return
+        values, self.pending = self.pending[1], None
+        if not values["title"]:
+            self.errors["title"] = "Field can't be empty"
+        elif values["initial_sum"].isdigit():
+            self.saved.append(values["title"])
+            self.open = False
+
+    def is_open(self):
+        self._settle()
+        return self.open
+
+    def read_error(self, fields):
+        self._settle()
+        return " | ".join(self.errors[field] for field in fields if field in self.errors)
+
+    def engine(self, **kwargs):
+        return FormValidationEngine(
+            open_form=self.open_form, close_form=self.close_form, fill=self.fill, save=self.save,
+            read_error=self.read_error, is_open=self.is_open,
+            defaults={"title": "ContaTeste", "initial_sum": "5000"},
+            waits=WaitEngine(timeout=3, clock=self.clock, sleep=self.clock.sleep), **kwargs)
+
+
+ID = "com.blogspot.e_kanivets.moneytracker:id/"
+
+
+def text_input(field_id, error=None):
+    """TextInputLayout como no dump do UiAutomator2: campo e, abaixo dele, a mensagem de erro."""
+    message = (f'<android.widget.LinearLayout><android.widget.TextView resource-id="{ID}textinput_error" '
+               f'text="{error}"/></android.widget.LinearLayout>') if error else ""
+    return (f'<android.widget.LinearLayout><android.widget.FrameLayout>'
+            f'<android.widget.EditText resource-id="{ID}{field_id}"/></android.widget.FrameLayout>{message}'
+            '</android.widget.LinearLayout>')
+
+
+class FakeDriver:
+    def __init__(self, page_source):
+        self.page_source = page_source
+
+    def update_settings(self, settings):
+        pass
+
+
+CASES = [
+    ValidationCase("TC02", {"title": ""}, "error", "field can't be empty"),
+    ValidationCase("TC06", {"initial_sum": "abc"}, "blocked"),
+    ValidationCase("TC03", {"initial_sum": ""}, "blocked"),
+]
+
+
+class TestFormValidationEngine:
+
+    def test_cases_reuse_the_open_form(self):
+        form = FakeForm()
+        engine = form.engine()
+
+        failures = [engine.check(case) for case in CASES]
+
+        assert failures == ["", "", ""]
+        assert form.openings == 1
+
+    def test_saved_record_fails_blocked_case_and_form_is_reopened(self):
+        form = FakeForm()
+        engine = form.engine(persisted=lambda values: values["title"] in form.saved)
+
+        failure = engine.check(ValidationCase("TC04", {"title": "Conta123"}, "blocked"))
+        engine.check(CASES[0])
+
+        assert "TC04" in failure and "salvo" in failure
+        assert form.openings == 2
+
+    def test_wrong_error_is_reported(self):
+        engine = FakeForm().engine()
+
+        failure = engine.check(ValidationCase("TC02", {"title": ""}, "error", "too long"))
+
+        assert failure == "TC02: esperado erro contendo 'too long', obtido \"Field can't be empty\"."
+
+    def test_no_error_case_passes_when_record_is_saved(self):
+        form = FakeForm()
+        engine = form.engine()
+
+        assert engine.check(ValidationCase("TC12", {"title": "SemErro"}, "no_error", "Field")) == ""
+        assert engine.results["TC12"].saved
+
+    def test_failure_in_the_middle_reopens_the_form(self):
+        form = FakeForm()
+        engine = form.engine()
+        engine.check(CASES[0])
+
+        form.close_form()  # ex.: app fechado por um crash
+        with pytest.raises(AssertionError):
+            engine.check(CASES[1])
+        engine.check(CASES[1])
+
+        assert form.openings == 2
+
+    def test_error_case_requires_expected_text(self):
+        with pytest.raises(ValueError):
+            FakeForm().engine().check(ValidationCase("TC99", {}, "error"))
+
+    def test_outcome_is_awaited_after_save(self):
+        form = FakeForm(delay=1.0)
+        engine = form.engine(persisted=lambda values: values["title"] in form.saved)
+
+        assert engine.check(ValidationCase("TC04", {"title": "Conta123"}, "blocked")) != ""
+        assert engine.check(ValidationCase("TC02", {"title": ""}, "error", "field can't be empty")) == ""
+        assert engine.results["TC04"].saved
+
+    def test_silently_blocked_case_waits_for_the_timeout(self):
+        form = FakeForm()
+        engine = form.engine(outcome_timeout=2)
+
+        result = engine.run(ValidationCase("TC06", {"initial_sum": "abc"}, "blocked"))
+
+        assert not result.saved and result.error == ""
+        assert form.clock.now == pytest.approx(2.0)
+
+    def test_error_of_another_field_is_not_attributed_to_the_case(self):
+        form = FakeForm()
+        engine = form.engine()
+        engine.check(CASES[0])
+
+        result = engine.run(ValidationCase("TC06", {"initial_sum": "abc"}, "blocked"))
+
+        assert result.error == ""
+        assert form.openings == 1
+
+    def test_form_is_reopened_when_the_field_still_shows_a_previous_error(self):
+        form = FakeForm()
+        engine = form.engine(persisted=lambda values: values["title"] in form.saved)
+        engine.check(CASES[0])
+
+        failure = engine.check(ValidationCase("TC05", {"title": "ContaAceita"}, "blocked"))
+
+        assert "TC05" in failure and "salvo" in failure
+        assert form.openings == 2
+
+
+class TestFieldErrors:
+
+    def test_errors_are_read_from_the_case_fields_only(self):
+        fields = text_input("etTitle", "Field can't be empty") + text_input("et_init_sum")
+        page = AddAccountPage(FakeDriver(
+            f"<hierarchy><android.widget.LinearLayout>{fields}</android.widget.LinearLayout></hierarchy>"))
+
+        assert page.error_text(["initial_sum"]) == ""
+        assert page.error_text(["title"]) == "Field can't be empty"
+        assert page.error_text() == "Field can't be empty"
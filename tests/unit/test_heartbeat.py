@@ -0,0 +1,171 @@
+import time
+
+from utils.heartbeat import SessionHeartbeat, percentile
+from utils.session_manager import SessionManager
+
+
+class FakeDriver:
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.latency = 0.01
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionHeartbeat:
+
+    def _build(self, spare=False, **kwargs):
+        created, spares, restarts = [], [], []
+
+        def factory():
+            driver = FakeDriver(f"substituta {len(created) + 1}")
+            created.append(driver)
+            return driver
+
+        def spare_factory():
+            driver = FakeDriver(f"reserva {len(spares) + 1}")
+            spares.append(driver)
+            return driver
+
+        clock = FakeClock()
+
+        def probe(driver):
+            clock.now += driver.latency
+            return driver.alive
+
+        manager = SessionManager(factory, lambda driver: driver.alive, lambda: restarts.append("force-stop"))
+        heartbeat = SessionHeartbeat(manager, probe=probe, clock=clock,
+                                     spare_factory=spare_factory if spare else None, **kwargs)
+        manager.attach(FakeDriver("inicial"))
+        return manager, heartbeat, created, spares, restarts
+
+    def test_beat_records_latency_percentiles(self):
+        manager, heartbeat, *_ = self._build()
+        for latency in (0.01, 0.02, 0.03, 0.04, 0.5):
+            manager.driver.latency = latency
+            heartbeat.beat()
+
+        assert heartbeat.beats == 5
+        assert percentile(heartbeat.latencies, 0.5) == 0.03
+        assert percentile(heartbeat.latencies, 0.95) == 0.5
+        assert heartbeat.healthy
+
+    def test_slow_beats_are_counted(self):
+        manager, heartbeat, *_ = self._build(slow_threshold=0.1)
+        manager.driver.latency = 0.2
+
+        heartbeat.beat()
+
+        assert heartbeat.slow_beats == 1
+
+    def test_failures_only_mark_the_session_unhealthy(self):
+        manager, heartbeat, created, _, restarts = self._build(failure_threshold=2)
+        initial = manager.driver
+        initial.alive = False
+
+        for _ in range(3):
+            heartbeat.beat()
+
+        assert not heartbeat.healthy
+        assert heartbeat.failures == 3
+        assert manager.driver is initial
+        assert created == [] and restarts == []
+
+    def test_recovery_happens_at_the_test_boundary(self):
+        manager, heartbeat, created, _, restarts = self._build(failure_threshold=1)
+        manager.driver.alive = False
+        heartbeat.beat()
+
+        manager.recover()
+
+        assert manager.driver is created[0]
+        assert restarts == ["force-stop"]
+        assert heartbeat.healthy
+
+    def test_slow_probe_does_not_restart_a_responsive_session(self):
+        manager, heartbeat, created, _, restarts = self._build(failure_threshold=1)
+        initial = manager.driver
+        initial.alive = False
+        heartbeat.beat()
+        initial.alive = True  # a sonda falhou por lentidão; a sessão continua respondendo
+
+        manager.recover()
+
+        assert manager.driver is initial
+        assert created == [] and restarts == []
+
+    def test_spare_session_is_prepared_once_and_used_on_recovery(self):
+        manager, heartbeat, created, spares, restarts = self._build(spare=True, failure_threshold=2)
+        manager.driver.alive = False
+
+        heartbeat.beat()
+        assert spares == []
+        heartbeat.beat()
+        heartbeat.beat()
+        assert heartbeat.replacements_prepared == 1
+        assert restarts == []
+
+        manager.recover()
+
+        assert manager.driver is spares[0]
+        assert created == [] and restarts == []
+
+    def test_spare_for_another_session_is_discarded(self):
+        manager, heartbeat, created, spares, _ = self._build(spare=True, failure_threshold=1)
+        manager.driver.alive = False
+        heartbeat.beat()
+        manager.attach(FakeDriver("próximo teste")).alive = False
+
+        manager.recover()
+
+        assert spares[0].quit_called
+        assert manager.driver is created[0]
+
+    def test_busy_spare_device_prepares_no_replacement(self):
+        manager, heartbeat, created, _, _ = self._build(failure_threshold=1)
+        heartbeat.spare_factory = lambda: None  # dispositivo reserva em uso pelo teste atual
+        manager.driver.alive = False
+
+        heartbeat.beat()
+        manager.recover()
+
+        assert heartbeat.replacements_prepared == 0
+        assert manager.driver is created[0]
+
+    def test_background_thread_beats_until_stopped(self):
+        manager, heartbeat, *_ = self._build(interval=0.01)
+
+        heartbeat.start()
+        deadline = time.monotonic() + 2
+        while heartbeat.beats < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        heartbeat.stop()
+
+        assert heartbeat.beats >= 2
+        assert not heartbeat.running
+
+    def test_zero_interval_disables_thread(self):
+        _, heartbeat, *_ = self._build(interval=0)
+
+        heartbeat.start()
+
+        assert not heartbeat.running
+
+    def test_summary_lines(self):
+        _, heartbeat, *_ = self._build()
+        assert heartbeat.summary_lines() == []
+
+        heartbeat.beat()
+
+        assert any(line.startswith("latência p50") for line in heartbeat.summary_lines())
@@ -0,0 +1,79 @@
+import sqlite3
+from decimal import Decimal
+from itertools import islice
+
+import pytest
+
+from data.data import AccountData, LedgerFactory
+from tests.unit.test_db_seeder import APP_SCHEMA
+from utils.db_seeder import LedgerDatabase
+
+
+class TestLedgerFactory:
+
+    def test_same_seed_generates_same_data(self):
+        first = LedgerFactory(seed=3, accounts=4, records=200)
+        second = LedgerFactory(seed=3, accounts=4, records=200)
+
+        assert list(first.accounts()) == list(second.accounts())
+        assert list(first.records()) == list(second.records())
+        assert list(LedgerFactory(seed=4, accounts=4, records=200).records()) != list(first.records())
+
+    def test_records_are_streamed_lazily(self):
+        ledger = LedgerFactory(records=10 ** 9)
+
+        assert len(list(islice(ledger.records(), 5))) == 5
+
+    def test_values_respect_app_limits_and_reach_them(self):
+        ledger = LedgerFactory(seed=1, accounts=200, records=2000, boundary_ratio=0.1)
+        accounts = list(ledger.accounts())
+        records = list(ledger.records())
+
+        titles = [account.title for account in accounts] + [record.title for record in records]
+        values = [account.initial_sum for account in accounts] + [record.price for record in records]
+        assert max(map(len, titles)) == LedgerFactory.MAX_TITLE_LENGTH
+        assert max(len(value.split(".")[0]) for value in values) == 13
+        assert len(max(values, key=len)) < len(AccountData.VALUE_EXCEEDS_13CHARACTERS)
+        assert len({account.title for account in accounts}) == len(accounts)
+        assert all(account.title.isalpha() for account in accounts)
+
+    def test_expected_totals_match_generated_records(self):
+        ledger = LedgerFactory(seed=5, accounts=3, records=500)
+        totals = ledger.expected_totals()
+
+        assert sum(entry.records for entry in totals.values()) == 500
+        for title, entry in totals.items():
+            records = [record for record in ledger.records() if record.account == title]
+            income = sum(Decimal(record.price) for record in records if record.kind == "income")
+            assert entry.income == income
+            assert entry.balance == entry.initial_sum + income - entry.expense
+
+    def test_totals_are_accumulated_while_records_are_consumed(self, monkeypatch):
+        ledger = LedgerFactory(seed=5, accounts=3, records=500)
+        expected = LedgerFactory(seed=5, accounts=3, records=500).expected_totals()
+        for _ in ledger.records():
+            pass
+        monkeypatch.setattr(ledger, "records", lambda: pytest.fail("nova passada pelos registros"))
+
+        assert ledger.expected_totals() == expected
+
+    def test_generated_ledger_seeds_the_app_database(self):
+        ledger = LedgerFactory(seed=2, accounts=3, records=300, boundary_ratio=0)
+        connection = sqlite3.connect(":memory:")
+        connection.executescript(APP_SCHEMA)
+        db = LedgerDatabase(connection)
+
+        for account in ledger.accounts():
+            db.add_account(*account)
+        for record in ledger.records():
+            db.add_record(**record._asdict())
+
+        for title, entry in ledger.expected_totals().items():
+            cur_sum, decimals = connection.execute(
+                "SELECT cur_sum, decimals FROM accounts WHERE title = ?", (title,)).fetchone()
+            sign = -1 if cur_sum < 0 else 1
+            assert Decimal(cur_sum) + sign * Decimal(decimals) / 100 == entry.balance
+
+    def test_at_least_one_account_is_required(self):
+        with pytest.raises(ValueError):
+            LedgerFactory(accounts=0)
@@ -0,0 +1,197 @@
+import json
+from contextlib import nullcontext
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from benchmarks.bench_ledger_scaling import LedgerScalingBenchmark, fit_growth, incremental_seeder, write_report
+from data.data import LedgerFactory
+
+ID = "com.blogspot.e_kanivets.moneytracker:id/"
+FORM_FIELDS = ("etPrice", "etTitle", "etCategory")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeElement:
+    def __init__(self, app, name):
+        self.app = app
+        self.id = name
+
+    def click(self):
+        self.app.click(self.id)
+
+
+class FakeMoneyTracker:
+    """
+    Driver falso que simula o aplicativo: a lista demora `save_cost` e `render_cost`
+    segundos por registro exibido para mostrar o novo registro. Os registros da carga são
+    antigos: no período padrão ("month") apenas os criados pelo benchmark aparecem.
+    """
+
+    def __init__(self, clock, save_cost=0.0001, render_cost=0.0005):
+        self.clock = clock
+        self.save_cost = save_cost
+        self.render_cost = render_cost
+        self.ledger_size = 0
+        self.titles = []
+        self.screen = "home"
+        self.period = "month"
+        self.saved_periods = []
+        self.ready_at = 0.0
+        self.fields = {}
+
+    # Comandos usados pelas páginas
+    def find_element(self, by, locator):
+        return FakeElement(self, locator)
+
+    def find_elements(self, by, selector):
+        return [FakeElement(self, f"{ID}{field}") for field in FORM_FIELDS]
+
+    def execute_script(self, script, args):
+        self.fields[args["elementId"]] = args["text"]
+
+    def update_settings(self, settings):
+        pass
+
+    def terminate_app(self, package):
+        self.screen, self.period = "closed", "month"
+
+    def activate_app(self, package):
+        self.screen = "home"
+
+    def click(self, locator):
+        if "btnAddIncome" in locator:
+            self.screen, self.fields = "form", {}
+        elif "fabDone" in locator:
+            self.titles.insert(0, self.fields[f"{ID}etTitle"])
+            self.saved_periods.append(self.period)
+            self.screen = "home"
+            self.ready_at = self.clock.now + self.save_cost * self.shown_records
+        elif "All time" in locator:
+            self.period = "all"
+            self.ready_at = self.clock.now + self.render_cost * self.ledger_size
+
+    @property
+    def shown_records(self):
+        return self.ledger_size if self.period == "all" else 0
+
+    @property
+    def page_source(self):
+        if self.screen == "form":
+            nodes = "".join(f'<android.widget.EditText resource-id="{ID}{field}"/>' for field in FORM_FIELDS)
+        elif self.clock.now < self.ready_at:
+            nodes = '<android.widget.ProgressBar/>'
+        else:
+            nodes = f'<android.widget.TextView text="{self.period}"/>' + "".join(
+                f'<android.widget.TextView resource-id="{ID}tvTitle" text="{title}"/>' for title in self.titles[:8])
+        return f"<hierarchy>{nodes}</hierarchy>"
+
+
+def benchmark(app, clock, sizes=(0, 100, 1000, 10000), **kwargs):
+    def seed(size):
+        app.ledger_size = size
+
+    return LedgerScalingBenchmark(app, seed, "ContaAaaa", sizes, repeats=2, poll_interval=0.01,
+                                  clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestFitGrowth:
+
+    @pytest.mark.parametrize("model, curve", [
+        ("constant", lambda n: 0.4),
+        ("linear", lambda n: 0.2 + 0.001 * n),
+        ("quadratic", lambda n: 0.1 + 1e-7 * n * n),
+    ])
+    def test_generating_curve_is_recovered(self, model, curve):
+        fit = fit_growth({size: curve(size) for size in (0, 100, 1000, 10000)})
+
+        assert fit["model"] == model
+        assert fit["r2"] == pytest.approx(1.0)
+
+
+class TestLedgerScalingBenchmark:
+
+    def test_latency_growth_is_measured_per_size(self):
+        clock = FakeClock()
+        app = FakeMoneyTracker(clock)
+
+        report = benchmark(app, clock).run()
+
+        save = report["metrics"]["save"]
+        all_time = report["metrics"]["all_time"]
+        assert len(save["samples"]["10000"]) == 2
+        assert save["median"]["10000"] == pytest.approx(1.0, abs=0.02)
+        assert all_time["median"]["1000"] == pytest.approx(0.5, abs=0.02)
+        assert all_time["fit"]["model"] == "linear"
+        assert all_time["fit"]["slope"] == pytest.approx(0.0005, rel=0.05)
+
+    def test_new_rows_are_created_with_the_form(self):
+        clock = FakeClock()
+        app = FakeMoneyTracker(clock)
+
+        benchmark(app, clock, sizes=(0, 100)).run()
+
+        assert app.titles == ["Bench 100 1", "Bench 100 0", "Bench 0 1", "Bench 0 0"]
+
+    def test_save_is_timed_with_the_seeded_records_shown(self):
+        clock = FakeClock()
+        app = FakeMoneyTracker(clock)
+
+        report = benchmark(app, clock, sizes=(0, 1000)).run()
+
+        assert app.saved_periods == ["all"] * 4
+        assert report["metrics"]["save"]["median"]["1000"] == pytest.approx(0.1, abs=0.02)
+
+    def test_row_that_never_appears_times_out(self):
+        clock = FakeClock()
+        app = FakeMoneyTracker(clock, save_cost=1.0)
+
+        with pytest.raises(TimeoutException):
+            benchmark(app, clock, sizes=(100,), timeout=5).run()
+
+    def test_report_is_written_as_json(self, tmp_path):
+        clock = FakeClock()
+        report = benchmark(FakeMoneyTracker(clock), clock, sizes=(0, 10)).run()
+
+        path = write_report(report, tmp_path / "reports" / "ledger_scaling.json")
+
+        assert json.loads(path.read_text(encoding="utf-8"))["sizes"] == [0, 10]
+
+
+class FakeSeeder:
+    def __init__(self):
+        self.accounts = []
+        self.records = 0
+
+    def seeding(self, driver):
+        seeder = self
+
+        class Db:
+            def add_account(self, title, initial_sum):
+                seeder.accounts.append(title)
+
+            def add_record(self, **record):
+                seeder.records += 1
+
+        return nullcontext(Db())
+
+
+def test_incremental_seeder_adds_only_missing_records():
+    seeder = FakeSeeder()
+    account, seed = incremental_seeder(seeder, None, LedgerFactory(accounts=1, records=1000))
+
+    for size in (0, 100, 1000):
+        seed(size)
+
+    assert seeder.accounts == [account]
+    assert seeder.records == 1000
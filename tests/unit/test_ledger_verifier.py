@@ -0,0 +1,106 @@
+from decimal import Decimal
+
+import pytest
+
+from data.data import LedgerFactory
+from pages.records_page import Record, RecordsPage
+from tests.unit.test_records_stream import FakeListDriver
+from utils.ledger_verifier import (expected_summary, parse_amount, reconcile, summary_from_records,
+                                   summary_from_snapshot, summary_from_totals)
+from utils.page_snapshot import PageSnapshot
+
+ID = "com.blogspot.e_kanivets.moneytracker:id/"
+
+PAGE_SOURCE = f"""<hierarchy>
+  <android.widget.TextView resource-id="{ID}tvTotalIncome" text="1 000"/>
+  <android.widget.TextView resource-id="{ID}tvTotalExpense" text="300"/>
+  <android.widget.TextView resource-id="{ID}tvTotal" text="700"/>
+  <android.widget.LinearLayout>
+    <android.widget.TextView resource-id="{ID}tvTitle" text="Salário"/>
+    <android.widget.TextView resource-id="{ID}tvPrice" text="+ 1000"/>
+  </android.widget.LinearLayout>
+  <android.widget.LinearLayout>
+    <android.widget.TextView resource-id="{ID}tvTitle" text="Padaria"/>
+    <android.widget.TextView resource-id="{ID}tvPrice" text="- 300"/>
+  </android.widget.LinearLayout>
+</hierarchy>"""
+
+CREATED = [
+    {"title": "Salário", "price": "1000", "category": "Trabalho"},
+    {"title": "Padaria", "price": "300", "category": "Alimentação", "kind": "expense"},
+]
+
+
+class TestParseAmount:
+
+    @pytest.mark.parametrize("text, expected", [
+        ("+ 1000", "1000"), ("- 300.25", "-300.25"), ("1 000,50", "1000.50"),
+        ("1.000,50", "1000.50"), ("1,000.50", "1000.50"), ("USD 12", "12"), ("+ 9999999999999", "9999999999999"),
+    ])
+    def test_formats(self, text, expected):
+        assert parse_amount(text) == Decimal(expected)
+
+    def test_text_without_digits_is_rejected(self):
+        with pytest.raises(ValueError):
+            parse_amount("Price")
+
+
+class TestReconcile:
+
+    def test_single_snapshot_matches_created_records(self):
+        actual = summary_from_snapshot(PageSnapshot(PAGE_SOURCE))
+
+        assert actual.header == {"income": 1000, "expense": 300, "total": 700}
+        assert reconcile(actual, expected_summary(CREATED)) == ""
+
+    def test_mismatch_is_reported_as_diff(self):
+        expected = expected_summary(CREATED + [{"title": "Bônus", "price": "50"}])
+
+        diff = reconcile(summary_from_snapshot(PageSnapshot(PAGE_SOURCE)), expected)
+
+        assert "- income: 1050" in diff and "+ income: 1000" in diff
+        assert "  expense: 300" in diff
+        assert "- Bônus: 50" in diff and "+ Bônus: 0" in diff
+        assert "- cabeçalho total: 750" in diff
+
+    def test_streamed_list_matches_generated_ledger(self):
+        ledger = LedgerFactory(seed=9, accounts=2, records=120)
+        shown = [Record(record.title, record.category,
+                        f"{'+' if record.kind == 'income' else '-'} {record.price}", None)
+                 for record in ledger.records()]
+
+        actual = summary_from_records(shown)
+
+        assert reconcile(actual, expected_summary(ledger.records())) == ""
+        assert reconcile(actual, summary_from_totals(ledger.expected_totals())) == ""
+        assert actual.records == 120
+
+    def test_account_totals_detect_a_missing_record(self):
+        ledger = LedgerFactory(seed=9, accounts=2, records=50)
+        shown = [Record(record.title, record.category,
+                        f"{'+' if record.kind == 'income' else '-'} {record.price}", None)
+                 for record in ledger.records()][1:]
+
+        diff = reconcile(summary_from_records(shown), summary_from_totals(ledger.expected_totals()))
+
+        assert "- records: 50" in diff and "+ records: 49" in diff
+
+
+class TestRecordsPageTotals:
+
+    def test_streamed_totals_read_the_whole_list(self):
+        records = [Record(f"Registro {i}", "Categoria", f"+ {i}", None) for i in range(30)]
+        driver = FakeListDriver(records)
+
+        diff = RecordsPage(driver).totals_diff(expected_summary(
+            {"title": record.title, "price": record.price[2:]} for record in records), streamed=True)
+
+        assert diff == ""
+
+    def test_visible_totals_use_a_single_page_source(self):
+        driver = FakeListDriver([Record("Salário", "Trabalho", "+ 1000", None)] * 2)
+
+        diff = RecordsPage(driver).totals_diff(expected_summary([CREATED[0]] * 2))
+
+        assert diff == ""
+        assert driver.page_source_calls == 1
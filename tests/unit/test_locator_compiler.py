@@ -0,0 +1,64 @@
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+
+from utils.locator_compiler import compile_locator
+
+PKG_ID = "com.blogspot.e_kanivets.moneytracker:id"
+
+
+class TestLocatorCompiler:
+
+    @pytest.mark.parametrize("xpath, expected", [
+        (
+            "//android.widget.TextView[@text='Salário']",
+            'new UiSelector().className("android.widget.TextView").text("Salário")',
+        ),
+        (
+            f"//android.widget.TextView[@resource-id='{PKG_ID}/tvPrice' and contains(@text,'1000')]",
+            f'new UiSelector().className("android.widget.TextView").resourceId("{PKG_ID}/tvPrice")'
+            '.textContains("1000")',
+        ),
+        (
+            '//android.widget.TextView[@resource-id="android:id/text1" and @text="All time"]',
+            'new UiSelector().className("android.widget.TextView").resourceId("android:id/text1")'
+            '.text("All time")',
+        ),
+        (
+            "//android.widget.ImageButton[@content-desc='Open navigation drawer']",
+            'new UiSelector().className("android.widget.ImageButton").description("Open navigation drawer")',
+        ),
+        (
+            "//android.widget.TextView[@text='Diz \"olá\" and tchau']",
+            'new UiSelector().className("android.widget.TextView").text("Diz \\"olá\\" and tchau")',
+        ),
+    ])
+    def test_rewrites_simple_xpath_to_uiselector(self, xpath, expected):
+        assert compile_locator(AppiumBy.XPATH, xpath) == (AppiumBy.ANDROID_UIAUTOMATOR, expected)
+
+    def test_resource_id_only_becomes_id_lookup(self):
+        xpath = f"//*[@resource-id='{PKG_ID}/etTitle']"
+
+        assert compile_locator(AppiumBy.XPATH, xpath) == (AppiumBy.ID, f"{PKG_ID}/etTitle")
+
+    @pytest.mark.parametrize("xpath", [
+        f"//android.widget.LinearLayout[@resource-id='{PKG_ID}/container']/android.widget.LinearLayout[1]",
+        "//android.widget.TextView[@text='A' or @text='B']",
+        "//android.widget.TextView[starts-with(@text, 'A')]",
+        "//android.widget.TextView[@text='']",
+        "//android.widget.TextView[@index='2']",
+        "(//android.widget.TextView)[1]",
+    ])
+    def test_keeps_xpath_when_not_equivalent(self, xpath):
+        assert compile_locator(AppiumBy.XPATH, xpath) == (AppiumBy.XPATH, xpath)
+
+    def test_other_strategies_are_untouched(self):
+        assert compile_locator(AppiumBy.ID, f"{PKG_ID}/etPrice") == (AppiumBy.ID, f"{PKG_ID}/etPrice")
+
+    def test_compiled_locators_are_cached(self):
+        xpath = "//android.widget.TextView[@text='Cache']"
+        compile_locator(AppiumBy.XPATH, xpath)
+        hits = compile_locator.cache_info().hits
+
+        compile_locator(AppiumBy.XPATH, xpath)
+
+        assert compile_locator.cache_info().hits == hits + 1
@@ -0,0 +1,126 @@
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.navigator import Navigator
+from utils.reporting import RunReport
+
+
+class FakeElement:
+    def __init__(self, driver, locator):
+        self.driver = driver
+        self.locator = locator
+
+    def click(self):
+        self.driver.clicks.append(self.locator)
+
+
+class FakeDriver:
+    """Driver falso: aceita ou recusa intents e registra os cliques no menu."""
+
+    def __init__(self, intents_allowed=True, startup_probes=0):
+        """
+        :param startup_probes: Consultas a current_activity que ainda veem a tela anterior após o intent
+        """
+        self.intents_allowed = intents_allowed
+        self.startup_probes = startup_probes
+        self.activity = ".activity.record.MainActivity"
+        self.pending = None
+        self.intents = []
+        self.clicks = []
+
+    @property
+    def current_activity(self):
+        if self.pending and self.startup_probes <= 0:
+            self.activity, self.pending = self.pending, None
+        self.startup_probes -= 1
+        return self.activity
+
+    def execute_script(self, script, args):
+        self.intents.append(args["intent"])
+        if not self.intents_allowed:
+            raise WebDriverException("Permission Denial: starting Intent not exported")
+        self.pending = args["intent"].split("/", 1)[1]
+
+    def find_element(self, by, locator):
+        return FakeElement(self, locator)
+
+    def update_settings(self, settings):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_intent_cache():
+    Navigator._intent_unavailable.clear()
+    yield
+    Navigator._intent_unavailable.clear()
+
+
+class TestNavigator:
+
+    def test_accounts_opened_by_intent_without_menu(self):
+        driver = FakeDriver()
+
+        Navigator(driver).to_accounts()
+
+        assert driver.intents == ["com.blogspot.e_kanivets.moneytracker/.activity.account.AccountsActivity"]
+        assert driver.clicks == []
+
+    def test_add_account_goes_through_accounts_list(self):
+        driver = FakeDriver()
+
+        Navigator(driver).to_add_account()
+
+        assert len(driver.intents) == 1
+        assert len(driver.clicks) == 1
+        assert "fab_add_account" in driver.clicks[0]
+
+    def test_refused_intent_falls_back_to_menu_and_is_not_retried(self):
+        driver = FakeDriver(intents_allowed=False)
+        navigator = Navigator(driver)
+
+        navigator.to_accounts()
+        navigator.to_accounts()
+
+        assert len(driver.intents) == 1
+        assert [("drawer" in click, "Accounts" in click) for click in driver.clicks] == [(True, False),
+                                                                                         (False, True)] * 2
+
+    def test_activity_still_starting_is_awaited_without_fallback(self):
+        driver = FakeDriver(startup_probes=2)
+
+        Navigator(driver).to_accounts()
+
+        assert driver.activity.endswith("AccountsActivity")
+        assert driver.clicks == []
+        assert Navigator._intent_unavailable == set()
+
+    def test_accepted_intent_that_never_lands_raises_without_blacklisting(self, monkeypatch):
+        monkeypatch.setattr(Navigator, "activity_timeout", 0.05)
+        driver = FakeDriver(startup_probes=10 ** 6)
+
+        with pytest.raises(TimeoutException):
+            Navigator(driver).to_accounts()
+
+        assert driver.clicks == []
+        assert Navigator._intent_unavailable == set()
+
+    def test_refused_intent_is_counted(self, monkeypatch):
+        report = RunReport()
+        monkeypatch.setattr("pages.navigator.run_report", report)
+
+        Navigator(FakeDriver(intents_allowed=False)).to_accounts()
+
+        assert report.counters["intents recusados (menu lateral)"] == 1
+
+    def test_navigation_time_is_reported_per_test(self, monkeypatch):
+        report = RunReport()
+        monkeypatch.setattr("pages.navigator.run_report", report)
+        monkeypatch.setattr("pages.navigator.command_trace.current_test", "tests/test_x.py::test_a")
+
+        Navigator(FakeDriver()).to_records()
+        Navigator(FakeDriver()).to_accounts()
+
+        assert set(report.timings) == {"navegação: records (intent)", "navegação: accounts (intent)"}
+        assert report.test_metrics["tests/test_x.py::test_a"]["navegação"] >= 0
+        report.add_test_phase("tests/test_x.py::test_a", "call", 1.0)
+        assert "navegação por teste:" in report.summary_lines()
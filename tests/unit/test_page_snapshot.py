@@ -0,0 +1,94 @@
+from appium.webdriver.common.appiumby import AppiumBy
+
+from pages.records_page import RecordsPage
+from utils.page_snapshot import PageSnapshot
+
+PAGE_SOURCE = """<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>
+<hierarchy rotation="0">
+  <android.widget.FrameLayout resource-id="com.blogspot.e_kanivets.moneytracker:id/content">
+    <android.widget.LinearLayout resource-id="com.blogspot.e_kanivets.moneytracker:id/container">
+      <android.widget.LinearLayout>
+        <android.widget.TextView resource-id="com.blogspot.e_kanivets.moneytracker:id/tvTitle" text="Salário"/>
+        <android.widget.TextView resource-id="com.blogspot.e_kanivets.moneytracker:id/tvPrice" text="+ 1000"/>
+      </android.widget.LinearLayout>
+      <android.widget.LinearLayout>
+        <android.widget.TextView resource-id="com.blogspot.e_kanivets.moneytracker:id/tvTitle" text="Padaria"/>
+        <android.widget.TextView resource-id="com.blogspot.e_kanivets.moneytracker:id/tvPrice" text="- 300"/>
+      </android.widget.LinearLayout>
+    </android.widget.LinearLayout>
+    <android.widget.ImageButton content-desc="Open navigation drawer"/>
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+PRICE_ID = "com.blogspot.e_kanivets.moneytracker:id/tvPrice"
+
+
+class FakeDriver:
+    """Driver falso que conta quantas vezes o page_source foi solicitado."""
+
+    def __init__(self, page_source=PAGE_SOURCE):
+        self._page_source = page_source
+        self.page_source_calls = 0
+
+    @property
+    def page_source(self):
+        self.page_source_calls += 1
+        return self._page_source
+
+    def find_elements(self, by, selector):
+        # Volta da lista ao topo (flingToBeginning): a lista falsa já começa no topo
+        return []
+
+    def update_settings(self, settings):
+        pass
+
+
+class TestPageSnapshot:
+
+    def test_queries_by_id_xpath_and_accessibility_id(self):
+        snapshot = PageSnapshot(PAGE_SOURCE)
+
+        assert snapshot.count(AppiumBy.ID, PRICE_ID) == 2
+        assert snapshot.texts(AppiumBy.ID, PRICE_ID) == ["+ 1000", "- 300"]
+        assert snapshot.is_present(AppiumBy.XPATH, "//android.widget.TextView[@text='Salário']")
+        assert not snapshot.is_present(AppiumBy.XPATH, "//android.widget.TextView[@text='Inexistente']")
+        assert snapshot.is_present(AppiumBy.ACCESSIBILITY_ID, "Open navigation drawer")
+        assert snapshot.text(AppiumBy.XPATH, f"//*[@resource-id='{PRICE_ID}' and contains(@text,'300')]") == "- 300"
+        assert len(snapshot.find_by_text("Padaria")) == 1
+
+
+class TestBasePageSnapshotMode:
+
+    def test_record_validation_uses_single_page_source(self):
+        driver = FakeDriver()
+        records = RecordsPage(driver)
+
+        assert records.is_record_visible("Salário", price="1000")
+        assert driver.page_source_calls == 1
+
+    def test_snapshot_is_reused_until_invalidated(self):
+        driver = FakeDriver()
+        records = RecordsPage(driver)
+
+        with records.snapshot_mode():
+            records.count_elements(AppiumBy.ID, PRICE_ID)
+            records.get_texts(AppiumBy.ID, PRICE_ID)
+            assert driver.page_source_calls == 1
+
+            records.invalidate_snapshot()
+            records.count_elements(AppiumBy.ID, PRICE_ID)
+            assert driver.page_source_calls == 2
+
+        records.count_elements(AppiumBy.ID, PRICE_ID)
+        assert driver.page_source_calls == 3
+
+    def test_snapshot_is_shared_between_page_objects(self):
+        driver = FakeDriver()
+        records = RecordsPage(driver)
+        other = RecordsPage(driver)
+
+        with records.snapshot_mode():
+            records.is_element_present(AppiumBy.ID, PRICE_ID)
+            other.is_element_present(AppiumBy.ID, PRICE_ID)
+
+        assert driver.page_source_calls == 1
@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from utils.devices import Device
+from utils.prewarm import SessionPrewarmer
+
+DEVICES = [Device("device-a", 4723, 8200), Device("device-b", 4724, 8201)]
+
+
+class FakeDriver:
+    def __init__(self, device):
+        self.device = device
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            return self.now
+
+    def advance(self, seconds):
+        with self._lock:
+            self.now += seconds
+
+
+class TestSessionPrewarmer:
+
+    def _build(self):
+        clock = FakeClock()
+        prepared = []
+
+        def prepare(device):
+            prepared.append(device.udid)
+            clock.advance(10)  # limpeza de dados + criação da sessão
+            return FakeDriver(device)
+
+        return SessionPrewarmer(DEVICES, prepare, clock=clock), clock, prepared
+
+    def test_requires_two_devices(self):
+        with pytest.raises(ValueError):
+            SessionPrewarmer(DEVICES[:1], FakeDriver)
+
+    def test_devices_are_used_in_rotation(self):
+        prewarmer, _, prepared = self._build()
+
+        for _ in range(3):
+            prewarmer.take()
+            prewarmer.schedule()
+        prewarmer.close()
+
+        assert prepared == ["device-a", "device-b", "device-a", "device-b"]
+
+    def test_session_prepared_during_the_test_is_reported_as_hidden(self):
+        prewarmer, clock, _ = self._build()
+        device, driver = prewarmer.take()
+        assert driver.device is device
+        hidden_before = prewarmer.hidden_seconds
+
+        prewarmer.schedule()
+        prewarmer._pending[1].result()  # preparo concluído durante o "teste"
+        clock.advance(30)
+        device, _ = prewarmer.take()
+
+        assert device.udid == "device-b"
+        assert prewarmer.hidden_seconds - hidden_before == 10
+        assert prewarmer.prepared == 2
+        prewarmer.close()
+
+    def test_close_quits_unused_session(self):
+        prewarmer, _, _ = self._build()
+        prewarmer.schedule()
+        pending = prewarmer._pending[1]
+
+        prewarmer.close()
+
+        assert pending.result()[0].quit_called
@@ -0,0 +1,170 @@
+from pages.records_page import Record, RecordsPage
+
+ID = "com.blogspot.e_kanivets.moneytracker:id/"
+ROW_HEIGHT = 100
+
+
+def row_xml(record, top, bottom, fields=("title", "category", "price", "date")):
+    nodes = "".join(f'<android.widget.TextView resource-id="{ID}tv{field.capitalize()}" text="{getattr(record, field)}"/>'
+                    for field in fields)
+    return f'<android.widget.LinearLayout bounds="[0,{top}][1080,{bottom}]">{nodes}</android.widget.LinearLayout>'
+
+
+class FakeListDriver:
+    """
+    Driver falso com uma lista rolável de `visible` linhas de ROW_HEIGHT px.
+    O arraste move a lista pela distância pedida menos `slop` px (folga do toque), mais `overshoot` px
+    (inércia de um fling), sem passar do fim da lista. As linhas só aparecem a partir do
+    dump número `render_after` + 1 (lista ainda sendo renderizada). Como no UiAutomator2, os bounds das linhas cortadas nas bordas são limitados
+    à área visível e só os campos que aparecem na tela entram na hierarquia.
+    """
+
+    list_top = 200
+
+    def __init__(self, records, visible=6, slop=7, offset=0, overshoot=0, render_after=0):
+        self.records = records
+        self.visible = visible
+        self.slop = slop
+        self.offset = offset
+        self.overshoot = overshoot
+        self.render_after = render_after
+        self.page_source_calls = 0
+        self.scrolls = 0
+        self.rewinds = 0
+        self.taps = []
+
+    @property
+    def list_bottom(self):
+        return self.list_top + self.visible * ROW_HEIGHT
+
+    @property
+    def max_offset(self):
+        return max(0, (len(self.records) - self.visible) * ROW_HEIGHT)
+
+    @property
+    def page_source(self):
+        self.page_source_calls += 1
+        rows = []
+        for index, record in enumerate(self.records if self.page_source_calls > self.render_after else ()):
+            top = self.list_top + index * ROW_HEIGHT - self.offset
+            bottom = top + ROW_HEIGHT
+            if bottom <= self.list_top or top >= self.list_bottom:
+                continue
+            if top < self.list_top:
+                # Cortada em cima: apenas a parte de baixo da linha (valor e data) aparece
+                rows.append(row_xml(record, self.list_top, bottom, fields=("price", "date")))
+            elif bottom > self.list_bottom:
+                # Cortada embaixo: apenas o título aparece
+                rows.append(row_xml(record, top, self.list_bottom, fields=("title",)))
+            else:
+                rows.append(row_xml(record, top, bottom))
+        return ('<hierarchy><androidx.recyclerview.widget.RecyclerView scrollable="true" '
+                f'bounds="[0,{self.list_top}][1080,{self.list_bottom}]">'
+                f'<android.widget.LinearLayout resource-id="{ID}container">{"".join(rows)}'
+                '</android.widget.LinearLayout></androidx.recyclerview.widget.RecyclerView></hierarchy>')
+
+    def find_elements(self, by, selector):
+        assert "flingToBeginning" in selector, f"Busca inesperada: {selector}"
+        self.rewinds += 1
+        self.offset = 0
+        return []
+
+    def execute_script(self, script, args):
+        if script == "mobile: clickGesture":
+            self.taps.append((args["x"], args["y"]))
+            return None
+        assert script == "mobile: dragGesture"
+        self.scrolls += 1
+        distance = max(0, args["startY"] - args["endY"] - self.slop) + self.overshoot
+        self.offset = min(self.max_offset, self.offset + distance)
+        return None
+
+    def find_element(self, by, locator):
+        raise AssertionError(f"Busca inesperada: {locator}")
+
+    def update_settings(self, settings):
+        pass
+
+
+def ledger(size):
+    return [Record(f"Registro {i}", "Categoria", f"+ {i}", "01.01.2025") for i in range(size)]
+
+
+class TestIterRecords:
+
+    def test_full_list_is_read_once_in_order(self):
+        records = ledger(30)
+        driver = FakeListDriver(records)
+
+        assert list(RecordsPage(driver).iter_records()) == records
+        assert driver.page_source_calls == driver.scrolls + 1
+
+    def test_stops_scrolling_when_consumer_stops(self):
+        driver = FakeListDriver(ledger(1000))
+
+        assert RecordsPage(driver).is_record_visible("Registro 8", price="8")
+        assert driver.scrolls == 1
+        assert driver.page_source_calls == 2
+
+    def test_reading_starts_from_the_top_of_the_list(self):
+        records = ledger(40)
+        driver = FakeListDriver(records, offset=1500)
+        page = RecordsPage(driver)
+
+        assert page.is_record_visible("Registro 30")
+        assert page.count_records_by_title("Registro 0") == 1
+        assert list(page.iter_records()) == records
+        assert driver.rewinds == 3
+
+    def test_identical_records_are_not_merged(self):
+        records = ledger(10) + [Record("Repetido", "Categoria", "+ 5", "02.01.2025")] * 3 + ledger(10)
+        driver = FakeListDriver(records)
+
+        assert RecordsPage(driver).count_records_by_title("Repetido") == 3
+
+    def test_screens_of_identical_records_are_all_counted(self):
+        repeated = [Record("Repetido", "Categoria", "+ 5", "02.01.2025")] * 20
+        records = ledger(4) + repeated + ledger(5)
+        driver = FakeListDriver(records)
+
+        assert list(RecordsPage(driver).iter_records()) == records
+        assert RecordsPage(driver).count_records_by_title("Repetido") == 20
+
+    def test_rows_cut_at_the_edges_are_read_on_the_next_screen(self):
+        records = ledger(20)
+        driver = FakeListDriver(records, slop=20)
+
+        assert list(RecordsPage(driver).iter_records()) == records
+
+    def test_list_without_scroll_is_read_from_a_single_dump(self):
+        driver = FakeListDriver(ledger(3))
+
+        assert len(list(RecordsPage(driver).iter_records())) == 3
+        assert driver.page_source_calls <= 2
+
+    def test_missing_record_reads_until_the_end(self):
+        driver = FakeListDriver(ledger(50))
+
+        assert not RecordsPage(driver).is_record_visible("Inexistente")
+        assert driver.offset == driver.max_offset
+
+    def test_first_dump_waits_for_the_list_to_render(self):
+        driver = FakeListDriver(ledger(10), render_after=2)
+
+        assert list(RecordsPage(driver).iter_records()) == ledger(10)
+
+    def test_fling_past_the_anchor_does_not_count_rows_twice(self):
+        for overshoot in (60, 150):
+            records = ledger(40)
+            driver = FakeListDriver(records, overshoot=overshoot)
+
+            assert list(RecordsPage(driver).iter_records()) == records
+
+    def test_delete_first_record_taps_the_first_row(self):
+        driver = FakeListDriver(ledger(10), offset=250)
+        driver.find_element = lambda by, locator: type("Button", (), {"click": lambda self: None})()
+
+        RecordsPage(driver).delete_first_record()
+
+        assert driver.taps == [(540, 250)]
+        assert driver.scrolls == 0
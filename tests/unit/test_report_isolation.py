@@ -0,0 +1,14 @@
+from utils.element_cache import ElementCache
+from utils.reporting import run_report
+
+
+class TestReportIsolation:
+    """Os dois testes juntos garantem que nada registrado em um teste chega ao seguinte."""
+
+    def test_counters_start_empty(self):
+        assert not run_report.counters
+        ElementCache().get(("id", "a"))
+        assert run_report.counters["cache de elementos: falhas"] == 1
+
+    def test_counters_from_previous_test_are_discarded(self):
+        assert not run_report.counters
@@ -0,0 +1,184 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from pages.accounts_page import AccountsPage
+from pages.add_account_page import AddAccountPage
+from pages.add_incomeexpense_page import AddIncomeExpensePage
+from pages.home_page import HomePage
+from pages.navigator import Navigator
+from pages.records_page import RecordsPage
+from pages.screen_graph import Edge, EdgeCosts, ScreenGraph
+
+MAIN = ".activity.record.MainActivity"
+ACCOUNTS = ".activity.account.AccountsActivity"
+ADD_ACCOUNT = ".activity.account.AddAccountActivity"
+ADD_RECORD = ".activity.record.AddRecordActivity"
+
+
+class FakeElement:
+    def __init__(self, driver, locator):
+        self.driver = driver
+        self.locator = locator
+
+    def click(self):
+        self.driver.click(self.locator)
+
+
+class FakeDriver:
+    """Driver falso que simula a pilha de activities do aplicativo."""
+
+    # Activity aberta pelo clique em cada localizador (demais cliques não mudam a tela)
+    _click_targets = {"fab_add_account": ADD_ACCOUNT, "btnAddIncome": ADD_RECORD, "Accounts": ACCOUNTS}
+
+    def __init__(self, activity=MAIN, intents_allowed=True):
+        self.stack = [activity]
+        self.intents_allowed = intents_allowed
+        self.actions = []
+        self.probes = 0
+        self.ignored_backs = 0
+
+    @property
+    def current_activity(self):
+        self.probes += 1
+        return self.stack[-1]
+
+    def execute_script(self, script, args):
+        self.actions.append("intent")
+        if not self.intents_allowed:
+            raise WebDriverException("Permission Denial: starting Intent not exported")
+        self.stack.append(args["intent"].split("/", 1)[1])
+
+    def back(self):
+        self.actions.append("back")
+        if self.ignored_backs:
+            self.ignored_backs -= 1
+            return
+        self.stack.pop()
+
+    def click(self, locator):
+        self.actions.append("click")
+        for marker, activity in self._click_targets.items():
+            if marker in locator:
+                self.stack.append(activity)
+
+    def find_element(self, by, locator):
+        return FakeElement(self, locator)
+
+    def update_settings(self, settings):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset_intent_cache(monkeypatch):
+    monkeypatch.setattr(Navigator, "activity_timeout", 0.05)
+    Navigator._intent_unavailable.clear()
+    yield
+    Navigator._intent_unavailable.clear()
+
+
+def graph(driver, costs=None):
+    return ScreenGraph(driver, costs=costs or EdgeCosts(), clock=FakeClock())
+
+
+class TestScreenGraph:
+
+    def test_current_screen_is_detected_with_one_probe(self):
+        driver = FakeDriver(ADD_ACCOUNT)
+
+        assert graph(driver).current_screen() == "add_account"
+        assert driver.probes == 1
+
+    def test_goto_returns_destination_page(self):
+        driver = FakeDriver()
+
+        page = graph(driver).goto(AddAccountPage)
+
+        assert isinstance(page, AddAccountPage)
+        assert driver.stack[-1] == ADD_ACCOUNT
+        assert driver.actions == ["intent", "click"]
+
+    def test_goto_current_screen_takes_no_action(self):
+        driver = FakeDriver()
+
+        graph(driver).goto(RecordsPage)
+
+        assert driver.actions == []
+
+    def test_screens_already_on_the_stack_are_reached_with_back(self):
+        driver = FakeDriver()
+        driver.stack = [MAIN, ACCOUNTS, ADD_ACCOUNT]
+
+        graph(driver).goto(HomePage)
+
+        assert driver.actions == ["back", "back"]
+        assert driver.stack == [MAIN]
+
+    def test_lost_back_is_detected_and_replanned(self):
+        driver = FakeDriver()
+        driver.stack = [MAIN, ACCOUNTS]
+        driver.ignored_backs = 1  # ex.: o primeiro back apenas fecha o teclado
+
+        page = graph(driver).goto(HomePage)
+
+        assert isinstance(page, HomePage)
+        assert driver.actions == ["back", "back"]
+        assert driver.stack == [MAIN]
+
+    def test_click_that_does_not_open_the_screen_raises(self):
+        driver = FakeDriver()
+        driver.stack = [MAIN, ACCOUNTS]
+        driver._click_targets = {}
+
+        with pytest.raises(RuntimeError, match="add_account"):
+            graph(driver).goto(AddAccountPage)
+
+    def test_measured_costs_change_the_plan(self):
+        costs = EdgeCosts()
+        assert [edge.method for edge in graph(FakeDriver(), costs).plan("home", "accounts")] == ["intent"]
+
+        for _ in range(3):
+            costs.record(Edge("home", "accounts", "intent"), 5.0)
+
+        assert [edge.method for edge in graph(FakeDriver(), costs).plan("home", "accounts")] == ["menu"]
+
+    def test_refused_intent_is_replanned_through_the_menu(self):
+        driver = FakeDriver(intents_allowed=False)
+
+        graph(driver).goto(AccountsPage)
+
+        assert driver.stack[-1] == ACCOUNTS
+        assert driver.actions == ["intent", "click", "click"]
+        assert driver.probes == 3  # detecção inicial, consulta após a falha e conferência do menu
+
+    def test_form_reached_from_accounts(self):
+        driver = FakeDriver()
+        driver.stack = [MAIN, ACCOUNTS]
+
+        graph(driver).goto(AddIncomeExpensePage)
+
+        assert driver.stack[-1] == ADD_RECORD
+        assert driver.actions == ["back", "click"]
+
+    def test_unknown_screen_raises(self):
+        with pytest.raises(RuntimeError):
+            graph(FakeDriver(".activity.settings.SettingsActivity")).goto(HomePage)
+
+    def test_costs_round_trip(self):
+        costs = EdgeCosts()
+        edge = Edge("accounts", "home", "back")
+        costs.record(edge, 0.4)
+
+        restored = EdgeCosts()
+        restored.load(costs.dump())
+
+        assert restored.cost(edge) == 0.4
+        assert restored.cost(Edge("home", "accounts", "menu")) == EdgeCosts.DEFAULTS["menu"]
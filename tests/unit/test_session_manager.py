@@ -0,0 +1,127 @@
+from pages.base_page import BasePage, _element_caches
+from utils.session_manager import SessionManager
+from utils.session_pool import SessionPool
+
+
+class FakeDriver:
+    """Driver falso que registra settings e indica se a sessão responde."""
+
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.settings = {}
+
+    def update_settings(self, settings):
+        self.settings.update(settings)
+
+    def terminate_app(self, package):
+        pass
+
+    def activate_app(self, package):
+        pass
+
+
+class TestSessionManager:
+
+    def _build_manager(self):
+        created = []
+        stops = []
+
+        def factory():
+            driver = FakeDriver(f"sessão {len(created) + 1}")
+            created.append(driver)
+            return driver
+
+        manager = SessionManager(factory, lambda driver: driver.alive, lambda: stops.append(True))
+        return manager, created, stops
+
+    def test_proxy_delegates_to_current_driver(self):
+        manager, _, _ = self._build_manager()
+        proxy = manager.attach(FakeDriver("inicial"))
+
+        assert proxy.name == "inicial"
+
+    def test_recover_switches_every_holder_of_the_proxy(self):
+        manager, created, stops = self._build_manager()
+        proxy = manager.attach(FakeDriver("inicial"))
+        first_page, second_page = BasePage(proxy), BasePage(proxy)
+        manager.driver.alive = False
+
+        manager.recover()
+
+        assert first_page.driver.name == second_page.driver.name == "sessão 1"
+        assert len(created) == 1
+        assert stops == [True]
+        assert manager.recoveries == 1
+
+    def test_recover_is_skipped_when_session_already_responds(self):
+        manager, created, _ = self._build_manager()
+        manager.attach(FakeDriver("inicial"))
+        manager.driver.alive = False
+
+        manager.recover()
+        manager.recover()
+
+        assert len(created) == 1
+        assert manager.recoveries == 1
+
+    def test_recover_replays_settings_and_registered_steps(self):
+        manager, _, _ = self._build_manager()
+        proxy = manager.attach(FakeDriver("inicial"))
+        replayed = []
+        manager.add_replay_step(lambda driver: replayed.append(driver.name))
+        proxy.update_settings({"waitForIdleTimeout": 0})
+        manager.driver.alive = False
+
+        manager.recover()
+
+        assert manager.driver.settings == {"waitForIdleTimeout": 0}
+        assert replayed == ["sessão 1"]
+
+    def test_attach_does_not_carry_settings_to_new_test(self):
+        manager, _, _ = self._build_manager()
+        proxy = manager.attach(FakeDriver("teste 1"))
+        proxy.update_settings({"waitForIdleTimeout": 0})
+
+        manager.attach(FakeDriver("teste 2"))
+
+        assert manager.session_settings == {}
+
+    def test_failed_before_restart_does_not_block_recovery(self):
+        manager, created, _ = self._build_manager()
+        manager.before_restart = lambda: 1 / 0
+        manager.attach(FakeDriver("inicial")).alive = False
+
+        manager.recover()
+
+        assert len(created) == 1
+
+    def test_pool_adopts_recovered_session(self):
+        manager, _, _ = self._build_manager()
+        pool = SessionPool(lambda: FakeDriver("pool"), lambda: None, lambda driver: driver.alive, "pkg")
+        manager.add_listener(pool.adopt)
+        manager.attach(pool.acquire()).alive = False
+
+        manager.recover()
+
+        assert pool.driver is manager.driver
+        assert pool.acquire() is manager.driver
+        assert pool.sessions_created == 1
+
+
+class TestSessionStateInvalidation:
+
+    def test_element_cache_of_shared_proxy_is_dropped_on_recovery(self):
+        from utils.session_manager import session_manager
+
+        previous = session_manager.driver
+        try:
+            proxy = session_manager.attach(FakeDriver("inicial"))
+            page = BasePage(proxy)
+            page.element_cache.put(("id", "botao"), object())
+
+            session_manager.attach(FakeDriver("nova"))
+
+            assert proxy not in _element_caches
+        finally:
+            session_manager.driver = previous
@@ -0,0 +1,93 @@
+from utils.reporting import RunReport
+from utils.session_pool import SessionPool
+
+PACKAGE = "com.example.app"
+
+
+class FakeDriver:
+    """Driver falso que registra as chamadas recebidas."""
+
+    def __init__(self):
+        self.calls = []
+        self.alive = True
+
+    def terminate_app(self, package):
+        self.calls.append(("terminate_app", package))
+
+    def activate_app(self, package):
+        self.calls.append(("activate_app", package))
+
+    def quit(self):
+        self.calls.append(("quit",))
+
+
+class TestSessionPool:
+
+    def _build_pool(self):
+        created = []
+        resets = []
+
+        def factory():
+            driver = FakeDriver()
+            created.append(driver)
+            return driver
+
+        pool = SessionPool(factory, lambda: resets.append(True), lambda driver: driver.alive, PACKAGE)
+        return pool, created, resets
+
+    def test_first_acquire_creates_session(self):
+        pool, created, resets = self._build_pool()
+
+        driver = pool.acquire()
+
+        assert created == [driver]
+        assert len(resets) == 1
+        assert pool.sessions_created == 1
+        assert pool.sessions_reused == 0
+
+    def test_next_acquire_reuses_session_and_restarts_app(self):
+        pool, created, resets = self._build_pool()
+        first = pool.acquire()
+
+        second = pool.acquire()
+
+        assert second is first
+        assert len(created) == 1
+        assert len(resets) == 2
+        assert first.calls == [("terminate_app", PACKAGE), ("activate_app", PACKAGE)]
+        assert pool.sessions_reused == 1
+
+    def test_dead_session_is_replaced(self):
+        pool, created, _ = self._build_pool()
+        first = pool.acquire()
+        first.alive = False
+
+        second = pool.acquire()
+
+        assert second is not first
+        assert len(created) == 2
+        assert pool.sessions_created == 2
+
+    def test_close_quits_driver(self):
+        pool, _, _ = self._build_pool()
+        driver = pool.acquire()
+
+        pool.close()
+
+        assert ("quit",) in driver.calls
+        assert pool.driver is None
+
+
+class TestRunReport:
+
+    def test_summary_lists_each_test_and_total(self):
+        report = RunReport()
+        report.add_test_phase("tests/test_a.py::test_one", "setup", 2.0)
+        report.add_test_phase("tests/test_a.py::test_one", "call", 1.0)
+        report.incr("sessões criadas")
+
+        lines = report.summary_lines()
+
+        assert any("test_one" in line and "3.00s" in line for line in lines)
+        assert any("TOTAL" in line for line in lines)
+        assert "sessões criadas: 1" in lines
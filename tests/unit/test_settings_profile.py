@@ -0,0 +1,86 @@
+from pages.accounts_page import AccountsPage
+from pages.base_page import BasePage, DEFAULT_SETTINGS
+from pages.records_page import RecordsPage
+from utils.session_manager import SessionManager, session_manager
+
+
+class FakeDriver:
+    def __init__(self):
+        self.sent = []
+
+    def update_settings(self, settings):
+        self.sent.append(dict(settings))
+
+    def find_elements(self, by, locator):
+        return []
+
+
+class TestSettingsProfile:
+
+    def test_profile_is_sent_once_while_page_is_used(self):
+        driver = FakeDriver()
+        records = RecordsPage(driver)
+
+        records.is_element_absent(*RecordsPage._delete_button)
+        records.is_element_absent(*RecordsPage._edit_button)
+
+        assert driver.sent == [RecordsPage.settings_profile]
+
+    def test_only_changed_settings_are_sent_between_pages(self):
+        driver = FakeDriver()
+        RecordsPage(driver).apply_settings_profile()
+
+        AccountsPage(driver).apply_settings_profile()
+
+        assert driver.sent[1] == {"ignoreUnimportantViews": True,
+                                  "snapshotMaxDepth": DEFAULT_SETTINGS["snapshotMaxDepth"]}
+
+    def test_records_page_keeps_unimportant_views(self):
+        driver = FakeDriver()
+        AccountsPage(driver).apply_settings_profile()
+
+        RecordsPage(driver).apply_settings_profile()
+
+        assert driver.sent[1]["ignoreUnimportantViews"] is False
+
+    def test_page_without_profile_restores_defaults(self):
+        driver = FakeDriver()
+        RecordsPage(driver).apply_settings_profile()
+
+        BasePage(driver).apply_settings_profile()
+        BasePage(driver).apply_settings_profile()
+
+        assert driver.sent[1] == {name: DEFAULT_SETTINGS[name] for name in RecordsPage.settings_profile}
+        assert len(driver.sent) == 2
+
+    def test_page_without_profile_sends_nothing_on_fresh_session(self):
+        driver = FakeDriver()
+
+        BasePage(driver).apply_settings_profile()
+
+        assert driver.sent == []
+
+    def test_new_session_receives_profile_again(self):
+        previous = session_manager.driver
+        try:
+            first = FakeDriver()
+            proxy = session_manager.attach(first)
+            RecordsPage(proxy).apply_settings_profile()
+
+            second = FakeDriver()
+            session_manager.attach(second)
+            RecordsPage(proxy).apply_settings_profile()
+
+            assert second.sent == [RecordsPage.settings_profile]
+        finally:
+            session_manager.driver = previous
+
+    def test_profile_is_replayed_after_recovery(self):
+        drivers = [FakeDriver()]
+        manager = SessionManager(lambda: drivers.append(FakeDriver()) or drivers[-1], lambda driver: False)
+        proxy = manager.attach(drivers[0])
+        RecordsPage(proxy).apply_settings_profile()
+
+        manager.recover()
+
+        assert drivers[1].sent == [RecordsPage.settings_profile]
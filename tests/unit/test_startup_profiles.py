@@ -0,0 +1,70 @@
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+
+from utils.devices import Device
+from utils.startup_profiles import StartupProfiles
+
+DEVICE_A = Device("emulator-5554", 4723, 8200)
+DEVICE_B = Device("emulator-5556", 4724, 8201)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStartupProfiles:
+
+    def _build(self, durations=None, failures=()):
+        clock = FakeClock()
+        sent = []
+        failures = list(failures)
+
+        def create(capabilities):
+            sent.append(capabilities)
+            warm = capabilities.get("appium:skipServerInstallation", False)
+            clock.now += (durations or {}).get("warm" if warm else "cold", 1)
+            if failures and failures.pop(0):
+                raise SessionNotCreatedException("servidor UiAutomator2 não instalado")
+            return object()
+
+        return StartupProfiles(clock=clock), create, sent
+
+    def test_first_session_is_cold_and_next_ones_warm(self):
+        profiles, create, sent = self._build({"cold": 20, "warm": 4})
+
+        profiles.start(DEVICE_A, create)
+        profiles.start(DEVICE_A, create)
+
+        assert "appium:uiautomator2ServerInstallTimeout" in sent[0]
+        assert sent[1]["appium:skipServerInstallation"] is True
+        assert sent[1]["appium:skipDeviceInitialization"] is True
+        assert profiles.samples == {"cold": [20], "warm": [4]}
+
+    def test_profile_is_tracked_per_device(self):
+        profiles, create, _ = self._build()
+
+        profiles.start(DEVICE_A, create)
+
+        assert profiles.profile_for(DEVICE_A) == "warm"
+        assert profiles.profile_for(DEVICE_B) == "cold"
+
+    def test_failed_warm_start_falls_back_to_cold(self):
+        profiles, create, sent = self._build(failures=[False, True, False])
+        profiles.start(DEVICE_A, create)
+
+        profiles.start(DEVICE_A, create)
+
+        assert [("appium:skipServerInstallation" in caps) for caps in sent] == [False, True, False]
+        assert len(profiles.samples["cold"]) == 2
+        assert profiles.profile_for(DEVICE_A) == "warm"
+
+    def test_failed_cold_start_is_raised(self):
+        profiles, create, _ = self._build(failures=[True])
+
+        with pytest.raises(SessionNotCreatedException):
+            profiles.start(DEVICE_A, create)
+        assert profiles.profile_for(DEVICE_A) == "cold"
@@ -0,0 +1,206 @@
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from pages.base_page import BasePage
+from utils.wait_engine import LatencyBudgets, WaitEngine, locator_key
+
+
+class FakeClock:
+    """Relógio simulado: sleep apenas avança o tempo."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeDriver:
+    """Driver falso cujo elemento aparece a partir de um instante do relógio simulado."""
+
+    def __init__(self, clock, appears_at=None):
+        self.clock = clock
+        self.appears_at = appears_at
+        self.find_elements_calls = 0
+
+    def _visible(self):
+        return self.appears_at is not None and self.clock() >= self.appears_at
+
+    def find_element(self, by, locator):
+        if not self._visible():
+            raise NoSuchElementException(locator)
+        return "element"
+
+    def find_elements(self, by, locator):
+        self.find_elements_calls += 1
+        return ["element"] if self._visible() else []
+
+
+def build_engine(clock, **kwargs):
+    return WaitEngine(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestWaitEngine:
+
+    def test_polling_uses_exponential_backoff(self):
+        clock = FakeClock()
+        engine = build_engine(clock, initial_poll=0.1, backoff=2, max_poll=0.5)
+
+        with pytest.raises(TimeoutException):
+            engine.until(lambda: False, timeout=1.5)
+
+        assert clock.sleeps[:4] == [0.1, 0.2, 0.4, 0.5]
+        assert clock.now == pytest.approx(1.5)
+
+    def test_find_returns_as_soon_as_element_appears(self):
+        clock = FakeClock()
+        engine = build_engine(clock, timeout=15)
+
+        assert engine.find(FakeDriver(clock, appears_at=0.3), AppiumBy.ID, "a") == "element"
+        assert clock.now < 1
+
+    def test_missing_element_costs_at_most_the_total_timeout(self):
+        clock = FakeClock()
+        engine = build_engine(clock, timeout=15)
+
+        with pytest.raises(TimeoutException):
+            engine.find(FakeDriver(clock), AppiumBy.ID, "a")
+
+        assert clock.now == pytest.approx(15)
+
+    def test_learned_budget_is_tried_before_extending(self):
+        clock = FakeClock()
+        budgets = LatencyBudgets(multiplier=2, minimum=1, maximum=15)
+        for _ in range(10):
+            budgets.record(locator_key(AppiumBy.ID, "a"), 0.5)
+        engine = build_engine(clock, timeout=15, budgets=budgets)
+
+        assert engine.budget_for(AppiumBy.ID, "a") == 1
+        with pytest.raises(TimeoutException):
+            engine.find(FakeDriver(clock), AppiumBy.ID, "a", timeout=engine.budget_for(AppiumBy.ID, "a"))
+        assert clock.now == pytest.approx(1)
+
+        clock.now = 0
+        assert engine.find(FakeDriver(clock, appears_at=4), AppiumBy.ID, "a") == "element"
+
+    def test_absence_fast_path_does_not_wait(self):
+        clock = FakeClock()
+        engine = build_engine(clock)
+        driver = FakeDriver(clock)
+
+        assert engine.is_absent(driver, AppiumBy.ID, "a")
+        assert driver.find_elements_calls == 1
+        assert clock.now == 0
+
+    def test_wait_until_absent(self):
+        clock = FakeClock()
+        engine = build_engine(clock)
+
+        assert not engine.wait_until_absent(FakeDriver(clock, appears_at=0), AppiumBy.ID, "a", timeout=2)
+        assert engine.wait_until_absent(FakeDriver(clock), AppiumBy.ID, "a", timeout=2)
+
+
+class TestLatencyBudgets:
+
+    def test_unknown_locator_uses_maximum(self):
+        assert LatencyBudgets(maximum=15).budget("x") == 15
+
+    def test_budget_is_clamped_and_round_trips(self):
+        budgets = LatencyBudgets(multiplier=3, minimum=2, maximum=10)
+        budgets.record("fast", 0.1)
+        budgets.record("slow", 8)
+
+        restored = LatencyBudgets(multiplier=3, minimum=2, maximum=10)
+        restored.load(budgets.dump())
+
+        assert restored.budget("fast") == 2
+        assert restored.budget("slow") == 10
+
+
+class SequenceDriver:
+    """Driver falso que devolve uma sequência de page sources e contagens de itens."""
+
+    def __init__(self, sources=(), counts=()):
+        self.sources = list(sources)
+        self.counts = list(counts)
+
+    @property
+    def page_source(self):
+        return self.sources.pop(0) if len(self.sources) > 1 else self.sources[0]
+
+    def find_elements(self, by, locator):
+        count = self.counts.pop(0) if len(self.counts) > 1 else self.counts[0]
+        return ["item"] * count
+
+
+class TestScreenStability:
+
+    def _page(self, driver, clock):
+        page = BasePage(driver)
+        page.waits = build_engine(clock)
+        return page
+
+    def test_wait_until_stable_returns_once_screen_settles(self):
+        clock = FakeClock()
+        page = self._page(SequenceDriver(sources=["<a/>", "<b/>", "<c/>", "<c/>", "<d/>"]), clock)
+
+        assert page.wait_until_stable(timeout=5)
+        assert len(clock.sleeps) == 3
+
+    def test_wait_until_stable_gives_up_after_timeout(self):
+        clock = FakeClock()
+        page = self._page(SequenceDriver(sources=[f"<n{i}/>" for i in range(1000)]), clock)
+
+        assert not page.wait_until_stable(timeout=1)
+        assert clock.now == pytest.approx(1)
+
+    def test_wait_for_list_change(self):
+        clock = FakeClock()
+        page = self._page(SequenceDriver(counts=[2, 2, 1, 0]), clock)
+
+        assert page.wait_for_list_change(AppiumBy.ID, "item", previous_count=2) == 1
+        assert page.wait_for_list_change(AppiumBy.ID, "item", previous_count=1) == 0
+        assert page.wait_for_list_change(AppiumBy.ID, "item", previous_count=0, timeout=1) is None
+
+
+class DisplayedElement:
+    def is_displayed(self):
+        return True
+
+
+class TestVisibilityChecks:
+
+    def _page(self, clock, appears_at):
+        driver = FakeDriver(clock, appears_at)
+        driver.find_element = lambda by, locator: (
+            DisplayedElement() if driver._visible() else FakeDriver.find_element(driver, by, locator))
+        driver.update_settings = lambda settings: None
+        budgets = LatencyBudgets(multiplier=2, minimum=1, maximum=15)
+        for _ in range(10):
+            budgets.record(locator_key(AppiumBy.ID, "a"), 0.5)
+        page = BasePage(driver)
+        page.waits = build_engine(clock, timeout=15, budgets=budgets)
+        return page
+
+    def test_positive_check_extends_past_the_learned_budget(self):
+        clock = FakeClock()
+
+        assert self._page(clock, appears_at=8).is_element_displayed(AppiumBy.ID, "a")
+
+    def test_positive_check_gives_up_at_the_full_timeout(self):
+        clock = FakeClock()
+
+        assert not self._page(clock, appears_at=None).is_element_displayed(AppiumBy.ID, "a")
+        assert clock.now == pytest.approx(15)
+
+    def test_negative_check_does_not_wait(self):
+        clock = FakeClock()
+
+        assert self._page(clock, appears_at=None).is_element_absent(AppiumBy.ID, "a")
+        assert clock.now == 0
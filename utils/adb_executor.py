@@ -0,0 +1,154 @@
+import asyncio
+import os
+import signal
+import time
+from dataclasses import dataclass
+
+# Marcador impresso após cada comando de um lote, seguido do índice e do código de saída
+BATCH_MARKER = "__adb_batch_rc__"
+
+
+@dataclass(frozen=True)
+class AdbResult:
+    """Resultado estruturado de um comando adb."""
+
+    args: tuple
+    returncode: int | None
+    stdout: str = ""
+    stderr: str = ""
+    seconds: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.timed_out
+
+
+class AdbError(RuntimeError):
+    """Falha (código de saída diferente de zero ou timeout) de um comando adb."""
+
+    def __init__(self, result):
+        reason = "timeout" if result.timed_out else f"código {result.returncode}"
+        output = (result.stderr or result.stdout).strip()
+        super().__init__(f"adb {' '.join(result.args)} falhou ({reason}): {output}")
+        self.result = result
+
+
+class AdbExecutor:
+    """
+    Executor de comandos adb sem shell intermediário (asyncio + create_subprocess_exec).
+    - shell_batch: vários comandos de um dispositivo em um único processo `adb shell`,
+      com o código de saída de cada comando;
+    - run_many: comandos independentes executados em paralelo;
+    - timeout por chamada, com o processo finalizado ao estourar.
+    """
+
+    def __init__(self, adb_path="adb", timeout=30.0, max_concurrency=4):
+        """
+        :param adb_path: Executável do adb (substituível por um adb falso em testes)
+        :param timeout: Timeout padrão de cada chamada (segundos)
+        :param max_concurrency: Máximo de processos adb simultâneos em run_many
+        """
+        self.adb_path = adb_path
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+
+    async def _exec(self, udid, args, timeout):
+        args = ("-s", udid, *args)
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            self.adb_path, *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            start_new_session=os.name == "posix",
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            _kill(process)
+            await process.wait()
+            return AdbResult(args, None, seconds=time.perf_counter() - start, timed_out=True)
+        return AdbResult(args, process.returncode, stdout.decode(errors="replace"),
+                         stderr.decode(errors="replace"), time.perf_counter() - start)
+
+    def run(self, device, *args, timeout=None, check=False):
+        """
+        Executa um comando adb no dispositivo (ex.: run(device, "push", local, remoto)).
+
+        :param check: Lança AdbError se o comando falhar
+        :return: AdbResult
+        """
+        result = asyncio.run(self._exec(device.udid, args, timeout))
+        if check and not result.ok:
+            raise AdbError(result)
+        return result
+
+    def shell(self, device, command, timeout=None, check=False):
+        """Executa um comando no shell do dispositivo."""
+        return self.run(device, "shell", command, timeout=timeout, check=check)
+
+    def shell_batch(self, device, commands, timeout=None):
+        """
+        Executa os comandos em sequência em um único processo `adb shell`.
+        Cada comando tem sua própria saída e código de saída; uma falha não interrompe os seguintes.
+
+        :return: Lista de AdbResult, na ordem dos comandos
+        """
+        script = "; ".join(f"{command} 2>&1; echo {BATCH_MARKER}{index}:$?"
+                           for index, command in enumerate(commands))
+        result = asyncio.run(self._exec(device.udid, ("shell", script), timeout))
+        return split_batch_output(commands, result)
+
+    def run_many(self, calls, timeout=None):
+        """
+        Executa comandos independentes em paralelo (limitado a max_concurrency processos).
+
+        :param calls: Sequência de tuplas (device, args), ex.: [(device, ("shell", "pm clear pkg"))]
+        :return: Lista de AdbResult, na ordem das chamadas
+        """
+        async def gather():
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def limited(device, args):
+                async with semaphore:
+                    return await self._exec(device.udid, tuple(args), timeout)
+
+            return await asyncio.gather(*(limited(device, args) for device, args in calls))
+
+        return list(asyncio.run(gather()))
+
+
+def _kill(process):
+    # No POSIX o grupo inteiro é finalizado, para que processos filhos não mantenham a saída aberta
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        return
+    process.kill()
+
+
+def split_batch_output(commands, result):
+    """
+    Separa a saída de um lote do shell_batch em um AdbResult por comando.
+    Comandos que não chegaram a ser executados (ex.: timeout do lote) recebem returncode None.
+    """
+    results = []
+    lines = []
+    for line in result.stdout.splitlines():
+        index = len(results)
+        if index < len(commands) and line.startswith(f"{BATCH_MARKER}{index}:"):
+            code = int(line.rpartition(":")[2])
+            results.append(AdbResult(("shell", commands[index]), code, "\n".join(lines)))
+            lines = []
+        else:
+            lines.append(line)
+
+    for command in commands[len(results):]:
+        results.append(AdbResult(("shell", command), None, "\n".join(lines), result.stderr,
+                                 timed_out=result.timed_out))
+        lines = []
+    return results
+
+
+# Instância única compartilhada pelas fixtures
+adb_executor = AdbExecutor()
@@ -0,0 +1,101 @@
+import time
+from pathlib import Path
+
+from data.data import AccountData, IncomeExpenseData
+from utils.adb_executor import adb_executor
+
+DEVICE_TMP_DIR = "/data/local/tmp"
+
+# Diretórios do app que não fazem parte do estado (recriados pelo Android)
+EXCLUDED_DIRS = ("cache", "code_cache", "lib")
+
+# Diretórios removidos antes da restauração de um checkpoint
+STATE_DIRS = ("databases", "shared_prefs", "files", "no_backup")
+
+
+def _one_account(db):
+    db.add_account(AccountData.VALID_ACCOUNT_NAME, AccountData.VALID_ACCOUNT_VALUE)
+
+
+def _account_with_500_records(db):
+    _one_account(db)
+    for index in range(500):
+        db.add_record(f"{IncomeExpenseData.VALID_INCOME_TITLE} {index:03d}", IncomeExpenseData.VALID_INCOME_PRICE,
+                      IncomeExpenseData.VALID_INCOME_CATEGORY, AccountData.VALID_ACCOUNT_NAME)
+
+
+# Checkpoints nomeados: função que recebe o LedgerDatabase (ver utils.db_seeder) e monta o estado
+CHECKPOINTS = {
+    "empty": lambda db: None,
+    "one_account": _one_account,
+    "account_with_500_records": _account_with_500_records,
+}
+
+
+class AppStateStore:
+    """
+    Armazena checkpoints do diretório de dados do aplicativo como arquivos tar locais.
+    Cada estado é capturado uma vez por execução e restaurado antes de cada teste
+    que o declara, em vez de `pm clear` seguido da recriação pela interface.
+    Requer APK depurável (acesso via run-as).
+    """
+
+    def __init__(self, device, package, archive_dir, executor=adb_executor):
+        """
+        :param device: Device alvo (ver utils.devices)
+        :param package: Pacote do aplicativo
+        :param archive_dir: Diretório local onde os arquivos tar são mantidos
+        :param executor: AdbExecutor usado nos comandos adb (substituível por um adb falso em testes)
+        """
+        self.device = device
+        self.package = package
+        self.archive_dir = Path(archive_dir)
+        self._executor = executor
+
+    def _remote_tmp(self, name):
+        return f"{DEVICE_TMP_DIR}/{self.package}.{name}.tar"
+
+    def archive_path(self, name):
+        return self.archive_dir / f"{name}.tar"
+
+    def has(self, name):
+        """Indica se o checkpoint já foi capturado nesta execução."""
+        return self.archive_path(name).exists()
+
+    def capture(self, name):
+        """
+        Salva o diretório de dados atual do aplicativo como checkpoint.
+        O aplicativo deve estar finalizado para que o banco esteja consistente.
+
+        :return: Caminho local do arquivo tar
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        remote_tmp = self._remote_tmp(name)
+        excludes = " ".join(f"--exclude=./{directory}" for directory in EXCLUDED_DIRS)
+        # O tar passa pelo diretório temporário do dispositivo: o adb entrega a saída como texto
+        try:
+            self._executor.shell(self.device, f"run-as {self.package} tar -cf - {excludes} . > {remote_tmp}",
+                                 check=True)
+            self._executor.run(self.device, "pull", remote_tmp, str(self.archive_path(name)), check=True)
+        finally:
+            self._executor.shell(self.device, f"rm -f {remote_tmp}")
+        return self.archive_path(name)
+
+    def restore(self, name):
+        """
+        Substitui o diretório de dados do aplicativo pelo checkpoint informado.
+
+        :return: Tempo gasto na restauração (segundos)
+        """
+        if not self.has(name):
+            raise KeyError(f"Checkpoint '{name}' ainda não foi capturado.")
+        start = time.perf_counter()
+        remote_tmp = self._remote_tmp(name)
+        self._executor.run(self.device, "push", str(self.archive_path(name)), remote_tmp, check=True)
+        try:
+            self._executor.shell(self.device, f"run-as {self.package} sh -c "
+                                              f"'rm -rf {' '.join(STATE_DIRS)} && tar -xf {remote_tmp}'",
+                                 check=True)
+        finally:
+            self._executor.shell(self.device, f"rm -f {remote_tmp}")
+        return time.perf_counter() - start
@@ -0,0 +1,90 @@
+import threading
+
+import urllib3
+from appium.webdriver.appium_connection import AppiumConnection
+from appium.webdriver.client_config import AppiumClientConfig
+from selenium.webdriver.remote.command import Command
+
+# Timeout de leitura por comando WebDriver (segundos); os demais usam DEFAULT_COMMAND_TIMEOUT.
+# As chaves são os nomes de comando do Selenium (Command), os mesmos recebidos em execute().
+COMMAND_TIMEOUTS = {
+    Command.NEW_SESSION: 300,         # instalação/inicialização do servidor UiAutomator2
+    Command.GET_PAGE_SOURCE: 60,      # dump completo da hierarquia
+    Command.W3C_EXECUTE_SCRIPT: 60,   # comandos "mobile:" (ex.: startActivity, scrollGesture)
+    Command.QUIT: 30,
+}
+DEFAULT_COMMAND_TIMEOUT = 30
+CONNECT_TIMEOUT = 5
+
+
+class _CommandPoolManager(urllib3.PoolManager):
+    """
+    PoolManager que aplica o timeout do comando em execução na thread atual
+    e, opcionalmente, solicita respostas compactadas.
+    """
+
+    def __init__(self, connection, compress, **kwargs):
+        super().__init__(**kwargs)
+        self._connection = connection
+        self._compress = compress
+
+    def request(self, method, url, body=None, headers=None, timeout=None, **kwargs):
+        timeout = self._connection.current_timeout() or timeout
+        if self._compress:
+            headers = {**(headers or {}), "Accept-Encoding": "gzip"}
+        return super().request(method, url, body=body, headers=headers, timeout=timeout, **kwargs)
+
+
+class TunedAppiumConnection(AppiumConnection):
+    """
+    RemoteConnection do Appium com o pool HTTP ajustado para a execução dos testes
+    (requer Appium-Python-Client 5.x ou 6.x, ver requirements.txt):
+    - pool urllib3 com tamanho explícito, para que o heartbeat e o pré-aquecimento
+      não descartem conexões abertas pelo teste (o padrão mantém uma única conexão);
+    - conexões persistentes (keep-alive);
+    - timeout de conexão curto e timeout de leitura por comando;
+    - compressão gzip opcional das respostas.
+    """
+
+    def __init__(self, server_url, pool_size=4, command_timeouts=None, default_timeout=DEFAULT_COMMAND_TIMEOUT,
+                 connect_timeout=CONNECT_TIMEOUT, compress=False):
+        """
+        :param server_url: URL do servidor Appium
+        :param pool_size: Conexões mantidas abertas com o servidor
+        :param command_timeouts: Timeout de leitura por comando (sobrepõe COMMAND_TIMEOUTS)
+        :param default_timeout: Timeout de leitura dos comandos sem valor específico
+        :param connect_timeout: Timeout para abrir uma conexão
+        :param compress: Solicita respostas compactadas (Accept-Encoding: gzip)
+        """
+        self.pool_size = pool_size
+        self.command_timeouts = {**COMMAND_TIMEOUTS, **(command_timeouts or {})}
+        self.default_timeout = default_timeout
+        self.connect_timeout = connect_timeout
+        self.compress = compress
+        self._local = threading.local()
+        super().__init__(client_config=AppiumClientConfig(remote_server_addr=server_url, keep_alive=True))
+
+    def _get_connection_manager(self):
+        return _CommandPoolManager(
+            self,
+            self.compress,
+            num_pools=1,
+            maxsize=self.pool_size,
+            block=False,
+            timeout=urllib3.Timeout(connect=self.connect_timeout, read=self.default_timeout),
+        )
+
+    def timeout_for(self, command):
+        """Timeout (connect, read) do comando informado."""
+        return urllib3.Timeout(connect=self.connect_timeout,
+                               read=self.command_timeouts.get(command, self.default_timeout))
+
+    def current_timeout(self):
+        return getattr(self._local, "timeout", None)
+
+    def execute(self, command, params):
+        self._local.timeout = self.timeout_for(command)
+        try:
+            return super().execute(command, params)
+        finally:
+            self._local.timeout = None
@@ -0,0 +1,175 @@
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+
+class CommandTrace:
+    """
+    Instrumentação no nível de comandos WebDriver.
+    Envolve o command_executor do driver e registra a latência de cada comando,
+    o localizador utilizado nas buscas, as novas tentativas do caminho de fallback
+    do BasePage.find e as reinicializações de sessão.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.current_test = None
+        self.events = []
+        self.test_events = []
+        self.counters = Counter()
+        self._local = threading.local()
+
+    # ---------------------- INSTRUMENTAÇÃO ----------------------
+
+    @contextmanager
+    def untraced(self):
+        """
+        Comandos executados dentro do bloco, na thread atual, não entram no trace
+        (ex.: sondas do heartbeat em segundo plano).
+        """
+        self._local.untraced = True
+        try:
+            yield
+        finally:
+            self._local.untraced = False
+
+    def instrument(self, driver):
+        """
+        Envolve `driver.command_executor.execute` para registrar cada comando.
+        Chamadas repetidas para o mesmo executor não duplicam a instrumentação.
+
+        :return: O próprio driver
+        """
+        executor = driver.command_executor
+        if getattr(executor, "_command_trace_instrumented", False):
+            return driver
+
+        original_execute = executor.execute
+
+        def execute(command, params=None):
+            if getattr(self._local, "untraced", False):
+                return original_execute(command, params)
+            start = self._clock()
+            ok = False
+            try:
+                response = original_execute(command, params)
+                ok = True
+                return response
+            finally:
+                self.record_command(command, self._clock() - start, params, ok)
+
+        executor.execute = execute
+        executor._command_trace_instrumented = True
+        return driver
+
+    # ---------------------- REGISTRO ----------------------
+
+    def _append(self, event):
+        event["test"] = self.current_test
+        with self._lock:
+            self.events.append(event)
+            self.test_events.append(event)
+
+    def record_command(self, command, seconds, params=None, ok=True):
+        """Registra a execução de um comando WebDriver."""
+        if getattr(self._local, "untraced", False):
+            return
+        event = {"type": "command", "command": command, "seconds": seconds, "ok": ok}
+        if params and "using" in params:
+            event["locator"] = f"{params['using']}={params.get('value')}"
+        self._append(event)
+
+    def record_retry(self, by, locator):
+        """Registra uma nova tentativa do caminho de fallback de BasePage.find."""
+        self.counters["retries"] += 1
+        self._append({"type": "retry", "locator": f"{by}={locator}"})
+
+    def record_restart(self):
+        """Registra a reinicialização da sessão Appium."""
+        self.counters["restarts"] += 1
+        self._append({"type": "restart"})
+
+    # ---------------------- CICLO POR TESTE ----------------------
+
+    def start_test(self, nodeid):
+        """Inicia a coleta de eventos de um teste."""
+        with self._lock:
+            self.current_test = nodeid
+            self.test_events = []
+
+    def finish_test(self):
+        """
+        Encerra a coleta do teste atual.
+
+        :return: Dicionário com os eventos e totais do teste (formato do trace JSON)
+        """
+        with self._lock:
+            events, self.test_events = self.test_events, []
+            nodeid, self.current_test = self.current_test, None
+        commands = [event for event in events if event["type"] == "command"]
+        return {
+            "test": nodeid,
+            "commands": len(commands),
+            "command_seconds": sum(event["seconds"] for event in commands),
+            "retries": sum(1 for event in events if event["type"] == "retry"),
+            "restarts": sum(1 for event in events if event["type"] == "restart"),
+            "events": events,
+        }
+
+    # ---------------------- RELATÓRIOS ----------------------
+
+    def _aggregate(self, key):
+        stats = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0})
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            if event["type"] != "command" or key not in event:
+                continue
+            entry = stats[event[key]]
+            entry["count"] += 1
+            entry["total"] += event["seconds"]
+            entry["max"] = max(entry["max"], event["seconds"])
+        return stats
+
+    def slowest_commands(self, limit=10):
+        """Comandos ordenados pelo tempo total gasto: lista de (comando, estatísticas)."""
+        stats = self._aggregate("command")
+        return sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True)[:limit]
+
+    def slowest_locators(self, limit=10):
+        """Localizadores ordenados pela latência média das buscas: lista de (localizador, estatísticas)."""
+        stats = self._aggregate("locator")
+        return sorted(stats.items(), key=lambda item: item[1]["total"] / item[1]["count"], reverse=True)[:limit]
+
+    def summary_lines(self, limit=10):
+        """
+        Monta o resumo dos comandos e localizadores mais lentos.
+
+        :return: Lista de strings prontas para exibição no terminal
+        """
+        lines = []
+        commands = self.slowest_commands(limit)
+        if commands:
+            lines.append(f"{'total':>9} {'qtd':>6} {'média':>9} {'máx':>9}  comando")
+            for name, entry in commands:
+                lines.append("{:>8.2f}s {:>6} {:>8.1f}ms {:>8.1f}ms  {}".format(
+                    entry["total"], entry["count"], entry["total"] / entry["count"] * 1000,
+                    entry["max"] * 1000, name))
+        locators = self.slowest_locators(limit)
+        if locators:
+            lines.append("")
+            lines.append(f"{'média':>9} {'qtd':>6} {'máx':>9}  localizador")
+            for name, entry in locators:
+                lines.append("{:>7.1f}ms {:>6} {:>7.1f}ms  {}".format(
+                    entry["total"] / entry["count"] * 1000, entry["count"], entry["max"] * 1000, name))
+        if lines:
+            lines.append("")
+            lines.append(f"novas tentativas (find): {self.counters['retries']}")
+            lines.append(f"reinicializações de sessão: {self.counters['restarts']}")
+        return lines
+
+
+# Instância única compartilhada entre conftest, BasePage e o plugin de trace
+command_trace = CommandTrace()
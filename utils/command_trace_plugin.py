@@ -0,0 +1,57 @@
+"""
+Plugin do pytest para o trace de comandos WebDriver.
+- Grava um arquivo JSON por teste com todos os comandos executados.
+- Exibe ao final da execução os comandos e localizadores mais lentos.
+"""
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from utils.command_trace import command_trace
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--command-trace-dir",
+        default="reports/command_traces",
+        help="Diretório onde o trace JSON de cada teste é gravado (vazio desativa a gravação)."
+    )
+
+
+def trace_file_name(nodeid):
+    """Converte o nodeid do teste em um nome de arquivo seguro."""
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_") + ".json"
+
+
+def write_trace(directory, trace):
+    """
+    Grava o trace de um teste em JSON.
+
+    :return: Caminho do arquivo gravado
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / trace_file_name(trace["test"])
+    path.write_text(json.dumps(trace, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    command_trace.start_test(item.nodeid)
+    yield
+    trace = command_trace.finish_test()
+    directory = item.config.getoption("--command-trace-dir")
+    if directory and trace["events"]:
+        write_trace(directory, trace)
+
+
+def pytest_terminal_summary(terminalreporter):
+    lines = command_trace.summary_lines()
+    if not lines:
+        return
+    terminalreporter.section("Comandos WebDriver mais lentos")
+    for line in lines:
+        terminalreporter.write_line(line)
@@ -0,0 +1,217 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+
+from utils.adb_executor import AdbError, adb_executor
+
+# Estrutura do banco SQLite do MoneyTracker (DbHelper do aplicativo)
+DB_NAME = "database"
+DEFAULT_CURRENCY = "USD"
+RECORD_TYPES = {"income": 0, "expense": 1}
+
+# Diretório temporário no dispositivo, acessível ao shell e ao usuário do app via run-as
+DEVICE_TMP_DIR = "/data/local/tmp"
+
+
+def split_price(value):
+    """
+    Converte um valor em texto ("1000", "10.5", "-300") para o formato do banco:
+    parte inteira e centavos (colunas price/cur_sum e decimals).
+    Como no aplicativo, o sinal fica nas duas partes ("-10.5" -> (-10, -50)),
+    de modo que valores entre -1 e 0 ("-0.50" -> (0, -50)) não perdem o sinal.
+
+    :return: Tupla (inteiro, centavos)
+    """
+    amount = Decimal(str(value))
+    sign = -1 if amount < 0 else 1
+    whole = int(abs(amount))
+    cents = int((abs(amount) - whole) * 100)
+    return sign * whole, sign * cents
+
+
+def join_price(whole, cents):
+    """Inverso de split_price: valor a partir da parte inteira e dos centavos (com sinal)."""
+    return Decimal(whole) + Decimal(cents) / 100
+
+
+class LedgerDatabase:
+    """
+    Operações de escrita sobre uma cópia local do banco do aplicativo.
+    Mantém o saldo das contas (cur_sum) consistente com os registros inseridos,
+    como o próprio aplicativo faz ao salvar pela interface.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def _account_id(self, title):
+        row = self.connection.execute("SELECT id FROM accounts WHERE title = ?", (title,)).fetchone()
+        if row is None:
+            raise ValueError(f"Conta '{title}' não existe no banco do aplicativo.")
+        return row[0]
+
+    def _category_id(self, name):
+        row = self.connection.execute("SELECT id FROM categories WHERE name = ?", (name,)).fetchone()
+        if row:
+            return row[0]
+        return self.connection.execute("INSERT INTO categories (name) VALUES (?)", (name,)).lastrowid
+
+    def add_account(self, title, initial_sum, currency=DEFAULT_CURRENCY):
+        """
+        Insere uma conta.
+
+        :param title: Nome da conta
+        :param initial_sum: Saldo inicial (texto ou número)
+        :return: id da conta criada
+        """
+        whole, cents = split_price(initial_sum)
+        return self.connection.execute(
+            "INSERT INTO accounts (title, cur_sum, currency, decimals) VALUES (?, ?, ?, ?)",
+            (title, whole, currency, cents),
+        ).lastrowid
+
+    def add_record(self, title, price, category, account, kind="income", timestamp=None,
+                   currency=DEFAULT_CURRENCY):
+        """
+        Insere um registro de receita ou despesa e atualiza o saldo da conta.
+
+        :param title: Título do registro
+        :param price: Valor positivo (texto ou número)
+        :param category: Nome da categoria (criada se ainda não existir)
+        :param account: Nome de uma conta existente
+        :param kind: "income" ou "expense"
+        :param timestamp: Data em milissegundos desde epoch; por padrão, o instante atual
+        :return: id do registro criado
+        """
+        if kind not in RECORD_TYPES:
+            raise ValueError(f"Tipo de registro inválido: {kind}")
+        account_id = self._account_id(account)
+        whole, cents = split_price(price)
+        timestamp = int(time.time() * 1000) if timestamp is None else timestamp
+
+        record_id = self.connection.execute(
+            "INSERT INTO records (time, type, title, category_id, price, account_id, currency, decimals) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (timestamp, RECORD_TYPES[kind], title, self._category_id(category), whole, account_id,
+             currency, cents),
+        ).lastrowid
+
+        self._apply_to_balance(account_id, Decimal(str(price)) if kind == "income" else -Decimal(str(price)))
+        return record_id
+
+    def _apply_to_balance(self, account_id, delta):
+        cur_sum, decimals = self.connection.execute(
+            "SELECT cur_sum, decimals FROM accounts WHERE id = ?", (account_id,)
+        ).fetchone()
+        whole, cents = split_price(join_price(cur_sum, decimals) + delta)
+        self.connection.execute(
+            "UPDATE accounts SET cur_sum = ?, decimals = ? WHERE id = ?", (whole, cents, account_id)
+        )
+
+
+class DatabaseSeeder:
+    """
+    Cria pré-condições escrevendo diretamente no banco SQLite do aplicativo,
+    em vez de navegar pela interface (menu -> Accounts -> Add -> salvar -> voltar).
+    O banco é copiado do dispositivo via adb (run-as), alterado localmente e devolvido.
+    Requer APK depurável (debuggable), como o APK instrumentado usado nos testes.
+    """
+
+    def __init__(self, device, package, workdir, executor=adb_executor):
+        """
+        :param device: Device alvo (ver utils.devices)
+        :param package: Pacote do aplicativo
+        :param workdir: Diretório local para a cópia do banco
+        :param executor: AdbExecutor usado nos comandos adb (substituível por um adb falso em testes)
+        """
+        self.device = device
+        self.package = package
+        self.workdir = Path(workdir)
+        self._executor = executor
+
+    @property
+    def local_path(self):
+        return self.workdir / DB_NAME
+
+    @property
+    def remote_tmp(self):
+        return f"{DEVICE_TMP_DIR}/{self.package}.{DB_NAME}"
+
+    def pull(self):
+        """
+        Copia o banco do aplicativo (e o arquivo -wal, se existir) para o diretório local.
+        Os arquivos passam pelo diretório temporário do dispositivo, pois o adb entrega
+        a saída dos comandos como texto.
+
+        :return: Caminho local do banco
+        """
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        suffixes = ("", "-wal")
+        copies = self._executor.shell_batch(
+            self.device,
+            [f"run-as {self.package} cat databases/{DB_NAME}{suffix} > {self.remote_tmp}{suffix}"
+             for suffix in suffixes],
+        )
+        try:
+            for suffix, copy in zip(suffixes, copies):
+                target = self.workdir / f"{DB_NAME}{suffix}"
+                if copy.ok:
+                    self._executor.run(self.device, "pull", f"{self.remote_tmp}{suffix}", str(target),
+                                       check=True)
+                elif not suffix:
+                    raise AdbError(copy)
+                else:
+                    target.unlink(missing_ok=True)
+        finally:
+            self._executor.shell(self.device, f"rm -f {self.remote_tmp} {self.remote_tmp}-wal")
+        return self.local_path
+
+    def push(self):
+        """
+        Envia o banco local de volta ao aplicativo, descartando journals antigos no dispositivo.
+        """
+        self._executor.run(self.device, "push", str(self.local_path), self.remote_tmp, check=True)
+        try:
+            self._executor.shell(
+                self.device,
+                f"run-as {self.package} sh -c 'cp {self.remote_tmp} databases/{DB_NAME} && "
+                f"rm -f databases/{DB_NAME}-wal databases/{DB_NAME}-shm'",
+                check=True,
+            )
+        finally:
+            self._executor.shell(self.device, f"rm -f {self.remote_tmp}")
+
+    @contextmanager
+    def editing(self):
+        """
+        Abre a cópia local do banco para escrita e a devolve ao dispositivo ao final.
+
+        Exemplo:
+            with seeder.editing() as db:
+                db.add_account("ContaTeste01", "5000")
+        """
+        self.pull()
+        connection = sqlite3.connect(self.local_path)
+        try:
+            yield LedgerDatabase(connection)
+            connection.commit()
+            # Incorpora o -wal ao arquivo principal antes do envio
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            connection.close()
+        self.push()
+
+    @contextmanager
+    def seeding(self, driver=None):
+        """
+        Como editing(), mas finaliza o app antes da escrita e o reativa depois,
+        para que o aplicativo recarregue os dados.
+        """
+        if driver is not None:
+            driver.terminate_app(self.package)
+        with self.editing() as db:
+            yield db
+        if driver is not None:
+            driver.activate_app(self.package)
@@ -0,0 +1,155 @@
+import re
+import subprocess
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Device:
+    """
+    Dispositivo reservado para um worker do pytest.
+    Cada worker recebe seu próprio udid, porta do Appium e systemPort do UiAutomator2.
+    """
+
+    udid: str
+    appium_port: int
+    system_port: int
+    appium_host: str = "127.0.0.1"
+
+    @property
+    def server_url(self):
+        """URL do servidor Appium que atende este dispositivo."""
+        return f"http://{self.appium_host}:{self.appium_port}"
+
+    def adb(self, command):
+        """
+        Monta um comando adb direcionado a este dispositivo.
+
+        :param command: Comando adb sem o prefixo (ex.: "shell pm clear <pacote>")
+        :return: String com o comando completo (ex.: "adb -s emulator-5554 shell ...")
+        """
+        return f"adb -s {self.udid} {command}"
+
+
+def run_adb_devices():
+    """
+    Executa `adb devices` e retorna a saída em texto.
+    Retorna string vazia caso o adb não esteja disponível.
+    """
+    try:
+        result = subprocess.run(["adb", "devices"], capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return result.stdout
+
+
+def parse_adb_devices(output):
+    """
+    Extrai os udids prontos para uso (estado "device") da saída de `adb devices`.
+
+    :param output: Texto retornado pelo comando `adb devices`
+    :return: Lista de udids na ordem exibida pelo adb
+    """
+    udids = []
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1] == "device":
+            udids.append(parts[0])
+    return udids
+
+
+def worker_index(worker_id):
+    """
+    Converte o identificador do worker do pytest-xdist em índice numérico.
+    "master" (execução sem xdist) corresponde ao índice 0, "gw3" ao índice 3.
+    """
+    match = re.fullmatch(r"gw(\d+)", worker_id or "")
+    return int(match.group(1)) if match else 0
+
+
+class DeviceAllocator:
+    """
+    Distribui dispositivos e portas entre os workers paralelos do pytest.
+    O worker N recebe o N-ésimo udid, a porta Appium base + N e o systemPort base + N.
+    """
+
+    DEFAULT_UDID = "emulator-5554"
+
+    def __init__(self, udids=None, base_appium_port=4723, base_system_port=8200,
+                 appium_host="127.0.0.1", list_devices=run_adb_devices):
+        """
+        :param udids: Lista explícita de udids; se vazia, os dispositivos são detectados via adb
+        :param base_appium_port: Porta do servidor Appium do worker 0
+        :param base_system_port: systemPort do UiAutomator2 do worker 0
+        :param appium_host: Host onde os servidores Appium estão em execução
+        :param list_devices: Função que retorna a saída de `adb devices` (substituível em testes)
+        """
+        self._udids = list(udids or [])
+        self._list_devices = list_devices
+        self.base_appium_port = base_appium_port
+        self.base_system_port = base_system_port
+        self.appium_host = appium_host
+
+    @property
+    def udids(self):
+        """
+        Udids disponíveis para alocação. Sem lista explícita, consulta o adb
+        e, se nenhum dispositivo for encontrado, utiliza o emulador padrão.
+        """
+        if not self._udids:
+            self._udids = parse_adb_devices(self._list_devices()) or [self.DEFAULT_UDID]
+        return self._udids
+
+    def _device(self, slot):
+        return Device(
+            udid=self.udids[slot],
+            appium_port=self.base_appium_port + slot,
+            system_port=self.base_system_port + slot,
+            appium_host=self.appium_host,
+        )
+
+    def allocate(self, worker_id):
+        """
+        Reserva o dispositivo e as portas do worker informado.
+
+        :param worker_id: Identificador do worker (ex.: "master", "gw0", "gw1")
+        :return: Device do worker
+        """
+        index = worker_index(worker_id)
+        udids = self.udids
+        if index >= len(udids):
+            raise RuntimeError(
+                f"Worker '{worker_id}' não possui dispositivo disponível: "
+                f"{len(udids)} dispositivo(s) para {index + 1} worker(s)."
+            )
+        return self._device(index)
+
+    def allocate_group(self, worker_id, size):
+        """
+        Reserva um grupo de dispositivos para o worker (ex.: rodízio do pré-aquecimento).
+        O worker N recebe os dispositivos N * size até N * size + size - 1, cada um
+        com sua porta Appium e seu systemPort.
+
+        :return: Lista de Device do worker
+        """
+        first = worker_index(worker_id) * size
+        udids = self.udids
+        if first + size > len(udids):
+            raise RuntimeError(
+                f"Worker '{worker_id}' precisa de {size} dispositivo(s), mas há apenas "
+                f"{len(udids)} dispositivo(s) para {worker_index(worker_id) + 1} worker(s)."
+            )
+        return [self._device(slot) for slot in range(first, first + size)]
+
+    def allocate_spare(self, worker_id, workers, size=1):
+        """
+        Dispositivo reserva do worker: um udid além dos reservados para todos os workers
+        (workers * size), usado para criar antecipadamente uma sessão substituta.
+
+        :param workers: Quantidade de workers da execução
+        :param size: Dispositivos reservados por worker (2 com --prewarm)
+        :return: Device reserva ou None se não houver dispositivos sobrando
+        """
+        slot = workers * size + worker_index(worker_id)
+        if slot >= len(self.udids):
+            return None
+        return self._device(slot)
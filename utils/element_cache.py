@@ -0,0 +1,54 @@
+from utils.reporting import run_report
+
+
+class ElementCache:
+    """
+    Cache de WebElements da tela atual, indexado pelo localizador (by, valor).
+    Reaproveita o id do elemento já localizado em vez de repetir a busca e a espera.
+    Deve ser limpo a cada navegação; entradas obsoletas são descartadas quando
+    o servidor responde StaleElementReferenceException.
+    """
+
+    def __init__(self):
+        self._elements = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._elements)
+
+    def get(self, key):
+        """
+        :param key: Tupla (by, localizador)
+        :return: WebElement em cache ou None
+        """
+        element = self._elements.get(key)
+        if element is None:
+            self.misses += 1
+            run_report.incr("cache de elementos: falhas")
+        else:
+            self.hits += 1
+            run_report.incr("cache de elementos: acertos")
+        return element
+
+    def put(self, key, element):
+        self._elements[key] = element
+
+    def discard_stale(self, key):
+        """Remove um elemento que o servidor reportou como obsoleto."""
+        if self._elements.pop(key, None) is not None:
+            self.stale += 1
+            run_report.incr("cache de elementos: obsoletos")
+
+    def clear(self):
+        """Esvazia o cache (ex.: após uma ação de navegação)."""
+        if self._elements:
+            self.invalidations += 1
+        self._elements.clear()
+
+    def stats(self):
+        """Contadores do cache em formato de dicionário."""
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale,
+                "invalidations": self.invalidations, "size": len(self)}
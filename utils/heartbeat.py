@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import deque
+
+from utils.session_manager import session_manager
+
+
+def percentile(samples, fraction):
+    """
+    Percentil simples (sem interpolação) de uma sequência de amostras.
+
+    :param fraction: Valor entre 0 e 1 (ex.: 0.95)
+    :return: Amostra correspondente ou None se não houver amostras
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class SessionHeartbeat:
+    """
+    Monitora a sessão Appium/UiAutomator2 em uma thread de segundo plano.
+    Substitui a sonda síncrona de current_activity feita antes de cada teste:
+    - mede a latência de cada batida e conta as falhas;
+    - uma falha marca a sessão como degradada (healthy=False); a recuperação em si
+      (force-stop e nova sessão) é feita pelo SessionManager.recover() no início do
+      próximo teste, nunca nesta thread, que não pode interferir no teste em execução;
+    - com spare_factory, após falhas consecutivas a sessão substituta é criada
+      antecipadamente em um dispositivo reserva.
+    """
+
+    def __init__(self, manager, interval=5.0, probe=None, failure_threshold=2, slow_threshold=2.0,
+                 history=1000, clock=time.perf_counter, spare_factory=None):
+        """
+        :param manager: SessionManager monitorado
+        :param interval: Intervalo entre batidas (segundos)
+        :param probe: Função que recebe o driver e indica se ele responde; padrão: is_alive_check do manager
+        :param failure_threshold: Falhas consecutivas que caracterizam a sessão como degradada
+        :param slow_threshold: Latência (segundos) a partir da qual a batida é contada como lenta
+        :param history: Quantidade de latências mantidas para os percentis
+        :param spare_factory: Opcional; cria uma sessão em um dispositivo reserva (nunca no
+                              dispositivo da sessão monitorada, que ainda está em uso pelo teste)
+        """
+        self.manager = manager
+        self.interval = interval
+        self.probe = probe
+        self.spare_factory = spare_factory
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self._clock = clock
+        self.latencies = deque(maxlen=history)
+        self.beats = 0
+        self.failures = 0
+        self.slow_beats = 0
+        self.consecutive_failures = 0
+        self.replacements_prepared = 0
+        self.healthy = True
+        self._stop = threading.Event()
+        self._thread = None
+        manager.add_listener(self._on_new_session)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _on_new_session(self, driver):
+        self.consecutive_failures = 0
+        self.healthy = True
+
+    def beat(self):
+        """
+        Executa uma batida: sonda a sessão atual e atualiza as métricas.
+
+        :return: True/False conforme a sessão respondeu, ou None se não há sessão
+        """
+        driver = self.manager.driver
+        if driver is None:
+            return None
+        probe = self.probe or self.manager.is_alive_check or (lambda _: True)
+
+        start = self._clock()
+        alive = probe(driver)
+        elapsed = self._clock() - start
+        if driver is not self.manager.driver:
+            # A sessão foi trocada durante a sonda; o resultado não vale para a atual
+            return alive
+
+        self.beats += 1
+        if alive:
+            self.latencies.append(elapsed)
+            if elapsed >= self.slow_threshold:
+                self.slow_beats += 1
+            self.consecutive_failures = 0
+            self.healthy = True
+            return True
+
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.healthy = False
+        if (self.spare_factory is not None and self.consecutive_failures == self.failure_threshold
+                and self.manager.prepare_replacement(self.spare_factory)):
+            self.replacements_prepared += 1
+        return False
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.beat()
+            except Exception:
+                # Falhas do heartbeat nunca devem interromper a execução dos testes
+                pass
+
+    def start(self):
+        """Inicia a thread de monitoramento (chamadas repetidas são ignoradas)."""
+        if self.running or self.interval <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="session-heartbeat", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """Interrompe a thread de monitoramento."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def summary_lines(self):
+        """
+        Métricas de saúde da sessão para o relatório final.
+
+        :return: Lista de strings prontas para exibição no terminal
+        """
+        if not self.beats:
+            return []
+        lines = [f"batidas: {self.beats} (intervalo {self.interval:.1f}s)"]
+        if self.latencies:
+            lines.append(f"latência p50: {percentile(self.latencies, 0.5) * 1000:.0f}ms, "
+                         f"p95: {percentile(self.latencies, 0.95) * 1000:.0f}ms, "
+                         f"máx: {max(self.latencies) * 1000:.0f}ms")
+        lines.append(f"batidas lentas (>= {self.slow_threshold:.1f}s): {self.slow_beats}")
+        lines.append(f"falhas: {self.failures}")
+        if self.spare_factory is not None:
+            lines.append(f"sessões substitutas preparadas: {self.replacements_prepared}")
+        return lines
+
+
+# Instância única do worker (intervalo configurado pelo conftest)
+session_heartbeat = SessionHeartbeat(session_manager)
@@ -0,0 +1,158 @@
+import re
+from collections import Counter, namedtuple
+from decimal import Decimal, InvalidOperation
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+# Valores de resumo exibidos no cabeçalho da lista de registros (quando presentes na tela)
+HEADER_IDS = {
+    "income": "com.blogspot.e_kanivets.moneytracker:id/tvTotalIncome",
+    "expense": "com.blogspot.e_kanivets.moneytracker:id/tvTotalExpense",
+    "total": "com.blogspot.e_kanivets.moneytracker:id/tvTotal",
+}
+PRICE_ID = "com.blogspot.e_kanivets.moneytracker:id/tvPrice"
+TITLE_ID = "com.blogspot.e_kanivets.moneytracker:id/tvTitle"
+
+# Linhas de diferença exibidas por título antes de resumir o restante
+MAX_TITLE_DIFFS = 20
+
+
+class LedgerSummary(namedtuple("LedgerSummary", "income expense records by_title header")):
+    """
+    Totais de um extrato: soma das receitas e despesas, quantidade de registros,
+    soma com sinal por título (None quando desconhecida) e, quando lidos da tela,
+    os valores do cabeçalho.
+    """
+
+    @property
+    def total(self):
+        return self.income - self.expense
+
+
+def parse_amount(text):
+    """
+    Converte um valor formatado pelo app em Decimal.
+    Aceita sinal separado por espaço ("+ 1000", "- 300.25"), separador de milhar
+    e vírgula decimal ("1 000,50", "1,000.50") e ignora símbolos de moeda.
+
+    :raises ValueError: se o texto não contiver um valor numérico
+    """
+    cleaned = re.sub(r"[^\d,.+-]", "", text or "")
+    sign = -1 if cleaned.startswith("-") else 1
+    digits = cleaned.lstrip("+-")
+    if "," in digits and "." in digits:
+        # O último separador é o decimal; o outro separa milhares
+        decimal, thousands = (",", ".") if digits.rfind(",") > digits.rfind(".") else (".", ",")
+        digits = digits.replace(thousands, "").replace(decimal, ".")
+    elif "," in digits:
+        whole, _, fraction = digits.rpartition(",")
+        digits = f"{whole.replace(',', '')}.{fraction}" if len(fraction) <= 2 else digits.replace(",", "")
+    try:
+        return sign * Decimal(digits)
+    except InvalidOperation:
+        raise ValueError(f"Valor monetário inválido: '{text}'") from None
+
+
+def _summarize(signed_amounts, header=None):
+    income, expense, count = Decimal(0), Decimal(0), 0
+    by_title = Counter()
+    for title, amount in signed_amounts:
+        if amount >= 0:
+            income += amount
+        else:
+            expense -= amount
+        by_title[title] += amount
+        count += 1
+    return LedgerSummary(income, expense, count, by_title, header or {})
+
+
+def summary_from_snapshot(snapshot):
+    """
+    Totais dos registros exibidos em um único snapshot da tela (ver utils.page_snapshot).
+    Cada valor é associado ao título da mesma linha, na ordem da hierarquia.
+    """
+    titles = snapshot.texts(AppiumBy.ID, TITLE_ID)
+    prices = snapshot.texts(AppiumBy.ID, PRICE_ID)
+    if len(titles) != len(prices):
+        titles = [None] * len(prices)
+    header = {}
+    for name, resource_id in HEADER_IDS.items():
+        text = snapshot.text(AppiumBy.ID, resource_id)
+        if text:
+            header[name] = parse_amount(text)
+    return _summarize(((title, parse_amount(price)) for title, price in zip(titles, prices)), header)
+
+
+def summary_from_records(records):
+    """
+    Totais em uma única passada sobre registros lidos da tela (ex.: RecordsPage.iter_records()).
+    """
+    return _summarize((record.title, parse_amount(record.price)) for record in records)
+
+
+def expected_summary(records):
+    """
+    Totais esperados a partir dos registros criados pelo teste: GeneratedRecord da
+    LedgerFactory ou dicionários no formato da fixture `records` (kind padrão: "income").
+    """
+    def signed():
+        for record in records:
+            fields = record._asdict() if hasattr(record, "_asdict") else record
+            amount = Decimal(str(fields["price"]))
+            yield fields["title"], amount if fields.get("kind", "income") == "income" else -amount
+
+    return _summarize(signed())
+
+
+def summary_from_totals(totals):
+    """
+    Totais esperados a partir dos totais por conta da LedgerFactory (expected_totals()),
+    acumulados enquanto os registros foram semeados. Não há valores por título: a comparação
+    em reconcile fica restrita a receitas, despesas, total e quantidade.
+
+    :param totals: Dicionário nome da conta -> AccountTotals
+    """
+    income, expense, count = Decimal(0), Decimal(0), 0
+    for entry in totals.values():
+        income += entry.income
+        expense += entry.expense
+        count += entry.records
+    return LedgerSummary(income, expense, count, None, {})
+
+
+def reconcile(actual, expected):
+    """
+    Compara os totais obtidos na tela com os esperados.
+
+    :return: Mensagem em formato de diff ("-" esperado, "+" obtido) ou string vazia se tudo confere
+    """
+    lines = []
+    mismatch = False
+    for name in ("income", "expense", "total", "records"):
+        wanted, got = getattr(expected, name), getattr(actual, name)
+        if wanted == got:
+            lines.append(f"  {name}: {got}")
+        else:
+            mismatch = True
+            lines += [f"- {name}: {wanted}", f"+ {name}: {got}"]
+
+    for name, shown in actual.header.items():
+        wanted = getattr(expected, name)
+        if shown != wanted:
+            mismatch = True
+            lines += [f"- cabeçalho {name}: {wanted}", f"+ cabeçalho {name}: {shown}"]
+
+    if expected.by_title is None or None in actual.by_title:
+        titles = []  # sem valores por título (totais por conta ou linhas sem título): só os totais são comparáveis
+    else:
+        titles = [title for title in sorted(set(expected.by_title) | set(actual.by_title), key=str)
+                  if expected.by_title.get(title, 0) != actual.by_title.get(title, 0)]
+    for title in titles[:MAX_TITLE_DIFFS]:
+        mismatch = True
+        lines += [f"- {title}: {expected.by_title.get(title, 0)}", f"+ {title}: {actual.by_title.get(title, 0)}"]
+    if len(titles) > MAX_TITLE_DIFFS:
+        lines.append(f"  ... mais {len(titles) - MAX_TITLE_DIFFS} títulos divergentes")
+
+    if not mismatch:
+        return ""
+    return "Totais do extrato divergentes (- esperado, + obtido):\n" + "\n".join(lines)
@@ -0,0 +1,125 @@
+import re
+from functools import lru_cache
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+# //Classe[predicados] ou //*[predicados], sem eixos, índices ou passos adicionais
+_XPATH_PATTERN = re.compile(r"^//(?P<tag>\*|[A-Za-z_][\w.$]*)\[(?P<predicates>.+)\]$")
+
+# @atributo='valor' | @atributo="valor"
+_EQUALS_PATTERN = re.compile(r"""^@(?P<attr>[\w-]+)\s*=\s*(?P<quote>['"])(?P<value>.*)(?P=quote)$""")
+
+# contains(@atributo, 'valor') | contains(@atributo, "valor")
+_CONTAINS_PATTERN = re.compile(
+    r"""^contains\(\s*@(?P<attr>[\w-]+)\s*,\s*(?P<quote>['"])(?P<value>.*)(?P=quote)\s*\)$"""
+)
+
+# Métodos equivalentes do UiSelector para cada atributo/operador suportado
+_UISELECTOR_METHODS = {
+    ("text", "="): "text",
+    ("text", "contains"): "textContains",
+    ("resource-id", "="): "resourceId",
+    ("content-desc", "="): "description",
+    ("content-desc", "contains"): "descriptionContains",
+}
+
+
+def _split_predicates(predicates):
+    """
+    Divide os predicados da XPath pelo operador 'and', ignorando ocorrências
+    dentro de literais entre aspas.
+
+    :return: Lista de predicados ou None caso a expressão não seja suportada
+    """
+    parts, current, quote = [], [], None
+    index = 0
+    while index < len(predicates):
+        char = predicates[index]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[]|" or predicates.startswith(" or ", index):
+            return None
+        elif predicates.startswith(" and ", index):
+            parts.append("".join(current).strip())
+            current = []
+            index += len(" and ")
+            continue
+        current.append(char)
+        index += 1
+    parts.append("".join(current).strip())
+    return parts
+
+
+def _parse_predicate(predicate):
+    """
+    Converte um predicado em (atributo, operador, valor).
+
+    :return: Tupla ou None caso o predicado não seja suportado
+    """
+    for operator, pattern in (("=", _EQUALS_PATTERN), ("contains", _CONTAINS_PATTERN)):
+        match = pattern.match(predicate)
+        if match:
+            return match.group("attr"), operator, match.group("value")
+    return None
+
+
+def java_string(value):
+    """Escapa o valor para uso como literal de string Java no UiSelector."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@lru_cache(maxsize=1024)
+def compile_locator(by, locator):
+    """
+    Reescreve localizadores XPath simples na estratégia nativa equivalente do UiAutomator2,
+    que é consideravelmente mais rápida que a avaliação de XPath no dispositivo.
+
+    Exemplos:
+        //android.widget.TextView[@text='Salário']
+            -> -android uiautomator: new UiSelector().className("android.widget.TextView").text("Salário")
+        //*[@resource-id='pkg:id/etTitle']
+            -> id: pkg:id/etTitle
+
+    Localizadores que não forem semanticamente equivalentes a um UiSelector
+    (eixos, índices, 'or', funções não suportadas) são mantidos em XPath.
+    Os resultados ficam em cache (ver compile_locator.cache_info()).
+
+    :param by: Estratégia de localização original
+    :param locator: Valor do localizador original
+    :return: Tupla (by, locator) a ser utilizada na busca
+    """
+    if by != AppiumBy.XPATH:
+        return by, locator
+
+    match = _XPATH_PATTERN.match(locator.strip())
+    if not match:
+        return by, locator
+
+    predicates = _split_predicates(match.group("predicates"))
+    if not predicates:
+        return by, locator
+
+    conditions = []
+    for predicate in predicates:
+        parsed = _parse_predicate(predicate)
+        if parsed is None:
+            return by, locator
+        attr, operator, value = parsed
+        # Texto vazio não tem equivalência garantida entre XPath e UiSelector
+        if (attr, operator) not in _UISELECTOR_METHODS or not value:
+            return by, locator
+        conditions.append((attr, operator, value))
+
+    tag = match.group("tag")
+    if tag == "*" and len(conditions) == 1 and conditions[0][:2] == ("resource-id", "="):
+        return AppiumBy.ID, conditions[0][2]
+
+    selector = "new UiSelector()"
+    if tag != "*":
+        selector += f".className({java_string(tag)})"
+    for attr, operator, value in conditions:
+        selector += f".{_UISELECTOR_METHODS[(attr, operator)]}({java_string(value)})"
+    return AppiumBy.ANDROID_UIAUTOMATOR, selector
@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from appium.webdriver.common.appiumby import AppiumBy
+from lxml import etree
+
+
+class PageSnapshot:
+    """
+    Cópia local da hierarquia de tela obtida com um único `driver.page_source`.
+    Permite responder várias consultas de presença, contagem e texto sem
+    novas chamadas ao servidor Appium.
+    """
+
+    def __init__(self, page_source):
+        """
+        :param page_source: XML retornado por `driver.page_source`
+        """
+        self.root = etree.fromstring(page_source.encode("utf-8"))
+        self._by_id = defaultdict(list)
+        self._by_text = defaultdict(list)
+        self._by_content_desc = defaultdict(list)
+        self._xpath_cache = {}
+
+        for node in self.root.iter():
+            if node.get("resource-id"):
+                self._by_id[node.get("resource-id")].append(node)
+            if node.get("text") is not None:
+                self._by_text[node.get("text")].append(node)
+            if node.get("content-desc"):
+                self._by_content_desc[node.get("content-desc")].append(node)
+
+    def find_all(self, by, locator):
+        """
+        Retorna os nós da hierarquia que correspondem ao localizador.
+
+        :param by: Estratégia de localização (AppiumBy.ID, AppiumBy.XPATH, AppiumBy.ACCESSIBILITY_ID
+                   ou AppiumBy.CLASS_NAME)
+        :param locator: Valor do localizador
+        :return: Lista de nós lxml na ordem da hierarquia
+        """
+        if by == AppiumBy.ID:
+            return list(self._by_id.get(locator, ()))
+        if by == AppiumBy.ACCESSIBILITY_ID:
+            return list(self._by_content_desc.get(locator, ()))
+        if by == AppiumBy.CLASS_NAME:
+            return list(self.root.iter(locator))
+        if by == AppiumBy.XPATH:
+            if locator not in self._xpath_cache:
+                self._xpath_cache[locator] = etree.XPath(locator)
+            return self._xpath_cache[locator](self.root)
+        raise ValueError(f"Estratégia de localização não suportada no snapshot: {by}")
+
+    def find_by_text(self, text):
+        """Retorna os nós cujo atributo 'text' é exatamente igual ao informado."""
+        return list(self._by_text.get(text, ()))
+
+    def is_present(self, by, locator):
+        """Indica se ao menos um nó corresponde ao localizador."""
+        return len(self.find_all(by, locator)) > 0
+
+    def count(self, by, locator):
+        """Quantidade de nós que correspondem ao localizador."""
+        return len(self.find_all(by, locator))
+
+    def texts(self, by, locator):
+        """Textos (atributo 'text') de todos os nós que correspondem ao localizador."""
+        return [node.get("text", "") for node in self.find_all(by, locator)]
+
+    def text(self, by, locator):
+        """
+        Texto do primeiro nó que corresponde ao localizador.
+
+        :return: String sem espaços nas extremidades ou None se não houver correspondência
+        """
+        texts = self.texts(by, locator)
+        return texts[0].strip() if texts else None
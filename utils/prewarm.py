@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.reporting import run_report
+
+
+class SessionPrewarmer:
+    """
+    Prepara a sessão do próximo teste enquanto o teste atual é executado.
+    O worker alterna entre dois ou mais dispositivos: enquanto um executa o teste,
+    o seguinte tem os dados do app limpos e a sessão Appium criada em segundo plano.
+    O tempo de preparo que coincidiu com a execução do teste é contabilizado como tempo oculto.
+
+    Em um único dispositivo a sobreposição não é segura (pm clear e uma segunda
+    instrumentação do UiAutomator2 derrubariam o teste em andamento), por isso são
+    exigidos ao menos dois dispositivos por worker.
+    """
+
+    def __init__(self, devices, prepare, clock=time.perf_counter):
+        """
+        :param devices: Dispositivos do worker (ver utils.devices), usados em rodízio
+        :param prepare: Função que recebe o Device, limpa os dados do app e retorna uma nova sessão
+        """
+        if len(devices) < 2:
+            raise ValueError("O pré-aquecimento exige ao menos dois dispositivos por worker.")
+        self.devices = list(devices)
+        self._prepare = prepare
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prewarm")
+        self._pending = None
+        self._next = 0
+        self.prepared = 0
+        self.hidden_seconds = 0.0
+        self.waited_seconds = 0.0
+
+    def _timed_prepare(self, device):
+        start = self._clock()
+        driver = self._prepare(device)
+        return driver, self._clock() - start
+
+    def schedule(self):
+        """
+        Inicia em segundo plano o preparo da sessão no próximo dispositivo do rodízio.
+        Chamadas enquanto já existe um preparo pendente são ignoradas.
+        """
+        if self._pending is not None:
+            return
+        device = self.devices[self._next]
+        self._next = (self._next + 1) % len(self.devices)
+        self._pending = (device, self._executor.submit(self._timed_prepare, device))
+
+    def take(self):
+        """
+        Entrega a sessão preparada, aguardando o término do preparo se necessário.
+
+        :return: Tupla (device, driver)
+        """
+        self.schedule()
+        device, future = self._pending
+        self._pending = None
+
+        start = self._clock()
+        driver, prepare_seconds = future.result()
+        waited = self._clock() - start
+
+        hidden = max(0.0, prepare_seconds - waited)
+        self.prepared += 1
+        self.hidden_seconds += hidden
+        self.waited_seconds += waited
+        run_report.add_timing("pré-aquecimento: tempo oculto", hidden)
+        run_report.add_timing("pré-aquecimento: espera pela sessão", waited)
+        return device, driver
+
+    def close(self):
+        """
+        Descarta uma sessão preparada e não utilizada e encerra a thread de preparo.
+        """
+        if self._pending is not None:
+            _, future = self._pending
+            self._pending = None
+            try:
+                driver, _ = future.result()
+                driver.quit()
+            except Exception:
+                pass
+        self._executor.shutdown(wait=True)
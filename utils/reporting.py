@@ -0,0 +1,81 @@
+from collections import Counter, defaultdict
+
+
+class RunReport:
+    """
+    Acumula métricas de tempo da execução do pytest (por teste e por etapa)
+    e gera o resumo exibido ao final da execução.
+    """
+
+    PHASES = ("setup", "call", "teardown")
+
+    def __init__(self):
+        self.test_timings = defaultdict(dict)
+        self.timings = defaultdict(list)
+        self.counters = Counter()
+        self.test_metrics = defaultdict(Counter)
+
+    def add_test_phase(self, nodeid, phase, seconds):
+        """
+        Registra a duração de uma etapa (setup, call ou teardown) de um teste.
+        """
+        self.test_timings[nodeid][phase] = seconds
+
+    def add_timing(self, name, seconds):
+        """
+        Registra uma amostra de tempo nomeada (ex.: restauração de estado, criação de sessão).
+        """
+        self.timings[name].append(seconds)
+
+    def add_test_metric(self, nodeid, name, seconds):
+        """
+        Acumula um tempo nomeado dentro de um teste (ex.: tempo de navegação entre telas).
+        Chamadas fora de um teste (nodeid None) são ignoradas.
+        """
+        if nodeid is not None:
+            self.test_metrics[nodeid][name] += seconds
+
+    def incr(self, name, amount=1):
+        """
+        Incrementa um contador nomeado (ex.: sessões criadas, sessões reutilizadas).
+        """
+        self.counters[name] += amount
+
+    def summary_lines(self):
+        """
+        Monta as linhas do relatório de tempos por teste.
+
+        :return: Lista de strings prontas para exibição no terminal
+        """
+        if not self.test_timings:
+            return []
+
+        lines = [f"{'setup':>8} {'call':>8} {'teardown':>8} {'total':>8}  teste"]
+        totals = dict.fromkeys(self.PHASES, 0.0)
+        for nodeid, phases in self.test_timings.items():
+            values = [phases.get(phase, 0.0) for phase in self.PHASES]
+            for phase, value in zip(self.PHASES, values):
+                totals[phase] += value
+            lines.append(
+                "{:>7.2f}s {:>7.2f}s {:>7.2f}s {:>7.2f}s  {}".format(*values, sum(values), nodeid)
+            )
+
+        values = [totals[phase] for phase in self.PHASES]
+        lines.append("{:>7.2f}s {:>7.2f}s {:>7.2f}s {:>7.2f}s  TOTAL".format(*values, sum(values)))
+
+        for name, samples in sorted(self.timings.items()):
+            lines.append(f"{name}: {len(samples)}x, média {sum(samples) / len(samples):.2f}s, "
+                         f"total {sum(samples):.2f}s")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name}: {value}")
+
+        for name in sorted({name for metrics in self.test_metrics.values() for name in metrics}):
+            lines.append(f"{name} por teste:")
+            for nodeid, metrics in self.test_metrics.items():
+                if name in metrics:
+                    lines.append(f"{metrics[name]:>7.2f}s  {nodeid}")
+        return lines
+
+
+# Instância única compartilhada entre fixtures e hooks do pytest
+run_report = RunReport()
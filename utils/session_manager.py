@@ -0,0 +1,176 @@
+import threading
+
+from utils.reporting import run_report
+
+
+class DriverProxy:
+    """
+    Driver entregue aos Page Objects e às classes de teste.
+    Todas as chamadas são delegadas à sessão atual do SessionManager, de modo que
+    uma recuperação de sessão vale imediatamente para todos que compartilham o proxy.
+    """
+
+    def __init__(self, manager):
+        object.__setattr__(self, "_manager", manager)
+
+    def __getattr__(self, name):
+        driver = self._manager.driver
+        if driver is None:
+            raise RuntimeError("Nenhuma sessão Appium ativa no SessionManager.")
+        return getattr(driver, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._manager.driver, name, value)
+
+    def update_settings(self, settings):
+        """
+        Aplica settings do UiAutomator2 e os registra para reaplicação após uma recuperação.
+        """
+        self._manager.session_settings.update(settings)
+        return self._manager.driver.update_settings(settings)
+
+    def __repr__(self):
+        return f"<DriverProxy sessão={getattr(self._manager.driver, 'session_id', None)}>"
+
+
+class SessionManager:
+    """
+    Ponto central da sessão Appium do worker.
+    - Mantém o driver atual e o DriverProxy compartilhado por todos os Page Objects.
+    - Faz uma única reinicialização coordenada quando o UiAutomator2 para de responder,
+      reaplicando o estado da sessão (settings e passos registrados).
+    - Notifica ouvintes (caches, pool de sessões) sempre que o driver muda.
+    - Conta as recuperações realizadas na execução.
+    """
+
+    def __init__(self, driver_factory=None, is_alive=None, before_restart=None):
+        """
+        :param driver_factory: Função que cria uma nova sessão (ex.: start_driver)
+        :param is_alive: Função que recebe o driver e indica se a sessão responde
+        :param before_restart: Função chamada antes de recriar a sessão (ex.: force-stop do app)
+        """
+        self.driver_factory = driver_factory
+        self.is_alive_check = is_alive
+        self.before_restart = before_restart
+        self.driver = None
+        self.proxy = DriverProxy(self)
+        self.session_settings = {}
+        self.recoveries = 0
+        self._replay_steps = []
+        self._listeners = []
+        self._lock = threading.RLock()
+        # Sessão substituta criada antecipadamente em um dispositivo reserva: (driver com falha, nova sessão)
+        self._replacement = None
+        self._replacement_lock = threading.Lock()
+
+    # ---------------------- CONFIGURAÇÃO ----------------------
+
+    def add_listener(self, listener):
+        """Registra função chamada com o novo driver sempre que a sessão muda."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def add_replay_step(self, step):
+        """Registra função chamada com o novo driver após cada recuperação de sessão."""
+        self._replay_steps.append(step)
+
+    # ---------------------- CICLO DA SESSÃO ----------------------
+
+    def attach(self, driver):
+        """
+        Define a sessão atual (ex.: nova sessão no início de um teste).
+        O estado da sessão anterior não é reaplicado.
+
+        :return: DriverProxy compartilhado
+        """
+        with self._lock:
+            self.session_settings = {}
+            self._install(driver)
+        return self.proxy
+
+    def is_alive(self):
+        """Indica se a sessão atual responde."""
+        driver = self.driver
+        return driver is not None and (self.is_alive_check is None or self.is_alive_check(driver))
+
+    def prepare_replacement(self, spare_factory):
+        """
+        Cria antecipadamente a sessão que substituirá a atual na próxima recuperação.
+        Pode ser chamado de outra thread; a sessão atual não é trocada aqui e before_restart
+        não é executado, pois o teste em andamento ainda pode estar usando o dispositivo.
+
+        :param spare_factory: Função que cria a sessão em um dispositivo reserva (outro udid e
+                              systemPort); nunca a driver_factory do dispositivo em uso
+        :return: True se uma nova sessão substituta foi criada (spare_factory pode retornar None
+                 quando o dispositivo reserva não está disponível)
+        """
+        with self._replacement_lock:
+            failed = self.driver
+            if self._replacement is not None or failed is None:
+                return False
+            driver = spare_factory()
+            if driver is None:
+                return False
+            self._replacement = (failed, driver)
+            return True
+
+    def _take_replacement(self):
+        # Aguarda uma substituta em construção e a descarta se foi criada para outra sessão
+        with self._replacement_lock:
+            replacement, self._replacement = self._replacement, None
+        if replacement is None:
+            return None
+        failed, driver = replacement
+        if failed is self.driver:
+            return driver
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return None
+
+    def recover(self):
+        """
+        Recria a sessão caso ela não responda mais. Chamadas concorrentes ou repetidas
+        resultam em uma única reinicialização: se a sessão atual já responde, nada é feito.
+        Uma sessão substituta preparada antecipadamente é usada no lugar de uma nova.
+
+        :return: DriverProxy compartilhado
+        """
+        with self._lock:
+            if self.is_alive():
+                return self.proxy
+
+            print("Reiniciando sessão Appium/Uiautomator2...")
+            driver = self._take_replacement()
+            if driver is None:
+                if self.before_restart is not None:
+                    try:
+                        self.before_restart()
+                    except Exception:
+                        pass
+                driver = self.driver_factory()
+            else:
+                run_report.incr("sessões substitutas usadas")
+
+            self._install(driver)
+            self.recoveries += 1
+            run_report.incr("recuperações de sessão")
+
+            if self.session_settings:
+                self.driver.update_settings(dict(self.session_settings))
+            for step in self._replay_steps:
+                step(self.driver)
+        return self.proxy
+
+    def _install(self, driver):
+        self.driver = driver
+        for listener in list(self._listeners):
+            listener(driver)
+
+
+# Instância única do worker (configurada pelo conftest)
+session_manager = SessionManager()
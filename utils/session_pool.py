@@ -0,0 +1,70 @@
+class SessionPool:
+    """
+    Mantém uma única sessão Appium por worker do pytest.
+    Em vez de criar um novo webdriver.Remote a cada teste, o app é finalizado,
+    seus dados são limpos e ele é reativado na mesma sessão.
+    Uma nova sessão só é criada quando o UiAutomator2 deixa de responder.
+    """
+
+    def __init__(self, driver_factory, reset_app_data, is_alive, package):
+        """
+        :param driver_factory: Função que cria uma nova sessão Appium (ex.: start_driver)
+        :param reset_app_data: Função que limpa os dados do app e concede permissões
+        :param is_alive: Função que recebe o driver e indica se a sessão responde
+        :param package: Pacote do aplicativo sob teste
+        """
+        self._driver_factory = driver_factory
+        self._reset_app_data = reset_app_data
+        self._is_alive = is_alive
+        self.package = package
+        self.driver = None
+        self.sessions_created = 0
+        self.sessions_reused = 0
+
+    def acquire(self):
+        """
+        Entrega a sessão pronta para o próximo teste, com o app em estado limpo.
+
+        :return: Instância do driver Appium
+        """
+        if self.driver is None or not self._is_alive(self.driver):
+            self._reset_app_data()
+            self.driver = self._driver_factory()
+            self.sessions_created += 1
+            return self.driver
+
+        self.driver.terminate_app(self.package)
+        self._reset_app_data()
+        self.driver.activate_app(self.package)
+        self.sessions_reused += 1
+        return self.driver
+
+    def adopt(self, driver):
+        """
+        Passa a usar a sessão informada (ex.: recriada pelo SessionManager após um crash),
+        evitando criar outra sessão no próximo acquire().
+        """
+        self.driver = driver
+
+    def release(self):
+        """
+        Finaliza o aplicativo ao término do teste, mantendo a sessão aberta.
+        """
+        if self.driver is None:
+            return
+        try:
+            self.driver.terminate_app(self.package)
+        except Exception:
+            pass
+
+    def close(self):
+        """
+        Encerra definitivamente a sessão ao final da execução do worker.
+        """
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
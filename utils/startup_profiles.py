@@ -0,0 +1,80 @@
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.reporting import run_report
+
+# Primeira sessão do dispositivo na execução: o Appium verifica/instala o servidor UiAutomator2
+COLD_CAPABILITIES = {
+    "appium:uiautomator2ServerInstallTimeout": 60000,  # Timeout para instalação do servidor UiAutomator2
+}
+
+# Sessões seguintes: servidor e configuração do dispositivo já estão prontos
+WARM_CAPABILITIES = {
+    "appium:skipServerInstallation": True,    # Não verifica/reinstala os APKs do servidor
+    "appium:skipDeviceInitialization": True,  # Não reconfigura o dispositivo (settings app, permissões)
+    "appium:disableWindowAnimation": True,    # Animações desligadas durante a sessão
+    "appium:skipLogcatCapture": True,         # Sem captura de logcat em segundo plano
+}
+
+
+class StartupProfiles:
+    """
+    Escolhe o perfil de capacidades da sessão por dispositivo.
+    A primeira sessão de cada dispositivo usa o perfil frio; depois que ela é criada com sucesso,
+    o servidor UiAutomator2 e a configuração do dispositivo estão prontos e as próximas sessões
+    usam o perfil quente. Se uma sessão quente falhar, o dispositivo volta ao perfil frio.
+    Os tempos de criação de cada perfil entram no relatório.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._warm = set()
+        self._lock = threading.Lock()
+        self.samples = {"cold": [], "warm": []}
+
+    def profile_for(self, device):
+        """
+        :return: "warm" se o dispositivo já teve uma sessão criada nesta execução, senão "cold"
+        """
+        with self._lock:
+            return "warm" if device.udid in self._warm else "cold"
+
+    @staticmethod
+    def capabilities(profile):
+        return dict(WARM_CAPABILITIES if profile == "warm" else COLD_CAPABILITIES)
+
+    def start(self, device, create):
+        """
+        Cria a sessão com o perfil adequado ao dispositivo.
+
+        :param create: Função que recebe as capacidades do perfil e cria a sessão
+        :return: Driver criado
+        """
+        profile = self.profile_for(device)
+        start = self._clock()
+        try:
+            driver = create(self.capabilities(profile))
+        except WebDriverException:
+            if profile == "cold":
+                raise
+            print(f"Sessão com perfil quente falhou em {device.udid}; repetindo com perfil frio...")
+            with self._lock:
+                self._warm.discard(device.udid)
+            profile = "cold"
+            start = self._clock()
+            driver = create(self.capabilities(profile))
+
+        self._record(profile, self._clock() - start)
+        with self._lock:
+            self._warm.add(device.udid)
+        return driver
+
+    def _record(self, profile, seconds):
+        self.samples[profile].append(seconds)
+        run_report.add_timing(f"início de sessão ({'frio' if profile == 'cold' else 'quente'})", seconds)
+
+
+# Instância única do worker
+startup_profiles = StartupProfiles()
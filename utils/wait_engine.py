@@ -0,0 +1,163 @@
+import time
+from collections import defaultdict, deque
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+
+
+class LatencyBudgets:
+    """
+    Orçamentos de espera por localizador, aprendidos com as latências observadas
+    em execuções anteriores. O orçamento é o percentil 95 das amostras multiplicado
+    por uma margem de segurança, limitado entre um mínimo e o timeout máximo.
+    """
+
+    def __init__(self, multiplier=3.0, minimum=2.0, maximum=15.0, history=20):
+        """
+        :param multiplier: Margem aplicada sobre o percentil 95 observado
+        :param minimum: Menor orçamento permitido (segundos)
+        :param maximum: Maior orçamento permitido (segundos); usado para localizadores sem histórico
+        :param history: Quantidade de amostras mantidas por localizador
+        """
+        self.multiplier = multiplier
+        self.minimum = minimum
+        self.maximum = maximum
+        self.history = history
+        self._samples = defaultdict(lambda: deque(maxlen=self.history))
+
+    def budget(self, key):
+        """
+        Tempo máximo de espera recomendado para o localizador.
+
+        :param key: Identificador do localizador (ver locator_key)
+        :return: Orçamento em segundos
+        """
+        samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return self.maximum
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return min(self.maximum, max(self.minimum, p95 * self.multiplier))
+
+    def record(self, key, seconds):
+        """Registra o tempo que o localizador levou para ser encontrado."""
+        self._samples[key].append(seconds)
+
+    def load(self, data):
+        """Carrega amostras persistidas (dicionário localizador -> lista de segundos)."""
+        for key, samples in (data or {}).items():
+            self._samples[key].extend(samples)
+
+    def dump(self):
+        """Exporta as amostras em formato serializável em JSON."""
+        return {key: list(samples) for key, samples in self._samples.items()}
+
+
+def locator_key(by, locator):
+    """Chave única de um localizador para fins de orçamento."""
+    return f"{by}={locator}"
+
+
+class WaitEngine:
+    """
+    Motor de espera com polling em backoff exponencial.
+    Substitui a espera fixa de 15s seguida de sleep(1) e nova espera de 15s:
+    a busca espera primeiro pelo orçamento aprendido do localizador e, só se necessário,
+    estende a espera até o timeout total.
+    """
+
+    def __init__(self, timeout=15, initial_poll=0.05, max_poll=1.0, backoff=1.5,
+                 budgets=None, clock=time.monotonic, sleep=time.sleep, on_retry=None):
+        """
+        :param timeout: Espera máxima total de uma busca (segundos)
+        :param initial_poll: Intervalo inicial entre tentativas
+        :param max_poll: Intervalo máximo entre tentativas
+        :param backoff: Fator de crescimento do intervalo a cada tentativa
+        :param budgets: LatencyBudgets compartilhado; por padrão, um novo com máximo igual ao timeout
+        :param on_retry: Função chamada com (by, locator) quando a busca precisa estender a espera
+        """
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.budgets = budgets or LatencyBudgets(maximum=timeout)
+        self._clock = clock
+        self._sleep = sleep
+        self.on_retry = on_retry
+
+    def until(self, condition, timeout=None, message=""):
+        """
+        Executa a condição até que retorne valor verdadeiro ou o tempo se esgote.
+        NoSuchElementException e StaleElementReferenceException são tratadas como "ainda não".
+
+        :param condition: Função sem argumentos
+        :param timeout: Espera máxima (segundos); por padrão, o timeout do motor
+        :return: Valor retornado pela condição
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = self._clock() + timeout
+        poll = self.initial_poll
+        while True:
+            try:
+                value = condition()
+                if value:
+                    return value
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                raise TimeoutException(message or f"Condição não atendida em {timeout:.1f}s")
+            self._sleep(min(poll, remaining))
+            poll = min(poll * self.backoff, self.max_poll)
+
+    def budget_for(self, by, locator):
+        """Orçamento de espera aprendido para o localizador."""
+        return self.budgets.budget(locator_key(by, locator))
+
+    def find(self, driver, by, locator, timeout=None):
+        """
+        Localiza um elemento. Sem timeout explícito, espera primeiro pelo orçamento
+        do localizador e, em caso de Timeout, estende a espera até o timeout total.
+
+        :return: WebElement localizado
+        """
+        key = locator_key(by, locator)
+        message = f"Elemento não encontrado: {by}={locator}"
+        start = self._clock()
+
+        if timeout is not None:
+            element = self.until(lambda: driver.find_element(by, locator), timeout, message)
+        else:
+            budget = self.budgets.budget(key)
+            try:
+                element = self.until(lambda: driver.find_element(by, locator), budget, message)
+            except TimeoutException:
+                if budget >= self.timeout:
+                    raise
+                if self.on_retry:
+                    self.on_retry(by, locator)
+                element = self.until(lambda: driver.find_element(by, locator), self.timeout - budget, message)
+
+        self.budgets.record(key, self._clock() - start)
+        return element
+
+    def is_absent(self, driver, by, locator):
+        """
+        Caminho rápido para verificações de ausência: uma única consulta, sem espera.
+
+        :return: True se nenhum elemento corresponder ao localizador
+        """
+        return len(driver.find_elements(by, locator)) == 0
+
+    def wait_until_absent(self, driver, by, locator, timeout=None):
+        """
+        Aguarda, com backoff, até que nenhum elemento corresponda ao localizador.
+
+        :return: True se o elemento desapareceu dentro do prazo, False caso contrário
+        """
+        try:
+            return self.until(lambda: self.is_absent(driver, by, locator), timeout)
+        except TimeoutException:
+            return False
+
+
+# Motor compartilhado por todos os Page Objects (orçamentos carregados/salvos pelo conftest)
+wait_engine = WaitEngine()